@@ -1,10 +1,16 @@
 import asyncio
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
 from cachetools import TLRUCache, TTLCache
 
+from ffbb_mcp.data_pack import DataPack
+from ffbb_mcp.deltas import SnapshotHistory
+from ffbb_mcp.reference_store import ReferenceStore
+from ffbb_mcp.search_index import OrganismeIndex, PrefixIndex
+
 
 def _read_positive_int_env(key: str, default: int) -> int:
     val_str = os.environ.get(key)
@@ -18,6 +24,10 @@ def _read_positive_int_env(key: str, default: int) -> int:
     return default
 
 
+def _env_flag(key: str, default: str = "") -> bool:
+    return os.environ.get(key, default).lower() in ("1", "true", "yes")
+
+
 @dataclass
 class _ServiceState:
     inflight_search_club: dict[str, asyncio.Task[Any]] = field(default_factory=dict)
@@ -38,6 +48,42 @@ class _ServiceState:
     cache_bilan: TLRUCache[Any, Any] | None = None
     cache_classement: TLRUCache[Any, Any] | None = None
     cache_poule: TLRUCache[Any, Any] | None = None
+    # Réponses d'outils MCP déjà mises en forme (cf. response_cache.py)
+    cache_response: TTLCache[Any, Any] | None = None
+
+    # Versions (empreintes de contenu) des payloads en cache, indexées par id()
+    # de l'objet ; l'objet est conservé pour valider l'identité.
+    content_versions: dict[int, tuple[Any, str]] = field(default_factory=dict)
+    # Derniers snapshots servis des poules/calendriers (réponses delta).
+    snapshots: SnapshotHistory = field(default_factory=SnapshotHistory)
+    # Organismes vus et résolutions de noms apprises (cf. search_index.py).
+    organisme_index: OrganismeIndex = field(default_factory=OrganismeIndex)
+    organisme_index_loaded: bool = False
+    # Instantané SQLite des données de référence (cf. reference_store.py).
+    reference_store: ReferenceStore | None = None
+    reference_store_loaded: bool = False
+    # Poules et classements de phases terminées, hors TTL (cf. services :
+    # palier figé, persisté dans la base de référence).
+    frozen: OrderedDict[str, Any] = field(default_factory=OrderedDict)
+    # Pack en lecture seule projeté en mémoire (cf. data_pack.py).
+    data_pack: DataPack | None = None
+    data_pack_loaded: bool = False
+    # Motifs invalidés depuis l'ouverture du pack → types de clés visés : les
+    # entrées correspondantes ne sont plus servies par le pack.
+    data_pack_masks: dict[str, set[str]] = field(default_factory=dict)
+    # Organismes, compétitions et salles vus, pour l'autocomplétion.
+    typeahead_index: PrefixIndex = field(default_factory=PrefixIndex)
+    # Noms d'équipes/clubs normalisés, calculés à la mise en cache des poules
+    # et organismes (cf. services._team_key), en LRU.
+    team_keys: OrderedDict[str, Any] = field(default_factory=OrderedDict)
+    # Limites en cache par requête de recherche : "op:filtre:tri" → requête →
+    # limites (réutilisation d'un résultat plus large, cf. services._search_reuse).
+    search_limits: dict[str, dict[str, set[int]]] = field(default_factory=dict)
+
+    # Introspection des caches (cf. services.get_cache_stats) : hits par clé et
+    # date d'insertion, indexés par id() du cache (non hashable).
+    cache_key_hits: dict[int, dict[Any, int]] = field(default_factory=dict)
+    cache_inserted_at: dict[int, dict[Any, float]] = field(default_factory=dict)
 
 
 state = _ServiceState()
@@ -54,6 +100,25 @@ def reset_service_state() -> None:
     state.inflight_poule.clear()
     state.inflight_detail.clear()
     state.inflight_search.clear()
+    state.cache_key_hits.clear()
+    state.cache_inserted_at.clear()
+    state.content_versions.clear()
+    state.snapshots.clear()
+    state.organisme_index.clear()
+    state.organisme_index_loaded = False
+    if state.reference_store is not None:
+        state.reference_store.close()
+    state.reference_store = None
+    state.reference_store_loaded = False
+    if state.data_pack is not None:
+        state.data_pack.close()
+    state.data_pack = None
+    state.data_pack_loaded = False
+    state.data_pack_masks.clear()
+    state.frozen.clear()
+    state.typeahead_index.clear()
+    state.team_keys.clear()
+    state.search_limits.clear()
     if state.cache_lives is not None:
         state.cache_lives.clear()
     if state.cache_search is not None:
@@ -68,3 +133,5 @@ def reset_service_state() -> None:
         state.cache_classement.clear()
     if state.cache_poule is not None:
         state.cache_poule.clear()
+    if state.cache_response is not None:
+        state.cache_response.clear()
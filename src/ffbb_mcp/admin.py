@@ -0,0 +1,100 @@
+"""Surface d'administration des caches (route HTTP + outil MCP).
+
+Désactivée tant que ``FFBB_ADMIN_TOKEN`` n'est pas défini. La route
+``/admin/cache`` exige ``Authorization: Bearer <token>`` ; l'outil
+``ffbb_cache_admin`` n'est enregistré que si le token est défini et le
+redemande en argument (le serveur public est accessible à tout client MCP).
+"""
+
+import hmac
+import os
+from typing import Annotated, Any, Literal
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from .services import get_cache_stats_async, handle_api_error, invalidate_cache
+
+_ADMIN_ANNOTATIONS = ToolAnnotations(
+    readOnlyHint=False,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=False,
+)
+
+
+def _admin_token() -> str | None:
+    return os.environ.get("FFBB_ADMIN_TOKEN") or None
+
+
+def _check_token(candidate: str | None) -> bool:
+    expected = _admin_token()
+    if not expected or not candidate:
+        return False
+    return hmac.compare_digest(candidate.encode(), expected.encode())
+
+
+def register_admin(mcp: Any) -> None:
+    """Enregistre la route /admin/cache et, si configuré, l'outil admin."""
+
+    @mcp.custom_route("/admin/cache", methods=["GET", "POST", "DELETE"])  # type: ignore[untyped-decorator]
+    async def admin_cache(request: Request) -> Response:
+        """GET : stats des caches. POST/DELETE ?pattern=...&cache=... : invalidation."""
+        if _admin_token() is None:
+            return JSONResponse({"error": "admin désactivé"}, status_code=404)
+        auth = request.headers.get("Authorization", "")
+        if not _check_token(auth.removeprefix("Bearer ").strip()):
+            return JSONResponse({"error": "unauthorized"}, status_code=401)
+
+        if request.method == "GET":
+            top = request.query_params.get("top", "10")
+            return JSONResponse(
+                await get_cache_stats_async(top=int(top) if top.isdigit() else 10)
+            )
+
+        pattern = request.query_params.get("pattern", "")
+        try:
+            removed = invalidate_cache(pattern, request.query_params.get("cache"))
+        except Exception as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        return JSONResponse({"pattern": pattern, "removed": removed})
+
+    if _admin_token() is None:
+        return
+
+    @mcp.tool(
+        name="ffbb_cache_admin",
+        title="Administration des caches",
+        annotations=_ADMIN_ANNOTATIONS,
+    )
+    async def ffbb_cache_admin(
+        admin_token: Annotated[str, Field(description="Token FFBB_ADMIN_TOKEN.")],
+        action: Annotated[
+            Literal["stats", "invalidate"],
+            Field(description="stats | invalidate"),
+        ] = "stats",
+        pattern: Annotated[
+            str | None,
+            Field(description="invalidate : préfixe ('poule:123') ou glob ('*')."),
+        ] = None,
+        cache: Annotated[
+            str | None, Field(description="Restreindre à un cache (ex: 'poule').")
+        ] = None,
+        top: Annotated[
+            int, Field(ge=1, description="stats : nombre de clés les plus lues.")
+        ] = 10,
+    ) -> dict[str, Any]:
+        """Stats des caches (taille, octets, âge, top clés) ou invalidation ciblée."""
+        if not _check_token(admin_token):
+            return {"error": "unauthorized"}
+        try:
+            if action == "invalidate":
+                return {
+                    "pattern": pattern,
+                    "removed": invalidate_cache(pattern or "", cache),
+                }
+            return await get_cache_stats_async(top=top)
+        except Exception as e:
+            raise handle_api_error(e) from e
@@ -6,13 +6,36 @@ Ce module fournit :
 - normalize_query() : résolution d'alias dans les recherches
 - resolve_acronym() : résolution spécifique d'acronymes (< 7 chars, tout en majuscules)
 - enrich_acronym_cache() : enrichissement automatique après chaque recherche réussie
+- suggest_clubs() : suggestions approchées (trigrammes + distance d'édition)
+- flush_acronym_cache() : écriture différée des nouveaux acronymes
+
+Les acronymes appris sont écrits en différé (write-behind) : ils sont
+ajoutés en mémoire et regroupés, puis un thread les fusionne avec le fichier
+toutes les ``FFBB_ACRONYM_FLUSH_INTERVAL`` secondes (30 par défaut) et à
+l'arrêt du serveur. La fusion relit le fichier sous verrou (``fcntl.flock``)
+et le remplace atomiquement : plusieurs processus peuvent partager le même
+fichier sans perdre leurs entrées. Aucune recherche de club ne fait d'E/S
+disque sur la boucle d'événements.
+
+Les recherches sont indexées pour rester en O(1)/O(k) quand le cache
+d'acronymes grossit à plusieurs milliers d'entrées : dictionnaire d'acronymes
+en majuscules, une regex combinée qui écarte d'une seule passe les requêtes
+sans alias, index de trigrammes pour les suggestions.
 """
 
 import json
 import logging
+import os
 import re
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
+
+from ffbb_mcp.search_index import TrigramIndex, fold, write_atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou inter-processus
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger("ffbb-mcp")
 
@@ -52,11 +75,25 @@ _APOSTROPHE_PATTERN = re.compile("[\u2018\u2019\u201b\u0060]")
 _SPACE_PATTERN = re.compile(r"\s+")
 _ARTICLE_PATTERN = re.compile(r"^[dlDL]'")
 
-_COMPILED_ALIASES = [
-    (re.compile(r"\b" + re.escape(alias) + r"\b"), official)
+# Alias appliqués dans l'ordre du dictionnaire, chacun sur le résultat du
+# précédent ("ldlc asvel" devient "ldlc lyon villeurbanne" : "asvel" passe
+# avant). Les alias déjà contenus dans leur nom officiel sont exclus (pas de
+# double remplacement).
+_ALIAS_REPLACEMENTS = [
+    (alias, official)
     for alias, official in CLUB_ALIASES.items()
     if not re.search(r"\b" + re.escape(alias) + r"\b", official)
 ]
+_COMPILED_ALIASES = [
+    (re.compile(r"\b" + re.escape(alias) + r"\b"), official)
+    for alias, official in _ALIAS_REPLACEMENTS
+]
+# Tous les alias en une alternative : une requête où aucun ne figure (le cas
+# courant) ne parcourt pas la boucle. Un remplacement exige qu'un alias figure
+# déjà dans la requête, le filtre ne change donc pas le résultat.
+_ALIAS_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(a) for a, _ in _ALIAS_REPLACEMENTS) + r")\b"
+)
 
 # ---------------------------------------------------------------------------
 # Cache persistant d'acronymes (acronyms_cache.json)
@@ -77,6 +114,39 @@ _CACHE_DIR = Path(__file__).resolve().parent
 _CACHE_FILE = _CACHE_DIR / "acronyms_cache.json"
 _cache_lock = Lock()
 _acronyms_cache: dict[str, str] | None = None
+# Entrées pas encore écrites sur disque, et écriture différée programmée.
+_pending: dict[str, str] = {}
+_flush_timer: Timer | None = None
+
+
+def _flush_interval() -> float:
+    try:
+        value = float(os.environ.get("FFBB_ACRONYM_FLUSH_INTERVAL", "30"))
+    except ValueError:
+        return 30.0
+    return value if value > 0 else 30.0
+
+
+# Index du cache : acronyme en majuscules → nom, et trigrammes des noms connus.
+_acronyms_upper: dict[str, str] = {}
+_names_index = TrigramIndex()
+
+
+def _index_acronym(key: str, value: str) -> None:
+    _acronyms_upper.setdefault(key.upper(), value)
+    _names_index.add(value, value)
+
+
+def _set_acronyms_cache(data: dict[str, str]) -> dict[str, str]:
+    global _acronyms_cache, _names_index
+    _acronyms_upper.clear()
+    _names_index = TrigramIndex()
+    for official in CLUB_ALIASES.values():
+        _names_index.add(official, official)
+    for key, value in data.items():
+        _index_acronym(key, value)
+    _acronyms_cache = data
+    return data
 
 
 def _load_acronyms_cache() -> dict[str, str]:
@@ -97,39 +167,118 @@ def _load_acronyms_cache() -> dict[str, str]:
             try:
                 data = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
                 if isinstance(data, dict):
-                    _acronyms_cache = data
                     logger.info(
                         "Cache d'acronymes chargé: %d entrées depuis %s",
                         len(data),
                         _CACHE_FILE,
                     )
-                    return _acronyms_cache
+                    return _set_acronyms_cache(data)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Erreur lecture %s: %s — réinitialisation", _CACHE_FILE, e
                 )
 
         # Initialisation avec les valeurs par défaut
-        _acronyms_cache = dict(_DEFAULT_ACRONYMS)
-        _save_acronyms_cache()
+        cache = _set_acronyms_cache(dict(_DEFAULT_ACRONYMS))
+        _pending.update(cache)
+        _schedule_flush()
         logger.info(
             "Cache d'acronymes initialisé avec %d entrées par défaut",
-            len(_acronyms_cache),
+            len(cache),
         )
-        return _acronyms_cache
+        return cache
 
 
-def _save_acronyms_cache() -> None:
-    """Sauvegarde le cache d'acronymes dans le fichier JSON."""
-    if _acronyms_cache is None:
+def _schedule_flush() -> None:
+    """Programme une écriture différée (appelé sous ``_cache_lock``)."""
+    global _flush_timer
+    if _flush_timer is not None:
         return
+    _flush_timer = Timer(_flush_interval(), flush_acronym_cache)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _read_cache_file() -> dict[str, str]:
+    """Contenu du fichier (appelé sous verrou, avant de le réécrire).
+
+    Un fichier illisible lève ``OSError`` : la fusion est abandonnée plutôt
+    que d'écraser ses acronymes. Un fichier corrompu est mis de côté
+    (``.corrupt``) avant d'être remplacé.
+    """
+    try:
+        text = _CACHE_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        reason = str(e)
+    else:
+        if isinstance(data, dict):
+            return data
+        reason = "objet JSON attendu"
+    backup = _CACHE_FILE.with_suffix(_CACHE_FILE.suffix + ".corrupt")
+    os.replace(_CACHE_FILE, backup)
+    logger.warning(
+        "Cache d'acronymes %s corrompu (%s) : copie conservée dans %s",
+        _CACHE_FILE,
+        reason,
+        backup,
+    )
+    return {}
+
+
+def flush_acronym_cache() -> int:
+    """Fusionne les acronymes en attente avec le fichier ; renvoie le nombre écrit.
+
+    Bloquant : appelé depuis le thread d'écriture différée ou à l'arrêt. Les
+    entrées déjà présentes sur disque (écrites par un autre processus) sont
+    conservées et reprises en mémoire.
+    """
+    global _flush_timer
+    with _cache_lock:
+        _flush_timer = None
+        pending = dict(_pending)
+        _pending.clear()
+    if not pending:
+        return 0
+
+    lock_file = None
     try:
-        _CACHE_FILE.write_text(
-            json.dumps(_acronyms_cache, ensure_ascii=False, indent=2) + "\n",
-            encoding="utf-8",
+        if fcntl is not None:
+            lock_file = open(  # noqa: SIM115
+                _CACHE_FILE.with_suffix(_CACHE_FILE.suffix + ".lock"), "a"
+            )
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        on_disk = _read_cache_file()
+        known = {k.upper() for k in on_disk}
+        merged = dict(on_disk)
+        for key, value in pending.items():
+            if key.upper() not in known:
+                merged[key] = value
+                known.add(key.upper())
+        write_atomic(
+            _CACHE_FILE, json.dumps(merged, ensure_ascii=False, indent=2) + "\n"
         )
     except OSError as e:
         logger.warning("Erreur sauvegarde %s: %s", _CACHE_FILE, e)
+        with _cache_lock:
+            for key, value in pending.items():
+                _pending.setdefault(key, value)
+        return 0
+    finally:
+        if lock_file is not None:
+            lock_file.close()
+
+    with _cache_lock:
+        if _acronyms_cache is not None:
+            for key, value in on_disk.items():
+                if key.upper() not in _acronyms_upper:
+                    _acronyms_cache[key] = value
+                    _index_acronym(key, value)
+    logger.debug("Cache d'acronymes écrit: %d nouvelles entrées", len(pending))
+    return len(pending)
 
 
 def _extract_initials(name: str) -> str:
@@ -177,15 +326,12 @@ def resolve_acronym(query: str) -> str:
     if not stripped.isalpha() or not stripped.isupper():
         return query
 
-    cache = _load_acronyms_cache()
-
-    # Recherche case-insensitive dans le cache
-    for key, value in cache.items():
-        if key.upper() == stripped.upper():
-            logger.info("Acronyme résolu: %s → %s", stripped, value)
-            return value
-
-    return query
+    _load_acronyms_cache()
+    value = _acronyms_upper.get(stripped)
+    if value is None:
+        return query
+    logger.info("Acronyme résolu: %s → %s", stripped, value)
+    return value
 
 
 def enrich_acronym_cache(official_name: str) -> None:
@@ -193,7 +339,8 @@ def enrich_acronym_cache(official_name: str) -> None:
 
     Extrait les initiales du nom officiel retourné par la FFBB.
     Si ces initiales ne sont pas déjà dans le cache, les ajoute
-    avec le nom complet comme valeur et sauvegarde immédiatement.
+    avec le nom complet comme valeur ; l'écriture disque est différée
+    (cf. ``flush_acronym_cache``).
     """
     if not official_name or len(official_name) < 3:
         return
@@ -205,13 +352,14 @@ def enrich_acronym_cache(official_name: str) -> None:
     cache = _load_acronyms_cache()
 
     # Vérifier si l'acronyme existe déjà (case-insensitive)
-    existing_keys_upper = {k.upper() for k in cache}
-    if initials.upper() in existing_keys_upper:
+    if initials.upper() in _acronyms_upper:
         return
 
     with _cache_lock:
         cache[initials] = official_name
-        _save_acronyms_cache()
+        _index_acronym(initials, official_name)
+        _pending[initials] = official_name
+        _schedule_flush()
         logger.info("Acronyme auto-enrichi: %s → %s", initials, official_name)
 
 
@@ -250,9 +398,57 @@ def normalize_query(query: str) -> str:
         return CLUB_ALIASES[normalized]
 
     # Replace whole words
-    for alias_pattern, official in _COMPILED_ALIASES:
-        normalized = alias_pattern.sub(official, normalized)
+    if _ALIAS_PATTERN.search(normalized):
+        for alias_pattern, official in _COMPILED_ALIASES:
+            normalized = alias_pattern.sub(official, normalized)
 
     # Remove excessive spaces
     normalized = _SPACE_PATTERN.sub(" ", normalized)
     return normalized
+
+
+def _edit_distance(a: str, b: str, max_dist: int) -> int:
+    """Distance de Levenshtein bornée (``max_dist + 1`` au-delà de la borne).
+
+    Seule la bande diagonale ``|i - j| <= max_dist`` est calculée.
+    """
+    if abs(len(a) - len(b)) > max_dist:
+        return max_dist + 1
+    over = max_dist + 1
+    previous = [j if j <= max_dist else over for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        lo, hi = max(1, i - max_dist), min(len(b), i + max_dist)
+        current = [over] * (len(b) + 1)
+        if i <= max_dist:
+            current[0] = i
+        for j in range(lo, hi + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != b[j - 1]),
+            )
+        if min(current[lo - 1 : hi + 1]) > max_dist:
+            return over
+        previous = current
+    return min(previous[-1], over)
+
+
+def suggest_clubs(query: str, limit: int = 3) -> list[str]:
+    """Noms de clubs connus proches de ``query`` (fautes de frappe, accents).
+
+    Les candidats viennent de l'index de trigrammes ; ils sont reclassés par
+    distance d'édition entre la requête et le début du nom de même longueur.
+    """
+    folded = fold(_normalize_apostrophes(query or ""))
+    if len(folded) < 3:
+        return []
+    _load_acronyms_cache()
+    candidates = _names_index.search(folded, limit=limit * 2, min_similarity=0.2)
+    max_dist = min(3, max(1, len(folded) // 4))
+    ranked = []
+    for name, similarity in candidates:
+        dist = _edit_distance(folded, fold(str(name))[: len(folded)], max_dist)
+        if dist <= max_dist or similarity >= 0.5:
+            ranked.append((dist, -similarity, str(name)))
+    ranked.sort()
+    return [name for _, _, name in ranked[:limit]]
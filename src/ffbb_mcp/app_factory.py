@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 from collections.abc import AsyncGenerator
@@ -11,14 +12,43 @@ from starlette.responses import JSONResponse
 from starlette.routing import Mount
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from ffbb_mcp.aliases import flush_acronym_cache
+from ffbb_mcp.loop_monitor import LoopMonitor
+from ffbb_mcp.reference_store import refresher
+from ffbb_mcp.services import (
+    close_data_pack,
+    close_reference_store,
+    load_organisme_index,
+    open_data_pack,
+    open_reference_store_async,
+    save_organisme_index,
+)
+
 logger = logging.getLogger("ffbb-mcp")
 
 
 def create_app(mcp: FastMCP, allowed_origins: list[str]) -> Starlette:
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncGenerator[None, None]:
-        async with mcp.session_manager.run():
-            yield
+        monitor = LoopMonitor.from_env()
+        if monitor is not None:
+            monitor.start()
+        pack = open_data_pack()
+        if pack is not None:
+            logger.info("Pack de données projeté : %s", pack)
+        await asyncio.to_thread(load_organisme_index)
+        await open_reference_store_async()
+        try:
+            async with mcp.session_manager.run():
+                yield
+        finally:
+            if monitor is not None:
+                await monitor.stop()
+            await refresher.stop()
+            close_reference_store()
+            close_data_pack()
+            await asyncio.to_thread(save_organisme_index)
+            await asyncio.to_thread(flush_acronym_cache)
 
     mcp_app = mcp.streamable_http_app()
 
@@ -70,4 +70,5 @@ def get_static_ttl(cache_name: str) -> int:
         "classement": 1_800 if is_in_match_window() else 86_400,
         "calendrier": 300,
         "poule": 15,
+        "response": 60,
     }.get(cache_name, 3_600)  # fallback 1h
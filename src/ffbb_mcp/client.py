@@ -3,10 +3,14 @@ import logging
 import os
 import time
 import traceback
+from typing import Any, ClassVar
 
+import httpx
 from ffbb_api_client_v3 import FFBBAPIClientV3, TokenManager
 from ffbb_api_client_v3.utils.cache_manager import CacheConfig, CacheManager
 
+from ffbb_mcp.utils import loads_json
+
 """
 Client FFBB avec gestion automatique du cycle de vie des tokens.
 
@@ -28,6 +32,9 @@ _TOKEN_TTL_SECONDS: int = 25 * 60
 _CACHE_TTL_SECONDS: int = (
     30  # 30 secondes — aligné sur le TTL le plus court du service layer
 )
+# API REST FFBB (Directus) interrogée en mode JSON brut (FFBB_RAW_JSON=1).
+_API_BASE_URL: str = os.environ.get("FFBB_API_BASE_URL", "https://api.ffbb.app/")
+_RAW_TIMEOUT_SECONDS: float = 20.0
 
 
 class FFBBClientFactory:
@@ -35,10 +42,15 @@ class FFBBClientFactory:
 
     _instance: FFBBAPIClientV3 | None = None
     _token_created_at: float = 0.0
+    # Token API conservé pour le mode JSON brut (même cycle de vie que le client)
+    _api_token: str | None = None
+    _raw_session: httpx.AsyncClient | None = None
     # FIX: Lock initialisé à None et créé lazily au premier appel async
     # pour éviter les DeprecationWarning sur Python < 3.10 (Lock lié
     # à la running loop, pas à la loop au moment de la définition de classe).
     _init_lock: asyncio.Lock | None = None
+    # Fermetures de sessions brutes en cours (références fortes jusqu'au bout).
+    _closing: ClassVar[set[asyncio.Task[None]]] = set()
 
     @classmethod
     def _is_token_expired(cls) -> bool:
@@ -67,6 +79,7 @@ class FFBBClientFactory:
         )
         cache_manager = CacheManager(config=cache_config)
 
+        cls._api_token = tokens.api_token
         client = FFBBAPIClientV3.create(
             api_bearer_token=tokens.api_token,
             meilisearch_bearer_token=tokens.meilisearch_token,
@@ -104,14 +117,59 @@ class FFBBClientFactory:
                     raise
             return cls._instance  # type: ignore
 
+    @classmethod
+    async def get_raw_json_async(
+        cls, path: str, params: dict[str, Any] | None = None
+    ) -> Any:
+        """GET authentifié sur l'API FFBB, décodé directement en dict/list.
+
+        Court-circuite la construction des modèles Pydantic du client : la
+        réponse JSON est décodée (orjson si disponible) sans passer par
+        modèle -> dict. Le token est celui du client courant (rafraîchi au
+        même rythme).
+        """
+        await cls.get_client_async()
+        if cls._raw_session is None:
+            cls._raw_session = httpx.AsyncClient(
+                base_url=_API_BASE_URL, timeout=_RAW_TIMEOUT_SECONDS
+            )
+        resp = await cls._raw_session.get(
+            path,
+            params=params,
+            headers={"Authorization": f"Bearer {cls._api_token}"},
+        )
+        resp.raise_for_status()
+        return loads_json(resp.content)
+
     @classmethod
     def reset(cls) -> None:
-        """Force la réinitialisation du client (utile pour les tests)."""
+        """Force la réinitialisation du client (utile pour les tests).
+
+        La session HTTP du mode brut est fermée (``aclose``) : en tâche sur la
+        boucle courante s'il y en a une, sinon dans une boucle dédiée.
+        """
+        session, cls._raw_session = cls._raw_session, None
         cls._instance = None
         cls._token_created_at = 0.0
         cls._init_lock = None
+        cls._api_token = None
+        if session is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(session.aclose())
+            return
+        task = loop.create_task(session.aclose())
+        cls._closing.add(task)
+        task.add_done_callback(cls._closing.discard)
 
 
 async def get_client_async() -> FFBBAPIClientV3:
     """Helper shortcut for FFBBClientFactory.get_client_async()."""
     return await FFBBClientFactory.get_client_async()
+
+
+async def get_raw_json_async(path: str, params: dict[str, Any] | None = None) -> Any:
+    """Helper shortcut for FFBBClientFactory.get_raw_json_async()."""
+    return await FFBBClientFactory.get_raw_json_async(path, params)
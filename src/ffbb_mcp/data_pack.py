@@ -0,0 +1,156 @@
+"""Pack de données en lecture seule, projeté en mémoire (``mmap``) au démarrage.
+
+Un nouveau conteneur démarre caches vides et sollicite la FFBB pendant de
+longues minutes. Le pack, généré au build ou par cron
+(``tools/build_data_pack.py``), contient les organismes (avec leurs
+engagements), les compétitions et les poules de phases terminées. Chaque
+worker le projette en lecture seule : les pages sont celles du cache disque du
+noyau, partagées entre processus, et seules les entrées lues sont chargées.
+
+Format (petit-boutiste) :
+
+- en-tête ``<8sdQQ`` : signature, date de construction, nombre d'entrées,
+  position de l'index ;
+- blocs de JSON compact compressé zlib, un par entité ;
+- index trié ``<BQQI`` (type, id, position, longueur), recherche par
+  dichotomie directement dans la projection, sans le charger.
+
+Les poules de phases terminées ne changent plus ; organismes et compétitions
+ne sont servis que tant que le pack a moins de ``FFBB_DATA_PACK_MAX_AGE``
+secondes (7 jours). Activation : ``FFBB_DATA_PACK`` (chemin du fichier).
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterable  # noqa: TC003
+from pathlib import Path
+from typing import Any
+
+_MAGIC = b"FFBBPK01"
+_HEADER = struct.Struct("<8sdQQ")
+_ENTRY = struct.Struct("<BQQI")
+KINDS = {"organisme": 1, "competition": 2, "poule": 3}
+# Types immuables une fois publiés : servis quel que soit l'âge du pack.
+_FROZEN_KINDS = frozenset({"poule"})
+_DEFAULT_MAX_AGE = 7 * 86400
+
+
+class _IndexView:
+    """Séquence ``(type, id)`` lue dans l'index projeté (pour ``bisect``)."""
+
+    def __init__(self, buf: mmap.mmap, offset: int, count: int) -> None:
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> tuple[int, int]:
+        kind, item_id, _, _ = _ENTRY.unpack_from(
+            self._buf, self._offset + i * _ENTRY.size
+        )
+        return kind, item_id
+
+    def entry(self, i: int) -> tuple[int, int, int, int]:
+        return _ENTRY.unpack_from(self._buf, self._offset + i * _ENTRY.size)
+
+
+class DataPack:
+    """Pack ouvert en lecture seule ; ``get`` décode une entrée à la demande."""
+
+    def __init__(self, path: str | Path, *, max_age: float = _DEFAULT_MAX_AGE) -> None:
+        self.path = str(path)
+        self.max_age = max_age
+        with open(self.path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._buf)
+        if size < _HEADER.size:
+            self._buf.close()
+            raise ValueError(f"{self.path} tronqué ({size} octets)")
+        magic, self.built_at, count, index_offset = _HEADER.unpack_from(self._buf)
+        if magic != _MAGIC:
+            self._buf.close()
+            raise ValueError(f"{self.path} n'est pas un pack FFBB")
+        # L'index est en fin de fichier : un pack tronqué ne le contient plus.
+        if index_offset + count * _ENTRY.size > size:
+            self._buf.close()
+            raise ValueError(f"{self.path} tronqué (index incomplet)")
+        self._index = _IndexView(self._buf, index_offset, count)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        self._buf.close()
+
+    def fresh(self, kind: str) -> bool:
+        """True si les entrées de ``kind`` peuvent encore être servies."""
+        return kind in _FROZEN_KINDS or time.time() - self.built_at < self.max_age
+
+    def get(self, kind: str, item_id: int) -> Any | None:
+        code = KINDS[kind]
+        i = bisect.bisect_left(self._index, (code, item_id))
+        if i == len(self._index) or self._index[i] != (code, item_id):
+            return None
+        _, _, offset, length = self._index.entry(i)
+        return json.loads(zlib.decompress(self._buf[offset : offset + length]))
+
+    def stats(self) -> dict[str, Any]:
+        counts = dict.fromkeys(KINDS, 0)
+        names = {code: kind for kind, code in KINDS.items()}
+        for i in range(len(self._index)):
+            counts[names[self._index[i][0]]] += 1
+        return {
+            "path": self.path,
+            "entities": counts,
+            "age_seconds": round(time.time() - self.built_at, 1),
+        }
+
+
+def write_pack(
+    path: str | Path,
+    entries: Iterable[tuple[str, int, Any]],
+    *,
+    built_at: float | None = None,
+) -> int:
+    """Écrit un pack (fichier temporaire puis ``os.replace``) ; renvoie sa taille.
+
+    Le remplacement atomique laisse les workers déjà lancés sur l'ancien
+    fichier, toujours projeté ; les suivants ouvrent le nouveau.
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    index: dict[tuple[int, int], tuple[int, int]] = {}
+    with open(tmp, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        offset = _HEADER.size
+        for kind, item_id, data in entries:
+            blob = zlib.compress(
+                json.dumps(
+                    data, ensure_ascii=False, separators=(",", ":"), default=str
+                ).encode("utf-8")
+            )
+            f.write(blob)
+            index[(KINDS[kind], int(item_id))] = (offset, len(blob))
+            offset += len(blob)
+        for (code, item_id), (start, length) in sorted(index.items()):
+            f.write(_ENTRY.pack(code, item_id, start, length))
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                time.time() if built_at is None else built_at,
+                len(index),
+                offset,
+            )
+        )
+    os.replace(tmp, path)
+    return offset + len(index) * _ENTRY.size
@@ -0,0 +1,128 @@
+"""Réponses différentielles pour les poules et calendriers interrogés en boucle.
+
+Un tableau de bord qui relit ``ffbb_get(type="poule")`` ou
+``ffbb_club(action="calendrier")`` toutes les minutes reçoit jusqu'à 300
+rencontres à chaque appel alors que seuls quelques scores bougent. Avec
+``delta=True`` et la ``_version`` de sa dernière réponse, il ne reçoit plus
+que les lignes (rencontres, lignes de classement) ajoutées ou modifiées et
+les identifiants des lignes disparues.
+
+Le serveur garde pour chaque ressource les derniers snapshots servis (lignes
+indexées par identifiant, cf. ``SnapshotHistory``) : le delta est un simple
+parcours des deux index, sans relecture de l'API. Si la version de base n'est
+plus dans l'historique (redémarrage, éviction), la réponse complète est
+renvoyée et porte la nouvelle ``_version``.
+
+Profondeur de l'historique : ``FFBB_DELTA_HISTORY`` (4 versions par ressource).
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+# Lignes indexées par identifiant, par section ("rencontres", "classements").
+Snapshot = dict[str, dict[Any, dict[str, Any]]]
+RowKey = Callable[[dict[str, Any]], Any]
+
+_MAX_RESOURCES = 64
+
+
+def _read_history_depth() -> int:
+    try:
+        depth = int(os.environ.get("FFBB_DELTA_HISTORY", "4"))
+    except ValueError:
+        return 4
+    return depth if depth > 0 else 4
+
+
+def rencontre_key(row: dict[str, Any]) -> Any:
+    """Identifiant d'une rencontre (poule ou calendrier club)."""
+    return row.get("id")
+
+
+def classement_key(row: dict[str, Any]) -> Any:
+    """Identifiant d'une ligne de classement : l'engagement de l'équipe."""
+    eng = row.get("id_engagement")
+    if isinstance(eng, dict) and eng.get("id") is not None:
+        return eng["id"]
+    return row.get("organisme_id")
+
+
+def index_rows(rows: Iterable[Any], key: RowKey) -> dict[Any, dict[str, Any]]:
+    """Indexe les lignes par identifiant (lignes sans identifiant ignorées)."""
+    index: dict[Any, dict[str, Any]] = {}
+    for row in rows:
+        if isinstance(row, dict):
+            k = key(row)
+            if k is not None:
+                index[k] = row
+    return index
+
+
+def diff_rows(
+    old: Mapping[Any, dict[str, Any]], new: Mapping[Any, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[Any]]:
+    """Lignes ajoutées ou modifiées, puis identifiants des lignes disparues."""
+    changed = []
+    for k, row in new.items():
+        before = old.get(k)
+        if before is not row and before != row:
+            changed.append(row)
+    removed = [k for k in old if k not in new]
+    return changed, removed
+
+
+class SnapshotHistory:
+    """Derniers snapshots servis, par ressource (LRU sur les ressources)."""
+
+    def __init__(self, depth: int | None = None, max_resources: int = _MAX_RESOURCES):
+        self.depth = depth or _read_history_depth()
+        self.max_resources = max_resources
+        self._entries: OrderedDict[str, deque[tuple[str, Snapshot]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def record(
+        self, resource: str, version: str, build: Callable[[], Snapshot]
+    ) -> None:
+        """Mémorise le snapshot de ``version`` ; ``build`` n'est appelé qu'une fois."""
+        versions = self._entries.get(resource)
+        if versions is None:
+            versions = deque(maxlen=self.depth)
+            self._entries[resource] = versions
+            while len(self._entries) > self.max_resources:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(resource)
+        if any(v == version for v, _ in versions):
+            return
+        versions.append((version, build()))
+
+    def get(self, resource: str, version: str) -> Snapshot | None:
+        for v, snapshot in self._entries.get(resource, ()):
+            if v == version:
+                return snapshot
+        return None
+
+    def delta(
+        self, resource: str, since_version: str, version: str
+    ) -> dict[str, list[Any]] | None:
+        """Delta entre deux versions connues, ou None si l'une manque."""
+        base = self.get(resource, since_version)
+        current = self.get(resource, version)
+        if base is None or current is None:
+            return None
+        out: dict[str, list[Any]] = {}
+        for section, rows in current.items():
+            changed, removed = diff_rows(base.get(section, {}), rows)
+            out[section] = changed
+            if removed:
+                out[f"{section}_removed"] = removed
+        return out
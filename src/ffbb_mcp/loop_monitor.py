@@ -0,0 +1,135 @@
+"""Surveillance du lag de la boucle asyncio et détection des appels bloquants.
+
+Deux mécanismes complémentaires :
+
+- un échantillonneur (tâche asyncio) qui mesure le retard de réveil de la
+  boucle toutes les ``FFBB_LOOP_LAG_INTERVAL_MS`` ms et l'exporte dans les
+  métriques (``ffbb_event_loop_lag_seconds``) ;
+- en mode debug (``FFBB_LOOP_BLOCK_DEBUG=1``), un thread chien de garde qui,
+  si la boucle ne répond plus depuis plus de ``FFBB_LOOP_BLOCK_THRESHOLD_MS``
+  ms, capture la pile du thread de la boucle (``sys._current_frames``) et la
+  journalise : le code bloquant est alors pris en flagrant délit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from ffbb_mcp._state import _env_flag, _read_positive_int_env
+from ffbb_mcp.metrics import record_loop_block, record_loop_lag
+
+logger = logging.getLogger("ffbb-mcp")
+
+
+class LoopMonitor:
+    """Échantillonne le lag de la boucle courante et détecte les blocages."""
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.5,
+        block_threshold: float = 0.1,
+        debug: bool = False,
+    ) -> None:
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.debug = debug
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop_thread_id: int | None = None
+        # Dernier battement de la boucle (time.monotonic), lu par le watchdog.
+        self._heartbeat = time.monotonic()
+
+    @classmethod
+    def from_env(cls) -> LoopMonitor | None:
+        """Construit le moniteur depuis l'environnement (None si désactivé)."""
+        if os.environ.get("FFBB_LOOP_MONITOR", "1").lower() in ("0", "false", "no"):
+            return None
+        return cls(
+            interval=_read_positive_int_env("FFBB_LOOP_LAG_INTERVAL_MS", 500) / 1000,
+            block_threshold=_read_positive_int_env("FFBB_LOOP_BLOCK_THRESHOLD_MS", 100)
+            / 1000,
+            debug=_env_flag("FFBB_LOOP_BLOCK_DEBUG"),
+        )
+
+    # -- Cycle de vie --------------------------------------------------------
+
+    def start(self) -> None:
+        """Démarre l'échantillonneur (et le watchdog en debug) sur la boucle courante."""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        if self.debug:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="ffbb-loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    # -- Échantillonneur -----------------------------------------------------
+
+    async def _sample(self) -> None:
+        # En debug, battre plus vite que le seuil pour que le watchdog ne
+        # confonde pas l'attente de l'échantillonneur avec un blocage.
+        period = self.interval
+        if self.debug:
+            period = min(period, self.block_threshold / 2)
+        while True:
+            t0 = time.monotonic()
+            self._heartbeat = t0
+            await asyncio.sleep(period)
+            lag = max(0.0, time.monotonic() - t0 - period)
+            record_loop_lag(lag)
+            if lag >= self.block_threshold:
+                record_loop_block()
+                if not self.debug:
+                    logger.debug(
+                        "Boucle asyncio bloquée %.0f ms (FFBB_LOOP_BLOCK_DEBUG=1 "
+                        "pour la pile)",
+                        lag * 1000,
+                    )
+
+    # -- Watchdog (debug) ----------------------------------------------------
+
+    def _watch(self) -> None:
+        reported_beat: float | None = None
+        poll = self.block_threshold / 4
+        while not self._stop.wait(poll):
+            beat = self._heartbeat
+            # Marge d'une demi-période : le battement n'est rafraîchi qu'au
+            # réveil de l'échantillonneur.
+            stalled = time.monotonic() - beat - self.block_threshold / 2
+            if stalled < self.block_threshold or beat == reported_beat:
+                continue
+            reported_beat = beat  # une seule pile par épisode de blocage
+            frame = sys._current_frames().get(self._loop_thread_id or -1)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(
+                "Boucle asyncio bloquée depuis %.0f ms — pile du thread de la "
+                "boucle :\n%s",
+                stalled * 1000,
+                stack,
+            )
@@ -1,6 +1,9 @@
 """Module de tracking des métriques du serveur et des appels FFBB."""
 
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from threading import Lock
 from typing import Any
 
@@ -18,6 +21,24 @@ _cache_misses: dict[str, int] = {}
 # Gauge : appels FFBB en vol
 _ffbb_inflight: int = 0
 
+# Lag de la boucle asyncio (cf. loop_monitor)
+_loop_lag_last: float = 0.0
+_loop_lag_max: float = 0.0
+_loop_blocks: int = 0
+
+# Appels FFBB amont par endpoint, et coût amont cumulé par outil MCP
+_upstream_calls: dict[str, int] = {}
+_tool_invocations: dict[str, int] = {}
+_tool_upstream_calls: dict[str, int] = {}
+
+# Compteurs actifs (imbriqués) pour l'invocation en cours. Les dicts sont
+# partagés par référence avec les tâches créées pendant l'invocation (les
+# asyncio.Task copient le contexte), donc un fetch dédupliqué est compté pour
+# l'invocation qui l'a lancé, et pour elle seule.
+_upstream_trackers: ContextVar[tuple[dict[str, int], ...]] = ContextVar(
+    "ffbb_upstream_trackers", default=()
+)
+
 _metrics_lock = Lock()
 
 
@@ -50,6 +71,57 @@ def dec_inflight() -> None:
         _ffbb_inflight = max(0, _ffbb_inflight - 1)
 
 
+def record_upstream_call(endpoint: str) -> None:
+    """Enregistre un appel HTTP effectif vers l'API FFBB (chaque tentative compte)."""
+    with _metrics_lock:
+        _upstream_calls[endpoint] = _upstream_calls.get(endpoint, 0) + 1
+    for tracker in _upstream_trackers.get():
+        tracker[endpoint] = tracker.get(endpoint, 0) + 1
+
+
+@contextmanager
+def track_upstream_calls() -> Iterator[dict[str, int]]:
+    """Compte les appels FFBB amont (par endpoint) effectués dans le bloc.
+
+    Les blocs peuvent s'imbriquer : un appel est compté par chaque bloc actif.
+
+    Usage :
+        with track_upstream_calls() as calls:
+            await ffbb_team_summary_service(...)
+        sum(calls.values())  # coût amont de l'invocation
+    """
+    calls: dict[str, int] = {}
+    token = _upstream_trackers.set((*_upstream_trackers.get(), calls))
+    try:
+        yield calls
+    finally:
+        _upstream_trackers.reset(token)
+
+
+def record_tool_invocation(tool_name: str, upstream_calls: int) -> None:
+    """Enregistre une invocation d'outil MCP et son nombre d'appels amont."""
+    with _metrics_lock:
+        _tool_invocations[tool_name] = _tool_invocations.get(tool_name, 0) + 1
+        _tool_upstream_calls[tool_name] = (
+            _tool_upstream_calls.get(tool_name, 0) + upstream_calls
+        )
+
+
+def record_loop_lag(lag: float) -> None:
+    """Enregistre un échantillon de lag de la boucle asyncio (secondes)."""
+    global _loop_lag_last, _loop_lag_max
+    with _metrics_lock:
+        _loop_lag_last = lag
+        _loop_lag_max = max(_loop_lag_max, lag)
+
+
+def record_loop_block() -> None:
+    """Enregistre un blocage de la boucle au-delà du seuil configuré."""
+    global _loop_blocks
+    with _metrics_lock:
+        _loop_blocks += 1
+
+
 def record_cache_hit(cache_name: str) -> None:
     """Enregistre un hit de cache."""
     with _metrics_lock:
@@ -85,6 +157,12 @@ def get_snapshot() -> dict[str, Any]:
         inflight = _ffbb_inflight
         hits = dict(_cache_hits)
         misses = dict(_cache_misses)
+        upstream = dict(_upstream_calls)
+        tool_invocations = dict(_tool_invocations)
+        tool_upstream = dict(_tool_upstream_calls)
+        loop_lag = _loop_lag_last
+        loop_lag_max = _loop_lag_max
+        loop_blocks = _loop_blocks
 
     error_rate = errors / calls if calls > 0 else 0.0
     avg_latency = latency_total / calls if calls > 0 else 0.0
@@ -102,6 +180,15 @@ def get_snapshot() -> dict[str, Any]:
             "hit_ratio": h / total if total > 0 else 0.0,
         }
 
+    tools_stats: dict[str, dict[str, Any]] = {}
+    for name, n in tool_invocations.items():
+        up = tool_upstream.get(name, 0)
+        tools_stats[name] = {
+            "invocations": n,
+            "upstream_calls": up,
+            "avg_upstream_calls": up / n if n > 0 else 0.0,
+        }
+
     total_hits = sum(hits.values())
     total_misses = sum(misses.values())
     total_cache = total_hits + total_misses
@@ -114,6 +201,11 @@ def get_snapshot() -> dict[str, Any]:
         "api_latency_seconds_total": latency_total,
         "api_avg_latency_seconds": avg_latency,
         "api_inflight_requests": inflight,
+        "upstream_calls": upstream,
+        "tools": tools_stats,
+        "event_loop_lag_seconds": loop_lag,
+        "event_loop_lag_max_seconds": loop_lag_max,
+        "event_loop_blocks_total": loop_blocks,
         "cache": cache_stats,
         "cache_hits_total": total_hits,
         "cache_misses_total": total_misses,
@@ -164,8 +256,53 @@ def generate_prometheus_metrics() -> str:
         "# HELP ffbb_api_inflight_requests Nombre d'appels FFBB en cours",
         "# TYPE ffbb_api_inflight_requests gauge",
         f"ffbb_api_inflight_requests {snap['api_inflight_requests']}",
+        "",
+        "# HELP ffbb_event_loop_lag_seconds Dernier lag mesuré de la boucle asyncio",
+        "# TYPE ffbb_event_loop_lag_seconds gauge",
+        f"ffbb_event_loop_lag_seconds {snap['event_loop_lag_seconds']:.4f}",
+        "",
+        "# HELP ffbb_event_loop_lag_max_seconds Lag maximal observé depuis le démarrage",
+        "# TYPE ffbb_event_loop_lag_max_seconds gauge",
+        f"ffbb_event_loop_lag_max_seconds {snap['event_loop_lag_max_seconds']:.4f}",
+        "",
+        "# HELP ffbb_event_loop_blocks_total Blocages de la boucle au-delà du seuil",
+        "# TYPE ffbb_event_loop_blocks_total counter",
+        f"ffbb_event_loop_blocks_total {snap['event_loop_blocks_total']}",
     ]
 
+    upstream_stats: dict[str, int] = snap["upstream_calls"]
+    if upstream_stats:
+        lines += [
+            "",
+            "# HELP ffbb_upstream_calls_total Appels HTTP effectifs vers l'API FFBB par endpoint",
+            "# TYPE ffbb_upstream_calls_total counter",
+        ]
+        for endpoint, count in sorted(upstream_stats.items()):
+            lines.append(f'ffbb_upstream_calls_total{{endpoint="{endpoint}"}} {count}')
+
+    tools_stats: dict[str, dict] = snap["tools"]
+    if tools_stats:
+        lines += [
+            "",
+            "# HELP ffbb_tool_invocations_total Invocations d'outils MCP par outil",
+            "# TYPE ffbb_tool_invocations_total counter",
+        ]
+        for name, stat in sorted(tools_stats.items()):
+            lines.append(
+                f'ffbb_tool_invocations_total{{tool="{name}"}} {stat["invocations"]}'
+            )
+
+        lines += [
+            "",
+            "# HELP ffbb_tool_upstream_calls_total Appels FFBB amont déclenchés par outil",
+            "# TYPE ffbb_tool_upstream_calls_total counter",
+        ]
+        for name, stat in sorted(tools_stats.items()):
+            lines.append(
+                f'ffbb_tool_upstream_calls_total{{tool="{name}"}} '
+                f"{stat['upstream_calls']}"
+            )
+
     cache_stats: dict[str, dict] = snap["cache"]
     if cache_stats:
         lines += [
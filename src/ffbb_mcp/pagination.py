@@ -0,0 +1,85 @@
+"""Pagination par curseur des calendriers, poules et recherches.
+
+Sans pagination, un gros club perd des données (troncature à
+``FFBB_MAX_CALENDAR_MATCHES``, listes coupées à ``FFBB_MCP_PRUNE_LIMIT`` par
+``prune_payload``) ou doit tout recharger avec des filtres plus étroits. Les
+pages sont découpées dans le résultat déjà trié et mis en cache par les
+services : parcourir un calendrier de 600 matchs coûte une agrégation puis de
+simples tranches de liste.
+
+Le curseur est opaque (base64 de ``{"o": offset, "v": version}``). La version
+est l'empreinte du résultat complet au moment de la première page : si les
+données ont changé entre deux pages, la page est quand même servie et porte
+``cursor_stale: true`` (l'appelant peut repartir de zéro).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+from mcp.shared.exceptions import ErrorData, McpError
+from mcp.types import INVALID_PARAMS
+
+from ffbb_mcp import utils
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def encode_cursor(offset: int, version: str | None) -> str:
+    raw = json.dumps({"o": offset, "v": version}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str | None]:
+    """``(offset, version)`` d'un curseur ; McpError s'il est invalide."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset = int(data["o"])
+        version = data.get("v")
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError):
+        offset = -1
+        version = None
+    if offset < 0:
+        raise McpError(
+            error=ErrorData(
+                code=INVALID_PARAMS,
+                message="Curseur de pagination invalide : repartir sans `cursor`.",
+            )
+        )
+    return offset, version if isinstance(version, str) else None
+
+
+def page_bounds(
+    cursor: str | None, page_size: int | None, version: str | None, total: int
+) -> tuple[int, int, dict[str, Any]]:
+    """Bornes ``[start, end)`` de la page et métadonnées de pagination.
+
+    ``page_size`` est plafonné à la limite de ``prune_payload`` pour qu'une
+    page ne soit jamais recoupée à la sortie de l'outil.
+    """
+    size = min(page_size or DEFAULT_PAGE_SIZE, utils._PRUNE_LIST_LIMIT)
+    start, cursor_version = decode_cursor(cursor) if cursor else (0, version)
+    start = min(start, total)
+    end = min(start + size, total)
+    meta: dict[str, Any] = {"_total": total, "_offset": start, "_version": version}
+    if end < total:
+        meta["next_cursor"] = encode_cursor(end, version)
+    if cursor_version != version:
+        meta["cursor_stale"] = True
+    return start, end, meta
+
+
+def paginate(
+    items: list[Any],
+    cursor: str | None,
+    page_size: int | None,
+    version: str | None,
+    key: str = "items",
+) -> dict[str, Any]:
+    """Page de ``items`` sous ``key``, avec ``next_cursor`` s'il reste des éléments."""
+    start, end, meta = page_bounds(cursor, page_size, version, len(items))
+    return {key: items[start:end], **meta}
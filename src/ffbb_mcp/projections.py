@@ -0,0 +1,215 @@
+"""Projections déclaratives des payloads FFBB (champs réellement consommés).
+
+Les poules et organismes renvoyés par l'API portent des dizaines de champs
+(commentaires, officiels, forfaits, adresses...) que les services ne lisent
+jamais. Chaque projection décrit, par endpoint, l'arbre des champs conservés :
+
+- ``None`` : la valeur est gardée telle quelle ;
+- un dict : projection récursive, appliquée à l'objet ou à chaque élément
+  d'une liste d'objets.
+
+Les projections sont appliquées juste après le décodage, avant la mise en
+cache : le cache et ``prune_payload`` ne manipulent plus que l'utile. Les
+consommateurs qui exposent la donnée brute (``ffbb_get``, ressources MCP)
+demandent la variante complète (``full=True`` côté services).
+
+``FFBB_FIELD_PROJECTION=0`` désactive les projections (diagnostic).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+Projection = dict[str, "Projection | None"]
+
+_PROJECTION_ENABLED = os.environ.get("FFBB_FIELD_PROJECTION", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+
+# Engagement référencé par une rencontre (idEngagementEquipe1/2).
+_RENCONTRE_ENGAGEMENT: Projection = {"id": None, "numeroEquipe": None, "nom": None}
+
+RENCONTRE_PROJECTION: Projection = {
+    "id": None,
+    "numeroJournee": None,
+    "numero_journee": None,
+    "date_rencontre": None,
+    "date": None,
+    "date_reelle": None,
+    "heure_reelle": None,
+    "joue": None,
+    "nomEquipe1": None,
+    "nomEquipe2": None,
+    "nom_equipe1": None,
+    "nom_equipe2": None,
+    "resultatEquipe1": None,
+    "resultatEquipe2": None,
+    "resultat_equipe1": None,
+    "resultat_equipe2": None,
+    "idEngagementEquipe1": _RENCONTRE_ENGAGEMENT,
+    "idEngagementEquipe2": _RENCONTRE_ENGAGEMENT,
+    "nomSalle": None,
+    "villeSalle": None,
+    "nom_salle": None,
+    "ville_salle": None,
+}
+
+CLASSEMENT_PROJECTION: Projection = {
+    "position": None,
+    "organisme_id": None,
+    "organisme_logo_id": None,
+    "id_engagement": {
+        "id": None,
+        "nom": None,
+        "numero_equipe": None,
+        "organisme_id": None,
+        "logo": {"id": None},
+    },
+    "points": None,
+    "match_joues": None,
+    "gagnes": None,
+    "perdus": None,
+    "nuls": None,
+    "paniers_marques": None,
+    "paniers_encaisses": None,
+    "difference": None,
+    "quotient": None,
+    "point_initiaux": None,
+    "penalites_arbitrage": None,
+    "penalites_entraineur": None,
+    "penalites_diverses": None,
+    "nombre_forfaits": None,
+    "nombre_defauts": None,
+    "hors_classement": None,
+}
+
+POULE_PROJECTION: Projection = {
+    "id": None,
+    "nom": None,
+    "libelle": None,
+    "rencontres": RENCONTRE_PROJECTION,
+    "classements": CLASSEMENT_PROJECTION,
+}
+
+ORGANISME_PROJECTION: Projection = {
+    "id": None,
+    "nom": None,
+    "code": None,
+    "engagements": {
+        "id": None,
+        "numeroEquipe": None,
+        "phase": None,
+        "libellePhase": None,
+        "idCompetition": {
+            "id": None,
+            "nom": None,
+            "sexe": None,
+            "categorie": {"code": None},
+            "competition_origine_niveau": None,
+        },
+        "idPoule": {"id": None},
+    },
+}
+
+PROJECTIONS: dict[str, Projection] = {
+    "poule": POULE_PROJECTION,
+    "organisme": ORGANISME_PROJECTION,
+}
+
+
+def project(data: Any, spec: Projection | None) -> Any:
+    """Applique ``spec`` à ``data`` (dict, liste de dicts ou scalaire).
+
+    Les clés absentes de la source restent absentes (pas de ``None`` ajouté),
+    de sorte que les lectures ``.get(a, .get(b))`` des services se comportent
+    à l'identique sur la donnée projetée.
+    """
+    if spec is None:
+        return data
+    if isinstance(data, dict):
+        out = {}
+        for key, sub in spec.items():
+            if key in data:
+                value = data[key]
+                out[key] = value if sub is None else project(value, sub)
+        return out
+    if isinstance(data, list):
+        return [project(item, spec) for item in data]
+    return data
+
+
+def model_include(
+    obj: Any, spec: Projection, *, sampled: bool = False
+) -> dict[str, Any] | None:
+    """Argument ``include`` de ``model_dump`` équivalent à ``spec`` pour ``obj``.
+
+    Le filtrage est alors fait par pydantic-core pendant la sérialisation, sans
+    produire puis reparcourir les champs écartés. Une sous-projection vise un
+    objet ou chaque élément d'une liste : seule la valeur (le premier élément
+    d'une liste) est sondée. None si la forme reste inconnue (sous-objet nul
+    ou absent dans l'élément sondé d'une liste) : l'appelant projette alors le
+    dict sérialisé avec ``project``.
+    """
+    include: dict[str, Any] = {}
+    for key, sub in spec.items():
+        value = _field(obj, key)
+        if sub is None or (value is None and not sampled):
+            include[key] = True
+            continue
+        if value is None:
+            return None
+        many = isinstance(value, list)
+        if many and not value:
+            include[key] = True
+            continue
+        probe = value[0] if many else value
+        # Scalaire là où la projection attend un objet : gardé tel quel.
+        nested = (
+            model_include(probe, sub, sampled=sampled or many)
+            if _is_object(probe)
+            else True
+        )
+        if nested is None:
+            return None
+        include[key] = {"__all__": nested} if many else nested
+    return include
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, dict) or hasattr(value, "__pydantic_fields__")
+
+
+def _field(obj: Any, key: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(key)
+    extra = getattr(obj, "__pydantic_extra__", None)
+    if extra and key in extra:
+        return extra[key]
+    return getattr(obj, key, None)
+
+
+def projection_for(kind: str) -> Projection | None:
+    """Projection de l'endpoint ``kind`` (None si désactivé ou inconnu)."""
+    if not _PROJECTION_ENABLED:
+        return None
+    return PROJECTIONS.get(kind)
+
+
+def project_payload(kind: str, data: Any) -> Any:
+    """Projette un payload d'endpoint (no-op si pas de projection active)."""
+    return project(data, projection_for(kind))
+
+
+def directus_fields(spec: Projection, prefix: str = "") -> list[str]:
+    """Traduit une projection en liste ``fields`` Directus (chemins pointés)."""
+    fields: list[str] = []
+    for key, sub in spec.items():
+        path = f"{prefix}{key}"
+        if sub is None:
+            fields.append(path)
+        else:
+            fields.extend(directus_fields(sub, f"{path}."))
+    return fields
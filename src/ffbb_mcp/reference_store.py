@@ -0,0 +1,261 @@
+"""Instantané hors ligne des données de référence (organismes, compétitions, saisons).
+
+Organismes, compétitions et saisons changent rarement mais passaient par
+``cache_detail`` (128 entrées) : chaque éviction coûtait un nouvel appel amont.
+``ReferenceStore`` les conserve dans une base SQLite (module standard, une
+ligne par entité, JSON compressé zlib) et sert ``get_organisme_service``,
+``get_competition_service`` et ``get_saisons_service`` sans réseau. Plusieurs
+processus peuvent partager le même fichier (journal WAL).
+
+Les clés reprennent celles de ``cache_detail`` (``organisme:9326``,
+``competition:100001``, ``saisons:False``) : une invalidation admin les vise
+avec le même motif.
+
+Alimentation :
+
+- au fil de l'eau, à chaque détail complet lu chez la FFBB ;
+- en masse, par import d'un fichier JSON ou par crawl
+  (``tools/build_reference_db.py``, filtrable par région via
+  ``FFBB_REFERENCE_REGIONS``).
+
+Fraîcheur : ``ReferenceRefresher`` relit en tâche de fond, par lots, les
+entrées plus vieilles que ``FFBB_REFERENCE_MAX_AGE`` secondes (7 jours) toutes
+les ``FFBB_REFERENCE_REFRESH_INTERVAL`` secondes (1 h, ``0`` désactive) ; seules
+les entrées dont le contenu a changé sont réécrites et invalidées (delta).
+
+Activation : ``FFBB_REFERENCE_DB`` (chemin de la base).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable  # noqa: TC003
+from pathlib import Path
+from typing import Any
+
+from ffbb_mcp.utils import content_version
+
+logger = logging.getLogger("ffbb-mcp")
+
+KINDS = ("organisme", "competition", "saisons")
+_DEFAULT_MAX_AGE = 7 * 86400
+_DEFAULT_REFRESH_INTERVAL = 3600.0
+_REFRESH_BATCH = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    version TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entities_age ON entities (kind, fetched_at);
+"""
+
+
+def _read_float_env(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def reference_key(kind: str, item_id: Any) -> str:
+    """Clé d'une entité, identique à celle de ``cache_detail``."""
+    return f"{kind}:{item_id}"
+
+
+def regions_from_env() -> tuple[str, ...]:
+    """Préfixes de code d'organisme à crawler (``FFBB_REFERENCE_REGIONS``)."""
+    raw = os.environ.get("FFBB_REFERENCE_REGIONS", "")
+    return tuple(r.strip().upper() for r in raw.split(",") if r.strip())
+
+
+def _encode(data: Any) -> bytes:
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return zlib.compress(text.encode("utf-8"))
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+class ReferenceStore:
+    """Entités de référence persistées dans SQLite, clé → JSON compressé.
+
+    Lectures par clé primaire (quelques dizaines de µs) ; une connexion
+    partagée entre threads, sérialisée par un verrou.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entities WHERE key = ?", (key,)
+            ).fetchone()
+        return _decode(row[0]) if row else None
+
+    def put(self, key: str, data: Any, *, fetched_at: float | None = None) -> bool:
+        """Enregistre ``data`` ; renvoie True si son contenu a changé."""
+        return self.put_many([(key, data)], fetched_at=fetched_at) == 1
+
+    def put_many(
+        self, items: Iterable[tuple[str, Any]], *, fetched_at: float | None = None
+    ) -> int:
+        """Enregistre des entités en une transaction ; renvoie le nombre modifié.
+
+        Une entité inchangée n'est pas réécrite : seule sa date de lecture
+        avance.
+        """
+        now = time.time() if fetched_at is None else fetched_at
+        rows = [
+            (key, key.partition(":")[0], content_version(data), data)
+            for key, data in items
+        ]
+        changed = 0
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            for key, kind, version, data in rows:
+                row = self._conn.execute(
+                    "SELECT version FROM entities WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[0] == version:
+                    self._conn.execute(
+                        "UPDATE entities SET fetched_at = ? WHERE key = ?", (now, key)
+                    )
+                    continue
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?)",
+                    (key, kind, version, now, _encode(data)),
+                )
+                changed += 1
+        return changed
+
+    def delete(self, keys: Iterable[str]) -> int:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            cursor = self._conn.executemany(
+                "DELETE FROM entities WHERE key = ?", [(k,) for k in keys]
+            )
+        return cursor.rowcount
+
+    def list_keys(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT key FROM entities")]
+
+    def stale(self, kind: str, max_age: float, limit: int) -> list[str]:
+        """Clés de ``kind`` lues il y a plus de ``max_age`` s, les plus vieilles d'abord."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM entities WHERE kind = ? AND fetched_at < ? "
+                "ORDER BY fetched_at LIMIT ?",
+                (kind, time.time() - max_age, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, COUNT(*), MIN(fetched_at) FROM entities GROUP BY kind"
+            ).fetchall()
+        now = time.time()
+        return {
+            "path": self.path,
+            "entities": {kind: count for kind, count, _ in rows},
+            "oldest_age_seconds": {
+                kind: round(now - oldest, 1) for kind, _, oldest in rows
+            },
+        }
+
+    def import_file(self, path: str | Path) -> int:
+        """Importe un fichier JSON ``{"organismes": [...], "competitions": [...],
+        "saisons": [...]}`` ; renvoie le nombre d'entités modifiées.
+
+        ``saisons`` est la liste complète (les saisons actives en sont déduites).
+        """
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        items: list[tuple[str, Any]] = []
+        for kind in ("organisme", "competition"):
+            for item in payload.get(f"{kind}s") or []:
+                if isinstance(item, dict) and item.get("id") is not None:
+                    items.append((reference_key(kind, item["id"]), item))
+        saisons = payload.get("saisons")
+        if isinstance(saisons, list):
+            items.append((reference_key("saisons", False), saisons))
+            actives = [s for s in saisons if isinstance(s, dict) and s.get("actif")]
+            items.append((reference_key("saisons", True), actives))
+        return self.put_many(items)
+
+
+class ReferenceRefresher:
+    """Tâche de fond : relecture périodique des entrées anciennes (cf. module)."""
+
+    def __init__(
+        self,
+        *,
+        interval: float | None = None,
+        max_age: float | None = None,
+        batch: int = _REFRESH_BATCH,
+    ) -> None:
+        self.interval = (
+            _read_float_env(
+                "FFBB_REFERENCE_REFRESH_INTERVAL", _DEFAULT_REFRESH_INTERVAL
+            )
+            if interval is None
+            else interval
+        )
+        self.max_age = (
+            _read_float_env("FFBB_REFERENCE_MAX_AGE", _DEFAULT_MAX_AGE)
+            if max_age is None
+            else max_age
+        )
+        self.batch = batch
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Démarre la tâche sur la boucle courante (sans effet si intervalle ≤ 0)."""
+        if self.interval <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        from ffbb_mcp.services import refresh_reference_store
+
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await refresh_reference_store(max_age=self.max_age, batch=self.batch)
+            except Exception as e:
+                logger.warning("Rafraîchissement des données de référence : %s", e)
+
+
+refresher = ReferenceRefresher()
@@ -1,8 +1,41 @@
-"""Définition des Resources MCP (Endpoints URI)."""
+"""Définition des Resources MCP (Endpoints URI) et de leurs équivalents HTTP."""
 
 import json
 from typing import Any
 
+from cachetools import LRUCache
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+# JSON élagué déjà encodé, indexé par version de contenu : une poule inchangée
+# n'est ni ré-élaguée ni ré-encodée d'une lecture à l'autre.
+_ENCODED_BY_VERSION: LRUCache[str, str] = LRUCache(maxsize=256)
+
+
+def render_versioned(data: Any) -> tuple[str, str | None]:
+    """Encode ``data`` (élagué) en JSON ; renvoie ``(corps, version)``."""
+    from .services import data_version
+    from .utils import prune_payload
+
+    version = data_version(data)
+    if version is None:
+        return json.dumps(prune_payload(data), default=str), None
+    body = _ENCODED_BY_VERSION.get(version)
+    if body is None:
+        body = json.dumps(prune_payload(data), default=str)
+        _ENCODED_BY_VERSION[version] = body
+    return body, version
+
+
+def _etag_matches(if_none_match: str | None, version: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip().removeprefix("W/").strip('"')
+        if tag in ("*", version):
+            return True
+    return False
+
 
 def register_resources(mcp: Any) -> None:
     """Enregistre les ressources sur l'instance FastMCP."""
@@ -25,29 +58,36 @@ def register_resources(mcp: Any) -> None:
         except Exception as e:
             raise handle_api_error(e) from e
 
+    @mcp.resource("ffbb://lives")
+    async def resource_lives() -> str:
+        """Matchs en cours (abonnable : notifié quand les scores changent)."""
+        from .services import get_lives_service, handle_api_error
+
+        try:
+            data = await get_lives_service()
+            return render_versioned(data)[0]
+        except Exception as e:
+            raise handle_api_error(e) from e
+
     @mcp.resource("ffbb://competition/{competition_id}")
     async def resource_competition(competition_id: int) -> str:
         """Détails d'une compétition au format JSON."""
         from .services import get_competition_service, handle_api_error
 
         try:
-            from .utils import prune_payload
-
             data = await get_competition_service(competition_id)
-            return json.dumps(prune_payload(data), default=str)
+            return render_versioned(data)[0]
         except Exception as e:
             raise handle_api_error(e) from e
 
     @mcp.resource("ffbb://poule/{poule_id}")
     async def resource_poule(poule_id: int) -> str:
-        """Détails d'une poule au format JSON."""
+        """Détails d'une poule au format JSON (abonnable aux scores en direct)."""
         from .services import get_poule_service, handle_api_error
 
         try:
-            from .utils import prune_payload
-
-            data = await get_poule_service(poule_id)
-            return json.dumps(prune_payload(data), default=str)
+            data = await get_poule_service(poule_id, full=True)
+            return render_versioned(data)[0]
         except Exception as e:
             raise handle_api_error(e) from e
 
@@ -57,9 +97,48 @@ def register_resources(mcp: Any) -> None:
         from .services import get_organisme_service, handle_api_error
 
         try:
-            from .utils import prune_payload
-
-            data = await get_organisme_service(organisme_id)
-            return json.dumps(prune_payload(data), default=str)
+            data = await get_organisme_service(organisme_id, full=True)
+            return render_versioned(data)[0]
         except Exception as e:
             raise handle_api_error(e) from e
+
+
+def register_http_resources(mcp: Any) -> None:
+    """Routes HTTP /api/{poule,organisme,competition}/{id} avec ETag.
+
+    Même contenu que les ressources ``ffbb://...``. L'en-tête ``ETag`` porte
+    la version du contenu ; un ``If-None-Match`` à jour reçoit un 304 sans
+    corps, ce qui évite aux clients qui interrogent régulièrement une poule de
+    la re-télécharger tant qu'elle n'a pas changé.
+    """
+    from .services import (
+        get_competition_service,
+        get_organisme_service,
+        get_poule_service,
+    )
+
+    loaders = {
+        "poule": lambda i: get_poule_service(i, full=True),
+        "organisme": lambda i: get_organisme_service(i, full=True),
+        "competition": get_competition_service,
+    }
+
+    @mcp.custom_route("/api/{kind}/{item_id:int}", methods=["GET"])  # type: ignore[untyped-decorator]
+    async def api_resource(request: Request) -> Response:
+        loader = loaders.get(request.path_params["kind"])
+        if loader is None:
+            return JSONResponse({"error": "ressource inconnue"}, status_code=404)
+        try:
+            data = await loader(request.path_params["item_id"])
+        except Exception as e:
+            return JSONResponse({"error": str(e)}, status_code=502)
+        if not data:
+            return JSONResponse({"error": "introuvable"}, status_code=404)
+
+        body, version = render_versioned(data)
+        headers = {"Cache-Control": "no-cache"}
+        if version is not None:
+            headers["ETag"] = f'"{version}"'
+            if _etag_matches(request.headers.get("if-none-match"), version):
+                return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
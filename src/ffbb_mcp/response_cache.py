@@ -0,0 +1,165 @@
+"""Cache des réponses d'outils MCP déjà mises en forme.
+
+Pour des arguments identiques, ``ffbb_bilan``, ``ffbb_club``, ``ffbb_get``...
+refont à chaque appel la mise en forme, ``prune_payload``, la validation du
+schéma de sortie et l'encodage JSON de FastMCP, même quand le service répond
+depuis son cache. Ici, le ``CallToolResult`` final (texte JSON déjà encodé +
+contenu structuré) est conservé et renvoyé tel quel au serveur bas niveau,
+qui le transmet sans autre traitement.
+
+Clé : nom de l'outil + arguments normalisés (clés triées, ``None`` retirés).
+Chaque réponse garde les entrées de caches services lues pour la calculer
+(``services._read_deps``), sous forme ``(nom du cache, clé, data_version)`` ;
+elle n'est resservie que si chacune est toujours en cache avec la même version
+de contenu. Une écriture sans rapport ne l'invalide donc pas, alors qu'une
+entrée lue expirée, invalidée ou réécrite avec un autre contenu la fait
+recalculer. Une réponse calculée sans aucune lecture de cache service n'est
+pas conservée. Le TTL propre (``FFBB_CACHE_TTL_RESPONSE``, 60 s) borne la
+durée de vie d'une entrée ; les jours de match, une réponse n'est resservie
+que pendant ``FFBB_CACHE_TTL_RESPONSE_MATCH_DAY`` secondes (15 s par défaut).
+
+Contourné : ``force_refresh=True``, ``FFBB_MCP_DEBUG_UPSTREAM=1`` (``_meta``
+propre à chaque appel) et ``FFBB_RESPONSE_CACHE=0``.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Awaitable, Callable, Sequence  # noqa: TC003
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import CallToolResult, ContentBlock
+
+from ffbb_mcp._state import _env_flag, _read_positive_int_env, state
+from ffbb_mcp.metrics import record_tool_invocation
+from ffbb_mcp.services import _cache_get, _cache_set, _read_deps, data_version
+from ffbb_mcp.utils import is_match_day
+
+# Outils en lecture seule dont la réponse ne dépend que des arguments et des
+# caches services (ffbb_lives/ffbb_version exclus : données temps réel).
+CACHED_TOOLS = frozenset(
+    {
+        "ffbb_search",
+        "ffbb_bilan",
+        "ffbb_get",
+        "ffbb_club",
+        "ffbb_resolve_team",
+        "ffbb_team_summary",
+        "ffbb_last_result",
+        "ffbb_next_match",
+        "ffbb_bilan_saison",
+    }
+)
+
+
+def response_cache_key(name: str, arguments: dict[str, Any]) -> str | None:
+    """Clé de cache de la réponse, ou None si l'appel ne doit pas être caché."""
+    if name not in CACHED_TOOLS or arguments.get("force_refresh"):
+        return None
+    if not _env_flag("FFBB_RESPONSE_CACHE", "1"):
+        return None
+    if _env_flag("FFBB_MCP_DEBUG_UPSTREAM"):
+        return None
+    normalized = {k: v for k, v in arguments.items() if v is not None}
+    try:
+        args = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return f"{name}:{args}"
+
+
+def _is_error_payload(structured: Any) -> bool:
+    """Réponses d'erreur métier ({"error": ...}) : jamais mises en cache."""
+    if isinstance(structured, dict) and set(structured) == {"result"}:
+        structured = structured["result"]
+    if isinstance(structured, list) and structured:
+        structured = structured[0]
+    return isinstance(structured, dict) and "error" in structured
+
+
+def _to_call_tool_result(result: Any) -> CallToolResult | None:
+    """Construit le CallToolResult que produirait le serveur bas niveau."""
+    if isinstance(result, CallToolResult):
+        return None if result.isError else result
+    if isinstance(result, tuple) and len(result) == 2:
+        content, structured = result
+        if _is_error_payload(structured):
+            return None
+        return CallToolResult(content=list(content), structuredContent=structured)
+    return None
+
+
+def _payload(value: Any) -> Any:
+    """Donnée d'une entrée de cache service (sans l'enveloppe ``_ttl``)."""
+    if isinstance(value, dict) and "_ttl" in value:
+        return value.get("data", value)
+    return value
+
+
+def _deps_unchanged(deps: tuple[tuple[str, Any, str | None], ...]) -> bool:
+    """Vrai si chaque entrée lue est encore en cache avec le même contenu."""
+    for name, key, version in deps:
+        cache = getattr(state, f"cache_{name}", None)
+        current = cache.get(key) if cache is not None else None
+        if current is None or data_version(_payload(current)) != version:
+            return False
+    return True
+
+
+def _match_day_max_age() -> int:
+    return _read_positive_int_env("FFBB_CACHE_TTL_RESPONSE_MATCH_DAY", 15)
+
+
+async def call_tool_cached(
+    name: str,
+    arguments: dict[str, Any],
+    compute: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Sert ``name(arguments)`` depuis le cache réponse, sinon via ``compute``."""
+    key = response_cache_key(name, arguments)
+    if key is None:
+        return await compute()
+
+    cache = state.cache_response
+    entry = cache.get(key) if cache is not None else None
+    if entry is not None:
+        _, deps, stored_at = entry
+        if not _deps_unchanged(deps) or (
+            is_match_day() and time.monotonic() - stored_at > _match_day_max_age()
+        ):
+            cache.pop(key, None)  # type: ignore[union-attr]
+    cached = _cache_get(cache, key, "response")
+    if cached is not None:
+        record_tool_invocation(name, 0)
+        return cached[0]
+
+    deps_map: dict[tuple[str, Any], Any] = {}
+    token = _read_deps.set(deps_map)
+    try:
+        result = await compute()
+    finally:
+        _read_deps.reset(token)
+    response = _to_call_tool_result(result)
+    if response is not None and deps_map:
+        # Versions lues pendant le calcul : si un appel concurrent réécrit une
+        # de ces entrées, la réponse n'est plus resservie. Seuls noms, clés et
+        # versions sont gardés, jamais les caches ni les payloads eux-mêmes.
+        deps = tuple(
+            (name, k, data_version(_payload(value)))
+            for (name, k), value in deps_map.items()
+        )
+        entry = (response, deps, time.monotonic())
+        _cache_set(state.cache_response, key, entry, "response")
+    return result
+
+
+class ResponseCachingFastMCP(FastMCP):
+    """FastMCP dont ``call_tool`` sert les réponses depuis ``cache_response``."""
+
+    async def call_tool(  # type: ignore[override]
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any] | CallToolResult:
+        parent = super().call_tool
+        return await call_tool_cached(name, arguments, lambda: parent(name, arguments))
@@ -0,0 +1,546 @@
+"""Index locaux en mémoire pour la résolution de clubs sans Meilisearch.
+
+``_resolve_club_and_org`` déclenchait une ou deux recherches d'organismes
+pour chaque appel d'outil par nom de club. ``OrganismeIndex`` apprend de
+chaque résultat de recherche et de chaque organisme chargé (nom, nom
+normalisé, acronyme, entente, ville, id) et répond localement, en quelques
+microsecondes :
+
+- aux requêtes déjà vues, tant que le résultat mémorisé couvre la limite
+  demandée (un résultat plus court que sa limite est complet) et n'est pas
+  plus vieux que ``query_ttl`` (TTL du cache de recherche) ;
+- aux noms complets ou acronymes connus, complétés par les clubs dont les
+  mots commencent par ceux de la requête (recherche par préfixe sur un
+  tableau trié de mots, ``bisect``), quand ils suffisent à remplir la limite.
+
+Toute autre requête part chez Meilisearch et enrichit l'index. La recherche
+approchée (``TrigramIndex``, similarité de Jaccard sur les trigrammes) sert
+aux suggestions, jamais à une résolution silencieuse.
+
+``PrefixIndex`` sert l'autocomplétion (``ffbb_typeahead``) sur les clubs,
+compétitions et salles déjà vus.
+
+Persistance optionnelle : ``FFBB_ORG_INDEX_PATH`` (JSON, relu au démarrage).
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import json
+import logging
+import os
+import re
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable, Iterable  # noqa: TC003
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("ffbb-mcp")
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]+")
+_SKIP_WORDS = frozenset({"DE", "DU", "LE", "LA", "LES", "ET", "EN", "DES", "AUX"})
+_MAX_QUERIES = 4096
+_SELECTIVE_POSTINGS = 64
+_MAX_PREFIX_ENTRIES = 200_000
+# Candidats examinés au plus par recherche de préfixe (préfixes très courts).
+_MAX_SCAN = 5000
+# Au-delà, le nombre de fiches d'un préfixe est minoré par son nombre de mots.
+_MAX_RUNS = 256
+_RECORD_KEYS = frozenset({"id", "nom", "code", "type", "ville", "ville_salle"})
+
+
+def fold(text: str) -> str:
+    """Majuscules sans accents, ponctuation remplacée par des espaces."""
+    if not text:
+        return ""
+    s = unicodedata.normalize("NFD", text.upper())
+    s = "".join(c for c in s if unicodedata.category(c) != "Mn")
+    return _NON_ALNUM.sub(" ", s).strip()
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Trigrammes des mots de ``text`` (bornés par des espaces)."""
+    grams: set[str] = set()
+    for word in fold(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def initials(folded_name: str) -> str:
+    """Acronyme d'un nom normalisé (mots vides ignorés)."""
+    return "".join(w[0] for w in folded_name.split() if w not in _SKIP_WORDS)
+
+
+class TrigramIndex:
+    """Index inversé trigramme → clés, classement par similarité de Jaccard."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[Hashable]] = {}
+        self._grams: dict[Hashable, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._grams
+
+    def add(self, key: Hashable, text: str) -> None:
+        grams = trigrams(text)
+        if self._grams.get(key) == grams:
+            return
+        self.discard(key)
+        self._grams[key] = grams
+        for g in grams:
+            self._postings.setdefault(g, set()).add(key)
+
+    def discard(self, key: Hashable) -> None:
+        for g in self._grams.pop(key, ()):
+            keys = self._postings.get(g)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[g]
+
+    def search(
+        self, text: str, limit: int = 10, min_similarity: float = 0.3
+    ) -> list[tuple[Hashable, float]]:
+        """Clés les plus proches de ``text`` : ``[(clé, similarité)]``."""
+        grams = trigrams(text)
+        if not grams:
+            return []
+        # Les trigrammes très fréquents (" BA", "ASK"...) ne génèrent pas de
+        # candidats : seules les listes sélectives sont comptées, puis le score
+        # exact est calculé sur les meilleurs candidats seulement.
+        postings = sorted((self._postings.get(g, set()) for g in grams), key=len)
+        cap = max(_SELECTIVE_POSTINGS, len(self._grams) // 20)
+        shared: Counter[Hashable] = Counter()
+        for keys in [p for p in postings if len(p) <= cap] or postings[:1]:
+            shared.update(keys)
+        scored = []
+        for key, _ in shared.most_common(limit * 10):
+            other = self._grams[key]
+            n = len(grams & other)
+            score = n / (len(grams) + len(other) - n)
+            if score >= min_similarity:
+                scored.append((key, score))
+        scored.sort(key=lambda kv: (-kv[1], str(kv[0])))
+        return scored[:limit]
+
+
+class PrefixIndex:
+    """Fiches cherchables par préfixes de mots (autocomplétion).
+
+    Vocabulaire trié (``bisect`` : un préfixe délimite une plage de mots) et,
+    par mot, les fiches triées par longueur de nom. Les listes des mots d'un
+    préfixe sont fusionnées (``heapq.merge``) dans l'ordre du classement et
+    le parcours s'arrête dès ``limit`` résultats : le coût suit ``limit``,
+    pas la taille de l'index. Quand un préfixe couvre beaucoup de mots et
+    de fiches (``"C"``), on parcourt plutôt toutes les fiches par longueur
+    croissante, où les correspondances sont denses. Les autres mots de la requête filtrent les
+    candidats par sous-chaîne sur le nom replié.
+    """
+
+    def __init__(self, max_entries: int = _MAX_PREFIX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._records: dict[str, dict[str, Any]] = {}
+        self._names: dict[str, tuple[str, ...]] = {}
+        # " MOT1 MOT2 …" : test de préfixe de mot par sous-chaîne (boucle C).
+        self._joined: dict[str, str] = {}
+        self._vocab: list[str] = []
+        self._postings: dict[str, list[tuple[int, str]]] = {}
+        self._by_length: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._names.clear()
+        self._joined.clear()
+        self._vocab = []
+        self._postings.clear()
+        self._by_length = []
+
+    def add(self, key: str, record: dict[str, Any], text: str) -> None:
+        words = tuple(dict.fromkeys(fold(text).split()))
+        if not words:
+            return
+        old = self._names.get(key)
+        if old is None and len(self._records) >= self.max_entries:
+            self.clear()
+        self._records[key] = record
+        if old == words:
+            return
+        if old is not None:
+            entry = (len(self._joined[key]), key)
+            for w in old:
+                postings = self._postings[w]
+                _remove_sorted(postings, entry)
+                if not postings:
+                    del self._postings[w]
+                    _remove_sorted(self._vocab, w)
+            _remove_sorted(self._by_length, entry)
+        joined = " " + " ".join(words)
+        self._names[key] = words
+        self._joined[key] = joined
+        entry = (len(joined), key)
+        for w in words:
+            if w not in self._postings:
+                self._postings[w] = []
+                bisect.insort(self._vocab, w)
+            bisect.insort(self._postings[w], entry)
+        bisect.insort(self._by_length, entry)
+
+    def add_many(self, items: Iterable[tuple[str, dict[str, Any], str]]) -> None:
+        """Chargement en masse : un tri par liste au lieu d'un ``insort``."""
+        for key, record, text in items:
+            words = tuple(dict.fromkeys(fold(text).split()))
+            if not words or key in self._names:
+                continue
+            joined = " " + " ".join(words)
+            self._records[key] = record
+            self._names[key] = words
+            self._joined[key] = joined
+            entry = (len(joined), key)
+            for w in words:
+                self._postings.setdefault(w, []).append(entry)
+            self._by_length.append(entry)
+        for postings in self._postings.values():
+            postings.sort()
+        self._vocab = sorted(self._postings)
+        self._by_length.sort()
+
+    def _prefix_words(self, word: str) -> list[str]:
+        lo = bisect.bisect_left(self._vocab, word)
+        hi = bisect.bisect_left(self._vocab, word + "\uffff", lo)
+        return self._vocab[lo:hi]
+
+    def _count(self, words: list[str]) -> int:
+        """Fiches couvertes par ``words`` (minorant pour un préfixe très large)."""
+        if len(words) > _MAX_RUNS:
+            return len(words)
+        return sum(map(len, map(self._postings.__getitem__, words)))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        accept: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fiches dont chaque mot de ``query`` préfixe un mot du nom.
+
+        Classement : nom exact, puis noms les plus courts.
+        """
+        words = list(dict.fromkeys(fold(query).split()))
+        if not words:
+            return []
+        runs = [self._prefix_words(w) for w in words]
+        if not all(runs):
+            return []
+        full = " " + " ".join(words)
+        counts = [self._count(run) for run in runs]
+        driver = counts.index(min(counts))
+        run = runs[driver]
+        # Parcours par longueur : ~limit / densité pas (mots supposés
+        # indépendants) ; fusion : un pas de tas par mot du préfixe au départ.
+        density = 1.0
+        for count in counts:
+            density *= min(1.0, count / len(self._by_length))
+        if limit < len(run) * density:
+            needles = [" " + w for w in words]
+            stream = itertools.islice(self._by_length, _MAX_SCAN)
+            hits, stopped = self._collect(stream, needles, full, limit, accept)
+            if stopped or len(self._by_length) <= _MAX_SCAN:
+                return hits
+        needles = [" " + w for i, w in enumerate(words) if i != driver]
+        postings = [self._postings[w] for w in run]
+        # heapq.merge est un générateur Python : inutile pour un seul mot.
+        merged = postings[0] if len(postings) == 1 else heapq.merge(*postings)
+        stream = itertools.islice(merged, _MAX_SCAN)
+        return self._collect(stream, needles, full, limit, accept)[0]
+
+    def _collect(
+        self,
+        stream: Iterable[tuple[int, str]],
+        needles: list[str],
+        full: str,
+        limit: int,
+        accept: Callable[[dict[str, Any]], bool] | None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Premières fiches de ``stream`` (longueur croissante) qui conviennent.
+
+        Le booléen indique un arrêt anticipé (résultat sûr) plutôt qu'un
+        flux épuisé.
+        """
+        joined, records = self._joined, self._records
+        seen: set[str] = set()
+        hits: list[str] = []
+        stopped = False
+        size = len(full)
+        for length, key in stream:
+            # Un nom exact a la longueur de la requête : on l'atteint avant d'arrêter.
+            if length > size and len(hits) >= limit:
+                stopped = True
+                break
+            if key in seen:
+                continue
+            seen.add(key)
+            name = joined[key]
+            for w in needles:
+                if w not in name:
+                    break
+            else:
+                if accept is None or accept(records[key]):
+                    hits.append(key)
+        hits.sort(key=lambda k: joined[k] != full)
+        return [records[key] for key in hits[:limit]], stopped
+
+
+def _remove_sorted(items: list[Any], item: Any) -> None:
+    i = bisect.bisect_left(items, item)
+    if i < len(items) and items[i] == item:
+        del items[i]
+
+
+class OrganismeIndex:
+    """Organismes vus (recherches, détails) et résolutions de requêtes apprises."""
+
+    def __init__(
+        self, max_queries: int = _MAX_QUERIES, query_ttl: float | None = None
+    ) -> None:
+        self.max_queries = max_queries
+        # Durée de validité d'une réponse mémorisée (None : sans limite).
+        self.query_ttl = query_ttl
+        self._orgs: dict[str, dict[str, Any]] = {}
+        self._folded: dict[str, str] = {}
+        self._by_name: dict[str, set[str]] = {}
+        self._by_acronym: dict[str, set[str]] = {}
+        # (mot, id) triés pour la recherche par préfixe, tenus à jour par insort.
+        self._words: list[tuple[str, str]] = []
+        self._trigrams = TrigramIndex()
+        # requête normalisée → (ids ordonnés, limite couverte, date d'apprentissage)
+        self._queries: OrderedDict[str, tuple[tuple[str, ...], float, float]] = (
+            OrderedDict()
+        )
+        self.dirty = 0
+
+    def __len__(self) -> int:
+        return len(self._orgs)
+
+    def clear(self) -> None:
+        for d in (self._orgs, self._folded, self._by_name, self._by_acronym):
+            d.clear()
+        self._words = []
+        self._trigrams = TrigramIndex()
+        self._queries.clear()
+        self.dirty = 0
+
+    # -- Alimentation --------------------------------------------------------
+
+    def add(self, org: dict[str, Any]) -> str | None:
+        """Indexe un hit de recherche ou un détail d'organisme ; renvoie son id."""
+        return self._add(org, sorted_words=True)
+
+    def _add(self, org: dict[str, Any], *, sorted_words: bool) -> str | None:
+        """``sorted_words=False`` (chargement en masse) : mots ajoutés en fin de
+        tableau, trié une seule fois par l'appelant."""
+        if not isinstance(org, dict) or not org.get("id") or not org.get("nom"):
+            return None
+        oid = str(org["id"])
+        record = {k: v for k, v in org.items() if k in _RECORD_KEYS and v}
+        if not record.get("ville"):
+            commune = org.get("commune")
+            if isinstance(commune, dict) and commune.get("libelle"):
+                record["ville"] = commune["libelle"]
+        previous = self._orgs.get(oid)
+        if previous is not None:
+            merged = {**previous, **record}
+            if merged == previous:
+                return oid
+            record = merged
+        self._orgs[oid] = record
+        self.dirty += 1
+
+        folded = fold(str(record["nom"]))
+        old_folded = self._folded.get(oid)
+        if old_folded != folded:
+            if old_folded is not None:
+                self._by_name.get(old_folded, set()).discard(oid)
+                self._by_acronym.get(initials(old_folded), set()).discard(oid)
+                for w in set(old_folded.split()):
+                    if sorted_words:
+                        _remove_sorted(self._words, (w, oid))
+                    elif (w, oid) in self._words:
+                        self._words.remove((w, oid))
+            self._folded[oid] = folded
+            self._by_name.setdefault(folded, set()).add(oid)
+            acronym = initials(folded)
+            if len(acronym) >= 2:
+                self._by_acronym.setdefault(acronym, set()).add(oid)
+            self._trigrams.add(oid, folded)
+            for w in set(folded.split()):
+                if sorted_words:
+                    bisect.insort(self._words, (w, oid))
+                else:
+                    self._words.append((w, oid))
+        return oid
+
+    def learn(self, query: str, limit: int, hits: Iterable[Any]) -> None:
+        """Mémorise la réponse de Meilisearch à ``query`` (et indexe ses hits)."""
+        ids = tuple(oid for oid in (self.add(h) for h in hits) if oid is not None)
+        key = fold(query)
+        if not key:
+            return
+        # Moins de hits que la limite : le résultat est complet.
+        covered = float("inf") if len(ids) < limit else float(limit)
+        self._queries[key] = (ids, covered, time.time())
+        self._queries.move_to_end(key)
+        while len(self._queries) > self.max_queries:
+            self._queries.popitem(last=False)
+        self.dirty += 1
+
+    # -- Interrogation -------------------------------------------------------
+
+    def get(self, organisme_id: int | str) -> dict[str, Any] | None:
+        return self._orgs.get(str(organisme_id))
+
+    def records(self) -> list[dict[str, Any]]:
+        return list(self._orgs.values())
+
+    def resolve(self, query: str, limit: int) -> list[dict[str, Any]] | None:
+        """Hits locaux pour ``query``, ou None si seule l'API peut répondre."""
+        key = fold(query)
+        if not key:
+            return None
+        memo = self._queries.get(key)
+        if memo is not None and self._expired(memo[2]):
+            del self._queries[key]
+            self.dirty += 1
+            memo = None
+        if memo is not None and memo[1] >= limit:
+            self._queries.move_to_end(key)
+            return [
+                dict(self._orgs[oid]) for oid in memo[0][:limit] if oid in self._orgs
+            ]
+
+        exact = self._by_name.get(key) or self._by_acronym.get(key)
+        if not exact:
+            return None
+        ordered = sorted(exact, key=lambda oid: (len(self._folded[oid]), oid))
+        for oid in self.prefix_search(key, limit):
+            if oid not in exact:
+                ordered.append(oid)
+        # Moins de clubs connus que la limite : Meilisearch en connaît peut-être
+        # d'autres, seule l'API peut répondre.
+        if len(ordered) < limit:
+            return None
+        return [dict(self._orgs[oid]) for oid in ordered[:limit]]
+
+    def _expired(self, learned_at: float) -> bool:
+        return self.query_ttl is not None and time.time() - learned_at > self.query_ttl
+
+    def prefix_search(self, text: str, limit: int = 10) -> list[str]:
+        """Ids dont chaque mot de ``text`` préfixe un mot du nom (plus courts d'abord)."""
+        words = fold(text).split()
+        if not words:
+            return []
+        first = words[0]
+        start = bisect.bisect_left(self._words, (first, ""))
+        candidates: set[str] = set()
+        for w, oid in self._words[start:]:
+            if not w.startswith(first):
+                break
+            candidates.add(oid)
+        rest = words[1:]
+        matches = [
+            oid
+            for oid in candidates
+            if all(
+                any(w.startswith(r) for w in self._folded[oid].split()) for r in rest
+            )
+        ]
+        matches.sort(key=lambda oid: (len(self._folded[oid]), oid))
+        return matches[:limit]
+
+    def fuzzy(self, text: str, limit: int = 5) -> list[dict[str, Any]]:
+        """Organismes au nom proche de ``text`` (suggestions)."""
+        return [
+            dict(self._orgs[str(oid)]) for oid, _ in self._trigrams.search(text, limit)
+        ]
+
+    # -- Persistance ---------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """Copie de l'index à persister, prise sur la boucle (copie des listes
+        seulement : les fiches ne sont jamais modifiées en place). Son encodage,
+        ``encode``, peut partir en thread."""
+        self.dirty = 0
+        return {
+            "organismes": list(self._orgs.values()),
+            "queries": [
+                (k, ids, covered, learned_at)
+                for k, (ids, covered, learned_at) in self._queries.items()
+                if not self._expired(learned_at)
+            ],
+        }
+
+    @staticmethod
+    def encode(snapshot: dict[str, Any]) -> str:
+        return json.dumps(
+            {
+                "organismes": snapshot["organismes"],
+                "queries": {
+                    k: [
+                        list(ids),
+                        None if covered == float("inf") else covered,
+                        learned_at,
+                    ]
+                    for k, ids, covered, learned_at in snapshot["queries"]
+                },
+            },
+            ensure_ascii=False,
+        )
+
+    def dumps(self) -> str:
+        return self.encode(self.snapshot())
+
+    def save(self, path: str | Path) -> None:
+        write_atomic(path, self.dumps())
+
+    def load(self, path: str | Path) -> None:
+        path = Path(path)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Index organismes illisible (%s) : %s", path, e)
+            return
+        for org in payload.get("organismes", []):
+            self._add(org, sorted_words=False)
+        self._words.sort()
+        for key, (ids, covered, *rest) in payload.get("queries", {}).items():
+            # Fichier sans date d'apprentissage : réponses considérées expirées.
+            learned_at = float(rest[0]) if rest else 0.0
+            if self._expired(learned_at):
+                continue
+            self._queries[key] = (
+                tuple(str(i) for i in ids),
+                float("inf") if covered is None else float(covered),
+                learned_at,
+            )
+        self.dirty = 0
+        logger.info("Index organismes chargé : %d clubs depuis %s", len(self), path)
+
+
+def write_atomic(path: str | Path, text: str) -> None:
+    """Écrit ``text`` dans ``path`` via un fichier temporaire et ``os.replace``."""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
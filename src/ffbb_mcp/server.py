@@ -1,16 +1,18 @@
 import asyncio
 import datetime
+import json
 import logging
 import os
 import platform
 import urllib.parse
+from collections.abc import Awaitable, Callable
 from functools import wraps
 from importlib.metadata import PackageNotFoundError as _PkgNotFound
 from importlib.metadata import version as _meta_version
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.fastmcp import Context
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.types import ToolAnnotations
 from pydantic import Field
@@ -25,11 +27,25 @@ from starlette.responses import (
 )
 
 from . import __version__ as _PACKAGE_VERSION
+from ._state import _env_flag
+from .admin import register_admin
+from .aliases import flush_acronym_cache, suggest_clubs
 from .dashboard import _build_dashboard_html
-from .metrics import generate_prometheus_metrics, get_snapshot
+from .deltas import classement_key, index_rows, rencontre_key
+from .metrics import (
+    generate_prometheus_metrics,
+    get_snapshot,
+    record_tool_invocation,
+    track_upstream_calls,
+)
+from .pagination import page_bounds, paginate
 from .prompts import ROUTING_PROMPT, register_prompts
-from .resources import register_resources
+from .resources import register_http_resources, register_resources
+from .response_cache import ResponseCachingFastMCP
 from .services import (
+    close_data_pack,
+    close_reference_store,
+    data_version,
     ffbb_bilan_service,
     ffbb_equipes_club_service,
     ffbb_get_classement_service,
@@ -45,8 +61,11 @@ from .services import (
     get_poule_service,
     get_saisons_service,
     handle_api_error,
+    load_organisme_index,
     multi_search_service,
+    open_data_pack,
     resolve_poule_id_service,
+    save_organisme_index,
     search_competitions_service,
     search_engagements_service,
     search_formations_service,
@@ -56,17 +75,30 @@ from .services import (
     search_salles_service,
     search_terrains_service,
     search_tournois_service,
+    snapshot_delta,
+    typeahead_service,
 )
+from .subscriptions import register_subscriptions, subscriptions
 from .utils import format_team_name, is_match_day, prune_payload
 
 
 def zipai_surgical(func: Any) -> Any:
-    """Élague le payload retourné (la directive ZipAI est passée en instruction globale)."""
+    """Élague le payload retourné (la directive ZipAI est passée en instruction globale).
+
+    Compte aussi les appels FFBB amont déclenchés par l'invocation (métriques
+    par outil) ; avec FFBB_MCP_DEBUG_UPSTREAM=1, le détail par endpoint est
+    ajouté aux réponses dict sous ``_meta.upstream_calls``.
+    """
 
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        res = await func(*args, **kwargs)
-        return prune_payload(res)
+        with track_upstream_calls() as upstream:
+            res = await func(*args, **kwargs)
+        record_tool_invocation(func.__name__, sum(upstream.values()))
+        res = prune_payload(res)
+        if isinstance(res, dict) and _env_flag("FFBB_MCP_DEBUG_UPSTREAM"):
+            res = {**res, "_meta": {"upstream_calls": dict(upstream)}}
+        return res
 
     return wrapper
 
@@ -143,7 +175,7 @@ else:
     # Désactivation automatique si wildcard présent (non supporté par le SDK MCP v1.x)
     _dns_protection = "*" not in _allowed_hosts and "*" not in _allowed_origins
 
-mcp: FastMCP = FastMCP(
+mcp: ResponseCachingFastMCP = ResponseCachingFastMCP(
     "FFBB MCP Server",
     instructions=(
         ROUTING_PROMPT + "\n\n" + "Données FFBB (basketball français). "
@@ -354,6 +386,15 @@ async def ffbb_version() -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+_SEARCH_PAGE_POOL = 100
+
+
+def _search_page(
+    results: list[dict[str, Any]], cursor: str | None, page_size: int | None
+) -> list[dict[str, Any]]:
+    return [paginate(results, cursor, page_size, data_version(results), "results")]
+
+
 @mcp.tool(
     name="ffbb_search",
     title="Recherche FFBB unifiée",
@@ -388,6 +429,25 @@ async def ffbb_search(
         list[str] | None,
         Field(description="Tri Meilisearch natif (ex: ['libelle:asc'])."),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            le=100,
+            description=(
+                "Active la pagination : nombre d'elements par page (plafonne a la "
+                "limite d'elagage, 50 par defaut). Reponse `{results, next_cursor, _total}`."
+            ),
+        ),
+    ] = None,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Curseur `next_cursor` de la page precedente (pagination par curseur)."
+            )
+        ),
+    ] = None,
 ) -> list[dict[str, Any]]:
     """Recherche FFBB — clubs, compétitions, matchs, salles, tournois, etc.
 
@@ -395,10 +455,16 @@ async def ffbb_search(
     type='organismes' → clubs uniquement.
     type='competitions' → compétitions uniquement.
     Résultats contiennent un 'id' à utiliser avec ffbb_get ou ffbb_club.
+    `page_size`/`cursor` paginent jusqu'à 100 résultats sans nouvelle recherche.
     """
     try:
+        paged = page_size is not None or cursor is not None
+        if paged:
+            # Les pages sont découpées dans un seul résultat en cache.
+            limit = _SEARCH_PAGE_POOL
         if type == "all":
-            return await multi_search_service(nom=query, limit=limit)
+            results = await multi_search_service(nom=query, limit=limit)
+            return _search_page(results, cursor, page_size) if paged else results
         dispatch = {
             "competitions": search_competitions_service,
             "organismes": search_organismes_service,
@@ -410,9 +476,41 @@ async def ffbb_search(
             "engagements": search_engagements_service,
             "formations": search_formations_service,
         }
-        return await dispatch[type](
+        results = await dispatch[type](
             nom=query, limit=limit, filter_by=filter_by, sort=sort
         )
+        return _search_page(results, cursor, page_size) if paged else results
+    except Exception as e:
+        raise handle_api_error(e) from e
+
+
+@mcp.tool(
+    name="ffbb_typeahead",
+    title="Autocomplétion clubs, compétitions et salles",
+    annotations=_READONLY_ANNOTATIONS,
+)
+@zipai_surgical
+async def ffbb_typeahead(
+    query: Annotated[
+        str, Field(description="Début de nom tapé (ex: 'stade cler', 'gerz').")
+    ],
+    types: Annotated[
+        list[Literal["organismes", "competitions", "salles"]] | None,
+        Field(description="Types proposés (défaut : les trois)."),
+    ] = None,
+    limit: Annotated[int, Field(default=10, ge=1, le=50)] = 10,
+) -> dict[str, Any]:
+    """Autocomplétion par préfixe sur les clubs, compétitions et salles déjà vus.
+
+    Répond localement (`source='local'`, sans appel réseau) ; si aucun nom connu
+    ne correspond, une recherche FFBB est lancée et l'index s'enrichit
+    (`source='upstream'`). À préférer à plusieurs `ffbb_search` successifs
+    pendant qu'on affine l'orthographe d'un nom.
+    """
+    try:
+        return await typeahead_service(
+            query, types=list(types) if types else None, limit=limit
+        )
     except Exception as e:
         raise handle_api_error(e) from e
 
@@ -485,6 +583,59 @@ async def ffbb_bilan(
 # ---------------------------------------------------------------------------
 
 
+def _format_poule_rows(
+    poule_data: dict[str, Any],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Classements et rencontres avec noms d'équipes formatés.
+
+    Copies : la poule en cache (et sa version) ne doit pas être modifiée.
+    """
+    formatted_classements = []
+    for c in poule_data.get("classements", []) or []:
+        eng = c.get("id_engagement", {}) or {}
+        nom = eng.get("nom", "")
+        num = eng.get("numero_equipe")
+        logo_id = (eng.get("logo") or {}).get("id")
+        formatted_classements.append(
+            {
+                **c,
+                "equipe": format_team_name(nom, num),
+                "logo_url": (
+                    f"https://api.ffbb.com/assets/{logo_id}?height=220&fit=contain&format=avif"
+                    if logo_id
+                    else None
+                ),
+            }
+        )
+
+    formatted_rencontres = []
+    for m in poule_data.get("rencontres", []) or []:
+        eng1 = m.get("idEngagementEquipe1", {}) or {}
+        eng2 = m.get("idEngagementEquipe2", {}) or {}
+        num1 = eng1.get("numeroEquipe") if isinstance(eng1, dict) else None
+        num2 = eng2.get("numeroEquipe") if isinstance(eng2, dict) else None
+        formatted_rencontres.append(
+            {
+                **m,
+                "nomEquipe1": format_team_name(m.get("nomEquipe1", ""), num1),
+                "nomEquipe2": format_team_name(m.get("nomEquipe2", ""), num2),
+            }
+        )
+    return formatted_classements, formatted_rencontres
+
+
+def _with_version(
+    id: int, type: str, data: dict[str, Any], since_version: str | None
+) -> dict[str, Any]:
+    """Ajoute ``_version`` ; réponse courte si ``since_version`` est à jour."""
+    version = data_version(data)
+    if version is None:
+        return data
+    if since_version == version:
+        return {"id": id, "type": type, "unchanged": True, "_version": version}
+    return {**data, "_version": version}
+
+
 @mcp.tool(
     name="ffbb_get",
     title="Ressource FFBB par identifiant",
@@ -512,6 +663,44 @@ async def ffbb_get(
             )
         ),
     ] = False,
+    since_version: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Version (`_version`) d'une reponse precedente. Si la ressource n'a "
+                "pas change, seule une reponse courte `unchanged=True` est renvoyee."
+            )
+        ),
+    ] = None,
+    delta: Annotated[
+        bool,
+        Field(
+            description=(
+                "Si True avec `since_version` et type='poule', ne renvoie que les "
+                "rencontres et lignes de classement modifiees depuis cette version "
+                "(`delta=True`), ou la poule complete si la version est inconnue."
+            )
+        ),
+    ] = False,
+    page_size: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            le=100,
+            description=(
+                "Active la pagination : nombre d'elements par page (plafonne a la "
+                "limite d'elagage, 50 par defaut). Reponse `{rencontres, next_cursor, _total}`."
+            ),
+        ),
+    ] = None,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Curseur `next_cursor` de la page precedente (pagination par curseur)."
+            )
+        ),
+    ] = None,
 ) -> dict[str, Any]:
     """Recupere une ressource FFBB par identifiant.
 
@@ -519,52 +708,80 @@ async def ffbb_get(
     - `type="poule"` charge la poule (classements + rencontres).
     - `type="organisme"` charge les details d'un club.
 
-    ⚠️ Attention: `type="poule"` peut être tronqué si la poule est grande.
-    Pour un calendrier exhaustif, préférez `ffbb_club(action="calendrier")`.
+    Chaque reponse porte `_version` (empreinte du contenu) : la repasser dans
+    `since_version` evite de re-telecharger une ressource inchangee ; avec
+    `delta=True` (poule), seules les lignes modifiees sont renvoyees
+    (`rencontres`, `classements`, identifiants disparus dans `*_removed`).
+
+    ⚠️ Attention: `type="poule"` peut être tronqué si la poule est grande :
+    paginer avec `page_size`/`cursor` (sans `delta`), ou préférer
+    `ffbb_club(action="calendrier")`.
 
     Avertissement: ne pas utiliser pour obtenir un score ou un prochain match.
     Utiliser `ffbb_last_result` et `ffbb_next_match` a la place.
     """
     try:
         if type == "competition":
-            return await get_competition_service(competition_id=id)
+            data = await get_competition_service(competition_id=id)
+            return _with_version(id, type, data, since_version)
         elif type == "poule":
+            paged = page_size is not None or cursor is not None
+            if paged and delta:
+                return {"error": _DELTA_PAGINATION_ERROR}
             effective_refresh = force_refresh or is_match_day()
-            poule_data = await get_poule_service(id, force_refresh=effective_refresh)
-
-            # Formatage des noms d'équipes dans les classements
-            classements = poule_data.get("classements", [])
-            formatted_classements = []
-            for c in classements or []:
-                eng = c.get("id_engagement", {}) or {}
-                nom = eng.get("nom", "")
-                num = eng.get("numero_equipe")
-                c["equipe"] = format_team_name(nom, num)
-                logo_id = (eng.get("logo") or {}).get("id")
-                c["logo_url"] = (
-                    f"https://api.ffbb.com/assets/{logo_id}?height=220&fit=contain&format=avif"
-                    if logo_id
-                    else None
+            poule_data = await get_poule_service(
+                id, force_refresh=effective_refresh, full=True, thaw=force_refresh
+            )
+            version = data_version(poule_data)
+            if since_version and since_version == version:
+                return {"id": id, "type": type, "unchanged": True, "_version": version}
+
+            if paged:
+                # Seule la page de rencontres est formatée.
+                rencontres = poule_data.get("rencontres", []) or []
+                start, end, meta = page_bounds(
+                    cursor, page_size, version, len(rencontres)
                 )
-                formatted_classements.append(c)
-
-            # Formatage des noms d'équipes dans les rencontres
-            rencontres = poule_data.get("rencontres", [])
-            formatted_rencontres = []
-            for m in rencontres or []:
-                eng1 = m.get("idEngagementEquipe1", {}) or {}
-                eng2 = m.get("idEngagementEquipe2", {}) or {}
-                num1 = eng1.get("numeroEquipe") if isinstance(eng1, dict) else None
-                num2 = eng2.get("numeroEquipe") if isinstance(eng2, dict) else None
-                m["nomEquipe1"] = format_team_name(m.get("nomEquipe1", ""), num1)
-                m["nomEquipe2"] = format_team_name(m.get("nomEquipe2", ""), num2)
-                formatted_rencontres.append(m)
+                classements, page = _format_poule_rows(
+                    {**poule_data, "rencontres": rencontres[start:end]}
+                )
+                return {
+                    "id": poule_data.get("id"),
+                    "nom": poule_data.get("libelle"),
+                    "classements": classements,
+                    "rencontres": page,
+                    **meta,
+                }
+
+            formatted_classements, formatted_rencontres = _format_poule_rows(poule_data)
+            if version is not None:
+                changes = snapshot_delta(
+                    f"poule:{id}",
+                    version,
+                    since_version if delta else None,
+                    lambda: {
+                        "rencontres": index_rows(formatted_rencontres, rencontre_key),
+                        "classements": index_rows(
+                            formatted_classements, classement_key
+                        ),
+                    },
+                )
+                if changes is not None:
+                    return {
+                        "id": id,
+                        "type": type,
+                        "delta": True,
+                        "since_version": since_version,
+                        "_version": version,
+                        **changes,
+                    }
 
             res = {
                 "id": poule_data.get("id"),
                 "nom": poule_data.get("libelle"),
                 "classements": formatted_classements,
                 "rencontres": formatted_rencontres,
+                "_version": version,
             }
             if formatted_rencontres:
                 max_limit = int(os.environ.get("FFBB_MAX_CALENDAR_MATCHES", "300"))
@@ -583,12 +800,75 @@ async def ffbb_get(
                     res["_total"] = total_matches
             return res
         elif type == "organisme":
-            return await get_organisme_service(organisme_id=id)
+            data = await get_organisme_service(organisme_id=id, full=True)
+            return _with_version(id, type, data, since_version)
         return {"error": f"Type inconnu: {type}"}
     except Exception as e:
         raise handle_api_error(e) from e
 
 
+# Un delta porte sur toutes les lignes modifiées : il n'est pas découpé en pages.
+_DELTA_PAGINATION_ERROR = (
+    "delta=True ne se combine pas avec page_size/cursor : utiliser l'un ou l'autre."
+)
+
+
+def _calendrier_progress(
+    ctx: Context[Any, Any, Any],
+) -> Callable[[dict[str, Any]], Awaitable[None]] | None:
+    """Émet chaque poule du calendrier dès son arrivée (notification de progression).
+
+    Le message porte le JSON des rencontres de la poule (non triées), puis
+    l'ordre final des identifiants : un client peut afficher ces résultats
+    partiels avant la réponse complète.
+
+    None sans ``progressToken``, et en Streamable HTTP avec ``json_response`` :
+    le transport n'y renvoie que la réponse finale et jette les notifications
+    émises avant (même limite que les abonnements, cf. subscriptions.py).
+    """
+    request_context = ctx.request_context
+    meta = request_context.meta
+    if meta is None or meta.progressToken is None:
+        return None
+    if request_context.request is not None and mcp.settings.json_response:
+        return None
+
+    async def on_chunk(chunk: dict[str, Any]) -> None:
+        payload = {k: v for k, v in chunk.items() if k not in ("done", "total")}
+        await ctx.report_progress(
+            chunk["done"],
+            total=chunk["total"],
+            message=json.dumps(payload, ensure_ascii=False, default=str),
+        )
+
+    return on_chunk
+
+
+def _calendrier_delta(
+    resource: str, calendrier: list[dict[str, Any]], since_version: str | None
+) -> dict[str, Any]:
+    """Enveloppe ``delta=True`` du calendrier club (cf. deltas.py)."""
+    version = data_version(calendrier)
+    if version is None:
+        return {"rencontres": calendrier}
+    if since_version == version:
+        return {"unchanged": True, "_version": version}
+    changes = snapshot_delta(
+        resource,
+        version,
+        since_version,
+        lambda: {"rencontres": index_rows(calendrier, rencontre_key)},
+    )
+    if changes is not None:
+        return {
+            "delta": True,
+            "since_version": since_version,
+            "_version": version,
+            **changes,
+        }
+    return {"_version": version, "rencontres": calendrier}
+
+
 # ---------------------------------------------------------------------------
 # TOOL 4 — Club unifié (remplace get_equipes_club + get_classement + get_calendrier_club)
 # ---------------------------------------------------------------------------
@@ -670,6 +950,45 @@ async def ffbb_club(
             )
         ),
     ] = False,
+    delta: Annotated[
+        bool,
+        Field(
+            description=(
+                "Avec action='calendrier' : reponse enveloppee "
+                "`[{_version, rencontres}]` ; avec `since_version`, seules les "
+                "rencontres modifiees depuis cette version sont renvoyees."
+            )
+        ),
+    ] = False,
+    since_version: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Version (`_version`) du dernier calendrier recu, utilisee avec "
+                "`delta=True`."
+            )
+        ),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            le=100,
+            description=(
+                "Active la pagination : nombre d'elements par page (plafonne a la "
+                "limite d'elagage, 50 par defaut). Reponse `{rencontres, next_cursor, _total}`."
+            ),
+        ),
+    ] = None,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Curseur `next_cursor` de la page precedente (pagination par curseur)."
+            )
+        ),
+    ] = None,
+    ctx: Context[Any, Any, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Outils agreges autour d'un club (calendrier, equipes, classement).
 
@@ -679,6 +998,10 @@ async def ffbb_club(
 
     ⚡ `action="calendrier"` est l'outil le plus fiable pour obtenir TOUTES les rencontres
     passées et futures d'une équipe/catégorie, sans les limitations de `ffbb_get(poule)`.
+    Pour un suivi en boucle, `delta=True` + `since_version` ne renvoie que les
+    rencontres modifiées depuis la dernière réponse. Au-delà de 300 matchs,
+    paginer avec `page_size`/`cursor` (pages découpées dans le calendrier en cache,
+    sans `delta`).
 
     Avertissement: ne pas utiliser pour obtenir un score ou un prochain match
     d'une equipe specifique. Utiliser `ffbb_last_result` et `ffbb_next_match` a la place.
@@ -691,11 +1014,13 @@ async def ffbb_club(
             orgs = await search_organismes_service(nom=club_name, limit=3)
 
             if not orgs:
-                return [
-                    {
-                        "error": f"Aucun club trouvé pour '{club_name}'. Vérifie l'orthographe ou utilise ffbb_search."
-                    }
-                ]
+                not_found: dict[str, Any] = {
+                    "error": f"Aucun club trouvé pour '{club_name}'. Vérifie l'orthographe ou utilise ffbb_search."
+                }
+                suggestions = suggest_clubs(club_name)
+                if suggestions:
+                    not_found["suggestions"] = suggestions
+                return [not_found]
 
             if len(orgs) > 1:
                 # Ambiguïté détectée : plusieurs candidats
@@ -719,16 +1044,41 @@ async def ffbb_club(
                 target_org_id = orgs[0].get("id")
 
         if action == "calendrier":
+            paged = page_size is not None or cursor is not None
             if not target_org_id and not club_name:
                 return [{"error": "Fournir organisme_id ou club_name"}]
+            if paged and delta:
+                return [{"error": _DELTA_PAGINATION_ERROR}]
             effective_refresh = force_refresh or is_match_day()
-            return await get_calendrier_club_service(
+            calendrier = await get_calendrier_club_service(
                 club_name=club_name,
                 organisme_id=target_org_id,
                 categorie=filtre,
                 numero_equipe=numero_equipe,
                 force_refresh=effective_refresh,
+                on_chunk=_calendrier_progress(ctx) if ctx else None,
+                truncate=not paged,
             )
+            if paged:
+                return [
+                    paginate(
+                        calendrier,
+                        cursor,
+                        page_size,
+                        data_version(calendrier),
+                        "rencontres",
+                    )
+                ]
+            if not delta:
+                return calendrier
+            return [
+                _calendrier_delta(
+                    f"calendrier:{target_org_id or club_name}:{filtre or ''}:"
+                    f"{numero_equipe or ''}",
+                    calendrier,
+                    since_version,
+                )
+            ]
         elif action == "equipes":
             if not target_org_id:
                 return [
@@ -1041,6 +1391,7 @@ async def ffbb_last_result(
         categorie=categorie,
         numero_equipe=numero_equipe,
         force_refresh=effective_refresh,
+        thaw=force_refresh,
     )
 
 
@@ -1170,6 +1521,7 @@ async def ffbb_bilan_saison(
             categorie=categorie,
             numero_equipe=numero_equipe,
             force_refresh=effective_refresh,
+            thaw=force_refresh,
         )
         if ctx:
             await ctx.report_progress(1, total=1, message="Bilan saison prêt.")
@@ -1184,6 +1536,9 @@ async def ffbb_bilan_saison(
 
 register_prompts(mcp)
 register_resources(mcp)
+register_http_resources(mcp)
+register_subscriptions(mcp)
+register_admin(mcp)
 
 
 # ---------------------------------------------------------------------------
@@ -1206,6 +1561,8 @@ def main() -> None:
         )
 
         mcp.settings.streamable_http_path = "/mcp"
+        # Sessions stateless : aucune notification ne peut être poussée.
+        subscriptions.enabled = not mcp.settings.stateless_http
         from ffbb_mcp.app_factory import create_app
 
         app = create_app(mcp, _allowed_origins)
@@ -1215,7 +1572,17 @@ def main() -> None:
         uvicorn.run(app, host=host, port=port, log_level="info")
     else:
         logger.info("Démarrage MCP FFBB en mode stdio...")
-        mcp.run(transport="stdio")
+        pack = open_data_pack()
+        if pack is not None:
+            logger.info("Pack de données projeté : %s", pack)
+        load_organisme_index()
+        try:
+            mcp.run(transport="stdio")
+        finally:
+            close_reference_store()
+            close_data_pack()
+            save_organisme_index()
+            flush_acronym_cache()
 
 
 if __name__ == "__main__":
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import inspect
+import json
 import logging
 import os
 import random
 import re
+import sqlite3
+import sys
+import threading
 import time
 import traceback
 import unicodedata
-from collections.abc import Callable, Coroutine  # noqa: TC003
+from collections.abc import Awaitable, Callable, Coroutine  # noqa: TC003
+from contextvars import ContextVar
+from dataclasses import fields
 from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
 from functools import lru_cache
-from typing import Any, TypeVar
+from typing import Any, NamedTuple, TypeVar
 from zoneinfo import ZoneInfo
 
 from cachetools import TLRUCache, TTLCache
@@ -19,22 +28,37 @@ from httpx import HTTPStatusError
 from mcp.shared.exceptions import ErrorData, McpError
 from mcp.types import INTERNAL_ERROR
 
-from ffbb_mcp._state import state
-from ffbb_mcp.aliases import enrich_acronym_cache, normalize_query
+from ffbb_mcp._state import _env_flag, _read_positive_int_env, state
+from ffbb_mcp.aliases import enrich_acronym_cache, normalize_query, suggest_clubs
 from ffbb_mcp.cache_strategy import get_poule_ttl, get_static_ttl
-from ffbb_mcp.client import get_client_async
+from ffbb_mcp.client import get_client_async, get_raw_json_async
+from ffbb_mcp.data_pack import DataPack, write_pack
+from ffbb_mcp.deltas import Snapshot  # noqa: TC001
 from ffbb_mcp.metrics import (
     dec_inflight,
     inc_inflight,
     record_cache_hit,
     record_cache_miss,
     record_call,
+    record_upstream_call,
 )
+from ffbb_mcp.projections import (
+    directus_fields,
+    model_include,
+    project,
+    project_payload,
+    projection_for,
+)
+from ffbb_mcp.reference_store import KINDS as REFERENCE_KINDS
+from ffbb_mcp.reference_store import ReferenceStore, reference_key, refresher
+from ffbb_mcp.search_index import OrganismeIndex, fold, write_atomic
 from ffbb_mcp.utils import (
     ParsedCategorie,
+    content_version,
     format_team_name,
     parse_categorie,
     serialize_model,
+    serialize_models,
 )
 
 logger = logging.getLogger("ffbb-mcp")
@@ -51,17 +75,6 @@ _PHASE_EXTRACT_PATTERN = re.compile(r"Phase\s*(\d+)", re.IGNORECASE)
 _NUMERIC_EXTRACT_PATTERN = re.compile(r"(\d+)")
 
 
-def _read_positive_int_env(name: str, default: int) -> int:
-    raw = os.environ.get(name)
-    if raw is None:
-        return default
-    try:
-        value = int(raw)
-        return value if value > 0 else default
-    except (TypeError, ValueError):
-        return default
-
-
 # Limiter globalement le nombre d'appels concurrents vers l'API FFBB.
 # Valeur par défaut prudente, surchargable via l'env MAX_CONCURRENT_FFBB.
 _MAX_CONCURRENT_FFBB = int(os.getenv("MAX_CONCURRENT_FFBB", "8"))
@@ -178,6 +191,10 @@ state.cache_calendrier = TTLCache(
 state.cache_bilan = TLRUCache(maxsize=64, ttu=_ttu_bilan)
 state.cache_poule = TLRUCache(maxsize=128, ttu=_ttu_poule)
 state.cache_classement = TLRUCache(maxsize=128, ttu=_ttu_poule)
+state.cache_response = TTLCache(
+    maxsize=256,
+    ttl=_read_positive_int_env("FFBB_CACHE_TTL_RESPONSE", get_static_ttl("response")),
+)
 _inflight_lock: asyncio.Lock | None = None
 state.inflight_detail = {}
 state.inflight_search = {}
@@ -218,6 +235,55 @@ def get_cache_ttls() -> dict[str, int]:
 
 _MAX_POULE_FETCH_CONCURRENCY = _read_positive_int_env("FFBB_POULE_FETCH_CONCURRENCY", 8)
 
+# Mode JSON brut (FFBB_RAW_JSON=1) : poules et organismes sont lus directement
+# sur l'API Directus et décodés en dict, sans construire puis re-sérialiser les
+# modèles Pydantic du client. La variante complète demande `*.*.*` (profondeur
+# des modèles : rencontres -> engagements, engagements -> compétition ->
+# catégorie) ; la variante projetée ne demande que les champs de la projection.
+_RAW_JSON_ENABLED = _env_flag("FFBB_RAW_JSON")
+# Raffinement local des recherches : une requête plus longue est filtrée dans
+# le résultat complet d'un de ses préfixes déjà en cache (cf. _search_reuse).
+_SEARCH_PREFIX_REFINE = _env_flag("FFBB_SEARCH_PREFIX_REFINE")
+_RAW_ENDPOINTS: dict[str, tuple[str, dict[str, Any]]] = {
+    "poule": ("items/ffbbserver_poules/{id}", {"deep[rencontres][_limit]": 1000}),
+    "organisme": (
+        "items/ffbbserver_organismes/{id}",
+        {"deep[engagements][_limit]": 1000},
+    ),
+}
+
+
+def _raw_params(kind: str, *, full: bool) -> dict[str, Any]:
+    base = _RAW_ENDPOINTS[kind][1]
+    spec = projection_for(kind)
+    if full or spec is None:
+        return {"fields": "*.*.*", **base}
+    return {"fields": ",".join(directus_fields(spec)), **base}
+
+
+async def _fetch_raw_item(
+    kind: str, item_id: int, *, full: bool = False
+) -> dict | None:
+    """Lit un objet en JSON brut ; None si désactivé ou en échec (repli modèle)."""
+    if not _RAW_JSON_ENABLED:
+        return None
+    path = _RAW_ENDPOINTS[kind][0]
+    params = _raw_params(kind, full=full)
+    try:
+        payload = await _with_ffbb_semaphore(
+            _safe_call_with_inflight(
+                f"{kind.capitalize()} {item_id} (raw)",
+                lambda: get_raw_json_async(path.format(id=item_id), params),
+                endpoint=kind,
+                retries=1,
+            )
+        )
+    except Exception as e:
+        logger.warning("Mode JSON brut indisponible pour %s %s : %s", kind, item_id, e)
+        return None
+    data = payload.get("data") if isinstance(payload, dict) else None
+    return data if isinstance(data, dict) else None
+
 
 async def _with_ffbb_semaphore(coro):
     """Helper pour exécuter un appel réseau FFBB sous le sémaphore global.
@@ -230,6 +296,26 @@ async def _with_ffbb_semaphore(coro):
         return await coro
 
 
+# Entrées de caches services lues pendant l'appel d'outil en cours, indexées
+# par (nom du cache, clé) -> valeur : le cache réponse en garde les versions
+# pour valider une réponse servie (cf. response_cache.py). Comme pour les
+# compteurs de metrics.py, le dict est partagé par référence avec les tâches
+# créées pendant l'appel.
+_read_deps: ContextVar[dict[tuple[str, Any], Any] | None] = ContextVar(
+    "ffbb_read_deps", default=None
+)
+
+
+def _record_read(cache: Any, key: Any, value: Any) -> None:
+    deps = _read_deps.get()
+    if deps is None:
+        return
+    for name, candidate in _iter_caches():
+        if candidate is cache:
+            deps[(name, key)] = value
+            return
+
+
 def _cache_get(
     cache: TTLCache | TLRUCache | None, key: Any, cache_name: str
 ) -> Any | None:
@@ -243,6 +329,10 @@ def _cache_get(
     value = cache.get(key)
     if value is not None:
         _notify_cache_hit(cache_name)
+        hits = state.cache_key_hits.setdefault(id(cache), {})
+        hits[key] = hits.get(key, 0) + 1
+        if cache_name != "response":
+            _record_read(cache, key, value)
     else:
         _notify_cache_miss(cache_name)
     return value
@@ -253,9 +343,242 @@ def _cache_set(
 ) -> None:
     if hasattr(cache, "__setitem__"):
         cache[key] = value  # type: ignore[index]
+        inserted = state.cache_inserted_at.setdefault(id(cache), {})
+        inserted[key] = time.time()
+        if len(inserted) > 2 * cache.maxsize:  # type: ignore[union-attr]
+            _prune_cache_meta(cache)
+        if cache_name != "response":
+            _record_read(cache, key, value)
     # Le miss correspondant a déjà été enregistré dans _cache_get.
 
 
+def _prune_cache_meta(cache: Any) -> None:
+    """Oublie les métadonnées d'introspection des clés évincées du cache."""
+    live = set(cache.keys())
+    hits = state.cache_key_hits.get(id(cache))
+    if hits:
+        state.cache_key_hits[id(cache)] = {k: n for k, n in hits.items() if k in live}
+    inserted = state.cache_inserted_at.get(id(cache))
+    if inserted:
+        state.cache_inserted_at[id(cache)] = {
+            k: t for k, t in inserted.items() if k in live
+        }
+
+
+# ---------------------------------------------------------------------------
+# Introspection et invalidation des caches (admin)
+# ---------------------------------------------------------------------------
+
+_CACHE_NAMES = (
+    "lives",
+    "search",
+    "detail",
+    "calendrier",
+    "bilan",
+    "classement",
+    "poule",
+    "response",
+)
+
+
+def _iter_caches(only: str | None = None):
+    for name in _CACHE_NAMES:
+        if only is not None and name != only:
+            continue
+        cache = getattr(state, f"cache_{name}", None)
+        if cache is not None:
+            yield name, cache
+
+
+def _estimate_bytes(value: Any) -> int:
+    """Taille approximative d'une entrée (JSON compact sérialisé)."""
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _estimate_response_bytes(entry: Any) -> int:
+    """Taille d'une réponse d'outil en cache : son texte JSON déjà encodé."""
+    return sum(len(getattr(block, "text", "") or "") for block in entry[0].content)
+
+
+def _cache_snapshot() -> list[tuple[str, Any, list[Any], dict, dict]]:
+    """Copie des entrées et métadonnées de chaque cache, prise sur la boucle.
+
+    Les caches ne sont pas thread-safe : la mesure (sérialisation) travaille
+    ensuite sur cette copie, hors de la boucle.
+    """
+    snapshot = []
+    for name, cache in _iter_caches():
+        cache.expire()
+        snapshot.append(
+            (
+                name,
+                int(cache.maxsize),
+                list(cache.items()),
+                dict(state.cache_inserted_at.get(id(cache), {})),
+                dict(state.cache_key_hits.get(id(cache), {})),
+            )
+        )
+    return snapshot
+
+
+def _measure_caches(
+    snapshot: list[tuple[str, Any, list[Any], dict, dict]], top: int
+) -> dict[str, Any]:
+    now = time.time()
+    caches: dict[str, Any] = {}
+    for name, maxsize, items, inserted, hits in snapshot:
+        ages = [now - inserted[k] for k, _ in items if k in inserted]
+        top_keys = sorted(
+            (k for k, _ in items), key=lambda k: hits.get(k, 0), reverse=True
+        )[:top]
+        caches[name] = {
+            "size": len(items),
+            "maxsize": maxsize,
+            "bytes_estimate": sum(
+                _estimate_response_bytes(v)
+                if name == "response"
+                else _estimate_bytes(v)
+                for _, v in items
+            ),
+            "oldest_age_seconds": round(max(ages), 1) if ages else None,
+            "top_keys": [
+                {
+                    "key": str(k),
+                    "hits": hits.get(k, 0),
+                    "age_seconds": round(now - inserted[k], 1)
+                    if k in inserted
+                    else None,
+                }
+                for k in top_keys
+            ],
+        }
+    return caches
+
+
+def _cache_stats_meta() -> dict[str, Any]:
+    inflight = {
+        f.name.removeprefix("inflight_"): len(getattr(state, f.name))
+        for f in fields(state)
+        if f.name.startswith("inflight_")
+    }
+    return {"inflight": inflight, "ttls": get_cache_ttls(), "frozen": len(state.frozen)}
+
+
+def get_cache_stats(top: int = 10) -> dict[str, Any]:
+    """Retourne l'état des caches service-level (taille, octets, âge, top clés).
+
+    L'estimation en octets sérialise chaque entrée : à réserver à l'admin,
+    pas au chemin chaud. Depuis la boucle, utiliser ``get_cache_stats_async``.
+    """
+    stats = {"caches": _measure_caches(_cache_snapshot(), top), **_cache_stats_meta()}
+    store = _reference_store()
+    if store is not None:
+        stats["reference"] = store.stats()
+    return stats
+
+
+async def get_cache_stats_async(top: int = 10) -> dict[str, Any]:
+    """``get_cache_stats`` sans bloquer la boucle : la copie des caches est
+    prise sur la boucle, la sérialisation et la lecture SQLite dans un thread.
+    """
+    snapshot = _cache_snapshot()
+    stats = {"caches": {}, **_cache_stats_meta()}
+    store = await open_reference_store_async()
+
+    def _blocking() -> None:
+        stats["caches"] = _measure_caches(snapshot, top)
+        if store is not None:
+            stats["reference"] = store.stats()
+
+    await asyncio.to_thread(_blocking)
+    return stats
+
+
+def _cache_key_matches(key: Any, pattern: str) -> bool:
+    key_str = str(key)
+    if any(c in pattern for c in "*?["):
+        return fnmatchcase(key_str, pattern)
+    # Préfixe aligné sur les segments : "poule:12" ne vise pas "poule:123".
+    return key_str == pattern or key_str.startswith(pattern + ":")
+
+
+# Types d'entrées persistées (base de référence, palier figé) par cache visé.
+_PERSISTED_KINDS: dict[str, tuple[str, ...]] = {
+    "detail": REFERENCE_KINDS,
+    "poule": ("poule",),
+    "classement": ("classement",),
+}
+
+
+def invalidate_cache(
+    pattern: str, cache_name: str | None = None, *, reference: bool = True
+) -> dict[str, int]:
+    """Supprime les entrées dont la clé correspond à `pattern`.
+
+    `pattern` est un préfixe de clé (``poule:123``) ou un motif glob dès qu'il
+    contient ``*``, ``?`` ou ``[`` (``organisme:*``, ``*``). Retourne le nombre
+    d'entrées supprimées par cache. Sauf ``reference=False``, les entrées
+    persistées qui correspondent (base de référence ``FFBB_REFERENCE_DB``,
+    poules et classements figés) sont aussi supprimées quand leur cache est
+    visé : sinon la relecture servirait la même donnée.
+    """
+    pattern = (pattern or "").strip()
+    if not pattern:
+        raise McpError(
+            error=ErrorData(
+                code=INTERNAL_ERROR,
+                message="Motif d'invalidation vide (ex: 'poule:123', 'organisme:*').",
+            )
+        )
+    if cache_name is not None and cache_name not in _CACHE_NAMES:
+        raise McpError(
+            error=ErrorData(
+                code=INTERNAL_ERROR,
+                message=(
+                    f"Cache inconnu: '{cache_name}'. "
+                    f"Valeurs possibles: {', '.join(_CACHE_NAMES)}."
+                ),
+            )
+        )
+    removed: dict[str, int] = {}
+    for name, cache in _iter_caches(cache_name):
+        keys = [k for k in list(cache.keys()) if _cache_key_matches(k, pattern)]
+        for k in keys:
+            cache.pop(k, None)
+        if keys:
+            _prune_cache_meta(cache)
+        removed[name] = len(keys)
+    if reference:
+        kinds = {
+            kind
+            for name, names in _PERSISTED_KINDS.items()
+            if cache_name in (None, name)
+            for kind in names
+        }
+
+        def _persisted(key: str) -> bool:
+            return key.partition(":")[0] in kinds and _cache_key_matches(key, pattern)
+
+        # Le pack est en lecture seule : les entrées visées y sont masquées.
+        if kinds:
+            state.data_pack_masks.setdefault(pattern, set()).update(kinds)
+
+        frozen = [k for k in state.frozen if _persisted(k)]
+        for k in frozen:
+            del state.frozen[k]
+        if frozen:
+            removed["frozen"] = len(frozen)
+        store = _reference_store()
+        if store is not None and kinds:
+            keys = [k for k in store.list_keys() if _persisted(k)]
+            removed["reference"] = store.delete(keys) if keys else 0
+    logger.info("Invalidation cache '%s' : %s", pattern, removed)
+    return removed
+
+
 def _coerce_numeric_id(value: int | str, label: str) -> int:
     """Convertit un identifiant en entier avec message d'erreur explicite."""
     try:
@@ -355,6 +678,7 @@ async def _safe_call(
     operation_name: str,
     coro: Callable[[], Coroutine[Any, Any, Any]],
     *,
+    endpoint: str = "other",
     retries: int = 3,
     base_delay: float = 0.5,
     max_delay: float = 10.0,
@@ -363,6 +687,8 @@ async def _safe_call(
 
     `coro` peut être soit une coroutine (non-réessayable), soit un "callable"
     zéro-argument qui retourne une nouvelle coroutine (réessayable).
+    `endpoint` étiquette les appels amont (métriques et budget par outil) ;
+    chaque tentative compte comme un appel.
     """
     logger.info(f"Début exécution: {operation_name}")
 
@@ -375,6 +701,7 @@ async def _safe_call(
     last_exc: Exception | None = None
     for attempt in range(1, max(1, retries) + 1):
         t0 = time.time()
+        record_upstream_call(endpoint)
         try:
             current_coro = make_coro()
             result = await current_coro
@@ -436,6 +763,7 @@ async def _safe_call_with_inflight(
     operation_name: str,
     coro_factory,
     *,
+    endpoint: str = "other",
     retries: int = 3,
     base_delay: float = 0.5,
     max_delay: float = 10.0,
@@ -450,6 +778,7 @@ async def _safe_call_with_inflight(
         return await _safe_call(
             operation_name,
             coro_factory,
+            endpoint=endpoint,
             retries=retries,
             base_delay=base_delay,
             max_delay=max_delay,
@@ -516,31 +845,55 @@ async def get_lives_service() -> list[dict]:
     client = await get_client_async()
     lives = await _with_ffbb_semaphore(
         _safe_call_with_inflight(
-            "Lives (Matchs en cours)", lambda: client.get_lives_async()
+            "Lives (Matchs en cours)",
+            lambda: client.get_lives_async(),
+            endpoint="lives",
         )
     )
     lives_list = lives if isinstance(lives, list) else []
-    result = [serialize_model(live) for live in lives_list]
+    result = serialize_models(lives_list)
     _cache_set(state.cache_lives, "lives", result, "lives")
     return result
 
 
+async def _fetch_saisons_upstream(active_only: bool) -> list[dict]:
+    client = await get_client_async()
+    saisons = await _with_ffbb_semaphore(
+        _safe_call_with_inflight(
+            "Saisons",
+            lambda: client.get_saisons_async(active_only=active_only),
+            endpoint="saisons",
+        )
+    )
+    saisons_list = saisons if isinstance(saisons, list) else []
+    return serialize_models(saisons_list)
+
+
 async def get_saisons_service(active_only: bool = False) -> list[dict]:
     cache_key = f"saisons:{active_only}"
     cached = _cache_get(state.cache_detail, cache_key, "saisons")
     if cached is not None:
         return cached
 
+    result = await _reference_get(cache_key)
+    if result is None:
+        result = await _fetch_saisons_upstream(active_only)
+        if result:
+            await _reference_put(cache_key, result)
+    _cache_set(state.cache_detail, cache_key, result, "saisons")
+    return result
+
+
+async def _fetch_competition_upstream(competition_id: int) -> dict:
     client = await get_client_async()
-    saisons = await _with_ffbb_semaphore(
+    comp = await _with_ffbb_semaphore(
         _safe_call_with_inflight(
-            "Saisons", lambda: client.get_saisons_async(active_only=active_only)
-        )
+            f"Competition {competition_id}",
+            lambda: client.get_competition_async(competition_id=competition_id),
+            endpoint="competition",
+        ),
     )
-    saisons_list = saisons if isinstance(saisons, list) else []
-    result = [serialize_model(s) for s in saisons_list]
-    _cache_set(state.cache_detail, cache_key, result, "saisons")
-    return result
+    return serialize_model(comp) or {}
 
 
 async def get_competition_service(competition_id: int | str) -> dict:
@@ -548,36 +901,121 @@ async def get_competition_service(competition_id: int | str) -> dict:
     cache_key = f"competition:{competition_id_int}"
 
     async def _fetch() -> dict:
-        client = await get_client_async()
-        comp = await _with_ffbb_semaphore(
-            _safe_call_with_inflight(
-                f"Competition {competition_id_int}",
-                lambda: client.get_competition_async(competition_id=competition_id_int),
-            ),
-        )
-        return serialize_model(comp) or {}
+        data = await _reference_get(cache_key)
+        if data is None:
+            data = _pack_get("competition", competition_id_int)
+        if data is None:
+            data = await _fetch_competition_upstream(competition_id_int)
+            if data:
+                await _reference_put(cache_key, data)
+        _typeahead_learn("competitions", [data])
+        return data
 
     return await _dedupe_inflight_detail(cache_key, _fetch, cache_name="competition")
 
 
+_MAX_CONTENT_VERSIONS = 512
+
+
+def data_version(data: Any) -> str | None:
+    """Version (empreinte de contenu) d'un payload renvoyé par un service.
+
+    Les payloads en cache ne sont jamais modifiés : l'empreinte est calculée
+    une seule fois par objet puis relue à chaque appel servi depuis le cache.
+    None pour un payload vide.
+    """
+    if not data:
+        return None
+    memo = state.content_versions.get(id(data))
+    if memo is not None and memo[0] is data:
+        return memo[1]
+    version = content_version(data)
+    if len(state.content_versions) >= _MAX_CONTENT_VERSIONS:
+        state.content_versions.clear()
+    state.content_versions[id(data)] = (data, version)
+    return version
+
+
+def snapshot_delta(
+    resource: str,
+    version: str,
+    since_version: str | None,
+    build: Callable[[], Snapshot],
+) -> dict[str, list[Any]] | None:
+    """Mémorise le snapshot servi pour ``version`` (cf. deltas.py).
+
+    Renvoie les lignes modifiées depuis ``since_version``, ou None si aucun
+    delta n'est demandé ou si cette version n'est plus dans l'historique.
+    """
+    state.snapshots.record(resource, version, build)
+    if not since_version:
+        return None
+    return state.snapshots.delta(resource, since_version, version)
+
+
+def _dump_projected(kind: str, model: Any, full: bool) -> dict:
+    """Modèle du client -> dict, réduit à la projection de ``kind`` sauf ``full``.
+
+    Pour un modèle pydantic, la projection est passée à ``model_dump``
+    (``include``) : les champs écartés ne sont ni sérialisés ni reparcourus.
+    """
+    spec = None if full else projection_for(kind)
+    if spec is not None and hasattr(model, "model_dump"):
+        include = model_include(model, spec)
+        if include is not None:
+            return model.model_dump(mode="json", include=include)
+    data = serialize_model(model) or {}
+    return data if spec is None else project(data, spec)
+
+
+async def _fetch_poule_upstream(poule_id: int, full: bool) -> dict:
+    """Poule lue chez la FFBB, déjà projetée sauf ``full``."""
+    data = await _fetch_raw_item("poule", poule_id, full=full)
+    if data is not None:
+        return data if full else project_payload("poule", data)
+    client = await get_client_async()
+    poule = await _with_ffbb_semaphore(
+        _safe_call_with_inflight(
+            f"Poule {poule_id}",
+            lambda: client.get_poule_async(poule_id=poule_id),
+            endpoint="poule",
+        ),
+    )
+    return _dump_projected("poule", poule, full) if poule else {}
+
+
 async def get_poule_service(
-    poule_id: int | str, *, force_refresh: bool = False
+    poule_id: int | str,
+    *,
+    force_refresh: bool = False,
+    full: bool = False,
+    thaw: bool | None = None,
 ) -> dict:
+    """Poule enrichie (rencontres restantes par équipe, phase terminée).
+
+    Par défaut la poule est réduite à la projection ``POULE_PROJECTION`` avant
+    mise en cache ; ``full=True`` conserve tous les champs de l'API (entrée de
+    cache distincte, suffixe ``:full``).
+
+    ``thaw`` (par défaut ``force_refresh``) relit aussi une poule figée : un
+    rafraîchissement dû au seul jour de match (``thaw=False``) la sert figée.
+    """
     poule_id_int = _coerce_numeric_id(poule_id, "poule_id")
-    cache_key = f"poule:{poule_id_int}"
+    cache_key = f"poule:{poule_id_int}:full" if full else f"poule:{poule_id_int}"
+    thaw = force_refresh if thaw is None else thaw
 
     if force_refresh and state.cache_poule is not None:
         state.cache_poule.pop(cache_key, None)
 
     async def _fetch() -> dict:
-        client = await get_client_async()
-        poule = await _with_ffbb_semaphore(
-            _safe_call_with_inflight(
-                f"Poule {poule_id_int}",
-                lambda: client.get_poule_async(poule_id=poule_id_int),
-            ),
-        )
-        data = serialize_model(poule) or {}
+        frozen = None if thaw else await _frozen_get(cache_key)
+        if frozen is not None:
+            return {"_ttl": _FROZEN_TTL, "data": frozen}
+        data = None if thaw else _pack_get("poule", poule_id_int)
+        if data is not None and not full:
+            data = project_payload("poule", data)
+        if data is None:
+            data = await _fetch_poule_upstream(poule_id_int, full)
 
         # Enrichissement : rencontres non jouées (joue=0) groupées par équipe.
         # Permet au LLM de savoir sans ambiguïté si une phase est terminée
@@ -601,7 +1039,24 @@ async def get_poule_service(
                     )
         data["rencontres_restantes_par_equipe"] = restantes_par_equipe
         data["phase_terminee"] = len(restantes_par_equipe) == 0
+        _index_team_names(rencontres)
+
+        # Tri par date/heure avant mise en cache : l'entrée en cache n'est
+        # plus jamais modifiée ensuite (sa version reste valide).
+        if rencontres:
+            rencontres.sort(
+                key=lambda r: (
+                    r.get("date_reelle") or "9999",
+                    r.get("heure_reelle") or "9999",
+                )
+            )
 
+        if poule_is_finished(data):
+            await _frozen_put(cache_key, data)
+            return {"_ttl": _FROZEN_TTL, "data": data}
+        if thaw:
+            # Phase rouverte (rencontre ajoutée ou reprogrammée) : dégel.
+            await _frozen_drop(cache_key)
         # Calculate dynamic TTL
         ttl = await get_poule_ttl(poule_id_int, get_lives_service)
         return {"_ttl": ttl, "data": data}
@@ -615,18 +1070,6 @@ async def get_poule_service(
         make_coro=_fetch,
         cache_name="poule",
     )
-    # PATCH 2: tri par date/heure
-    if isinstance(result, dict) and "data" in result:
-        rencontres = result["data"].get("rencontres", [])
-        if rencontres:
-            # On trie sur (date, heure) ; on gère les None
-            rencontres.sort(
-                key=lambda r: (
-                    r.get("date_reelle") or "9999",
-                    r.get("heure_reelle") or "9999",
-                )
-            )
-
     return (
         result.get("data", result)
         if isinstance(result, dict) and "_ttl" in result
@@ -634,19 +1077,48 @@ async def get_poule_service(
     )
 
 
-async def get_organisme_service(organisme_id: int | str) -> dict:
+async def _fetch_organisme_upstream(organisme_id: int, full: bool) -> tuple[dict, bool]:
+    """Organisme lu chez la FFBB ; le booléen indique un payload complet.
+
+    En mode JSON brut, la variante projetée ne demande que quelques champs.
+    """
+    data = await _fetch_raw_item("organisme", organisme_id, full=full)
+    if data is not None:
+        return data, full
+    client = await get_client_async()
+    org = await _with_ffbb_semaphore(
+        _safe_call_with_inflight(
+            f"Organisme {organisme_id}",
+            lambda: client.get_organisme_async(organisme_id=organisme_id),
+            endpoint="organisme",
+        ),
+    )
+    return serialize_model(org) or {}, True
+
+
+async def get_organisme_service(organisme_id: int | str, *, full: bool = False) -> dict:
+    """Organisme réduit à ``ORGANISME_PROJECTION`` (``full=True`` : tout)."""
     organisme_id_int = _coerce_numeric_id(organisme_id, "organisme_id")
-    cache_key = f"organisme:{organisme_id_int}"
+    cache_key = (
+        f"organisme:{organisme_id_int}:full"
+        if full
+        else f"organisme:{organisme_id_int}"
+    )
 
     async def _fetch() -> dict:
-        client = await get_client_async()
-        org = await _with_ffbb_semaphore(
-            _safe_call_with_inflight(
-                f"Organisme {organisme_id_int}",
-                lambda: client.get_organisme_async(organisme_id=organisme_id_int),
-            ),
-        )
-        return serialize_model(org) or {}
+        # L'instantané garde l'organisme complet : il sert aussi la projection.
+        data = await _reference_get(reference_key("organisme", organisme_id_int))
+        if data is None:
+            data = _pack_get("organisme", organisme_id_int)
+        if data is None:
+            data, complete = await _fetch_organisme_upstream(organisme_id_int, full)
+            if data and complete:
+                await _reference_put(reference_key("organisme", organisme_id_int), data)
+        _organisme_index().add(data)
+        _typeahead_learn("organismes", [data])
+        if data.get("nom"):
+            _team_key(str(data["nom"]))
+        return data if full else project_payload("organisme", data)
 
     return await _dedupe_inflight_detail(cache_key, _fetch, cache_name="organisme")
 
@@ -657,11 +1129,14 @@ async def ffbb_get_classement_service(
     force_refresh: bool = False,
     target_organisme_id: int | str | None = None,
     target_num: int | str | None = None,
+    thaw: bool | None = None,
 ) -> list[dict[str, Any]]:
+    """Classement aplati d'une poule (``thaw`` : cf. ``get_poule_service``)."""
     poule_id_int = _coerce_numeric_id(poule_id, "poule_id")
     cache_key = (
         f"classement:{poule_id_int}:{target_organisme_id or ''}:{target_num or ''}"
     )
+    thaw = force_refresh if thaw is None else thaw
 
     if not force_refresh:
         cached = _cache_get(state.cache_classement, cache_key, "classement")
@@ -672,16 +1147,32 @@ async def ffbb_get_classement_service(
                 else cached
             )
 
-    client = await get_client_async()
-    poule = await _with_ffbb_semaphore(
-        _safe_call(
-            f"Classement poule {poule_id_int}",
-            lambda: client.get_poule_async(poule_id=poule_id_int),
+    if not thaw:
+        frozen = await _frozen_get(cache_key)
+        if frozen is not None:
+            wrapped = {"_ttl": _FROZEN_TTL, "data": frozen}
+            _cache_set(state.cache_classement, cache_key, wrapped, "classement")
+            return frozen
+
+    data = None
+    if not thaw:
+        data = await _frozen_get(f"poule:{poule_id_int}")
+        if data is None:
+            data = _pack_get("poule", poule_id_int)
+    if data is None:
+        data = await _fetch_raw_item("poule", poule_id_int)
+    if data is None:
+        client = await get_client_async()
+        poule = await _with_ffbb_semaphore(
+            _safe_call(
+                f"Classement poule {poule_id_int}",
+                lambda: client.get_poule_async(poule_id=poule_id_int),
+                endpoint="poule",
+            )
         )
-    )
-    if not poule:
-        return []
-    data = serialize_model(poule)
+        if not poule:
+            return []
+        data = serialize_model(poule)
     raw = data.get("classements", data.get("classement", [])) or []
     if not isinstance(raw, list):
         raw = []
@@ -740,13 +1231,520 @@ async def ffbb_get_classement_service(
                 "hors_classement": c.get("hors_classement"),
             }
         )
-    # Calculate dynamic TTL using same logic as poule since it caches in state.cache_classement
-    ttl = await get_poule_ttl(poule_id_int, get_lives_service)
+    if poule_is_finished(data):
+        await _frozen_put(cache_key, flat)
+        ttl = _FROZEN_TTL
+    else:
+        if thaw:
+            await _frozen_drop(cache_key)
+        # Calculate dynamic TTL using same logic as poule since it caches in state.cache_classement
+        ttl = await get_poule_ttl(poule_id_int, get_lives_service)
     wrapped_flat = {"_ttl": ttl, "data": flat}
     _cache_set(state.cache_classement, cache_key, wrapped_flat, "classement")
     return flat
 
 
+# ---------------------------------------------------------------------------
+# Index local des organismes (résolution de noms sans Meilisearch)
+# ---------------------------------------------------------------------------
+
+# Requêtes mémorisées par portée (opération, filtre, tri) pour _search_reuse.
+_MAX_SEARCH_LIMITS = 4096
+# Sauvegarde sur disque toutes les N modifications de l'index.
+_ORG_INDEX_SAVE_EVERY = 50
+_org_index_save_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _organisme_index() -> OrganismeIndex:
+    """Index des organismes ; relu depuis ``FFBB_ORG_INDEX_PATH`` au premier
+    accès s'il n'a pas été chargé au démarrage (``load_organisme_index``)."""
+    return load_organisme_index()
+
+
+def load_organisme_index() -> OrganismeIndex:
+    """Charge l'index des organismes (lecture et décodage JSON, bloquant).
+
+    Le serveur l'appelle au démarrage, dans un thread (lifespan HTTP) ou avant
+    la boucle (stdio) : le premier appel d'outil ne relit pas le fichier.
+    """
+    index = state.organisme_index
+    if not state.organisme_index_loaded:
+        state.organisme_index_loaded = True
+        # Une réponse mémorisée ne survit pas au résultat de recherche qu'elle
+        # remplace.
+        if state.cache_search is not None:
+            index.query_ttl = float(state.cache_search.ttl)
+        path = os.environ.get("FFBB_ORG_INDEX_PATH")
+        if path:
+            index.load(path)
+            state.typeahead_index.add_many(
+                _typeahead_entry("organismes", org) for org in index.records()
+            )
+    return index
+
+
+def _schedule_organisme_index_save() -> None:
+    path = os.environ.get("FFBB_ORG_INDEX_PATH")
+    index = state.organisme_index
+    if not path or index.dirty < _ORG_INDEX_SAVE_EVERY:
+        return
+    # Copie sur la boucle (pas de mutation concurrente), encodage JSON et
+    # écriture en thread.
+    snapshot = index.snapshot()
+    task = asyncio.create_task(
+        asyncio.to_thread(lambda: write_atomic(path, OrganismeIndex.encode(snapshot)))
+    )
+    _org_index_save_tasks.add(task)
+    task.add_done_callback(_org_index_save_tasks.discard)
+
+
+def save_organisme_index() -> None:
+    """Écrit l'index des organismes s'il a changé (arrêt du serveur)."""
+    path = os.environ.get("FFBB_ORG_INDEX_PATH")
+    if path and state.organisme_index.dirty:
+        try:
+            state.organisme_index.save(path)
+        except OSError as e:
+            logger.warning("Sauvegarde de l'index organismes impossible : %s", e)
+
+
+# ---------------------------------------------------------------------------
+# Instantané des données de référence (cf. reference_store.py)
+# ---------------------------------------------------------------------------
+
+
+_reference_store_lock = threading.Lock()
+
+
+def open_reference_store() -> ReferenceStore | None:
+    """Ouvre la base ``FFBB_REFERENCE_DB`` (None si absente) ; idempotent.
+
+    Connexion, PRAGMA et schéma sont bloquants : depuis la boucle, passer par
+    ``open_reference_store_async``. Le verrou évite deux ouvertures
+    concurrentes depuis des threads.
+    """
+    with _reference_store_lock:
+        if not state.reference_store_loaded:
+            path = os.environ.get("FFBB_REFERENCE_DB")
+            if path:
+                try:
+                    state.reference_store = ReferenceStore(path)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning("Base de référence %s inutilisable : %s", path, e)
+            state.reference_store_loaded = True
+    return state.reference_store
+
+
+async def open_reference_store_async() -> ReferenceStore | None:
+    """Base de référence ouverte dans un thread, puis tâche de rafraîchissement.
+
+    Appelée au démarrage (lifespan HTTP) ; les services s'en servent aussi
+    au premier accès (stdio).
+    """
+    if not state.reference_store_loaded:
+        await asyncio.to_thread(open_reference_store)
+        if state.reference_store is not None:
+            refresher.start()
+    return state.reference_store
+
+
+def _reference_store() -> ReferenceStore | None:
+    """Base de référence pour les appelants synchrones (admin, outils en ligne
+    de commande), ouverte au premier accès."""
+    if not state.reference_store_loaded and open_reference_store() is not None:
+        # Hors boucle asyncio (outil en ligne de commande) : pas de tâche.
+        with contextlib.suppress(RuntimeError):
+            refresher.start()
+    return state.reference_store
+
+
+async def _reference_get(key: str) -> Any | None:
+    """Entrée de la base de référence, lue dans un thread.
+
+    Le verrou de la connexion est partagé avec les écritures (elles aussi en
+    thread) : la boucle n'attend jamais SQLite.
+    """
+    store = await open_reference_store_async()
+    if store is None:
+        return None
+    try:
+        data = await asyncio.to_thread(store.get, key)
+    except sqlite3.Error as e:
+        logger.warning("Lecture de %s dans la base de référence : %s", key, e)
+        return None
+    if data is None:
+        _notify_cache_miss("reference")
+    else:
+        _notify_cache_hit("reference")
+    return data
+
+
+async def _reference_put(key: str, data: Any) -> None:
+    store = await open_reference_store_async()
+    if store is None:
+        return
+    try:
+        await asyncio.to_thread(store.put, key, data)
+    except sqlite3.Error as e:
+        logger.warning("Écriture de %s dans la base de référence : %s", key, e)
+
+
+def close_reference_store() -> None:
+    """Ferme la base de référence (arrêt du serveur)."""
+    store, state.reference_store = state.reference_store, None
+    if store is not None:
+        store.close()
+
+
+async def _fetch_reference_upstream(kind: str, item_id: str) -> Any:
+    if kind == "organisme":
+        return (await _fetch_organisme_upstream(int(item_id), True))[0]
+    if kind == "competition":
+        return await _fetch_competition_upstream(int(item_id))
+    return await _fetch_saisons_upstream(item_id == "True")
+
+
+async def refresh_reference_store(*, max_age: float, batch: int = 50) -> dict[str, int]:
+    """Relit chez la FFBB les entrées plus vieilles que ``max_age`` secondes.
+
+    Au plus ``batch`` entrées par type. Seules les entrées dont le contenu a
+    changé sont réécrites et retirées de ``cache_detail``.
+    """
+    store = await open_reference_store_async()
+    result = {"checked": 0, "changed": 0}
+    if store is None:
+        return result
+    for kind in REFERENCE_KINDS:
+        for key in await asyncio.to_thread(store.stale, kind, max_age, batch):
+            try:
+                data = await _fetch_reference_upstream(kind, key.partition(":")[2])
+            except Exception as e:
+                logger.warning("Rafraîchissement de %s en échec : %s", key, e)
+                continue
+            result["checked"] += 1
+            # Réponse vide (entité retirée, panne partielle) : on garde l'ancienne.
+            if data and await asyncio.to_thread(store.put, key, data):
+                result["changed"] += 1
+                invalidate_cache(key, "detail", reference=False)
+    return result
+
+
+async def crawl_reference_store(
+    organisme_ids: list[int], regions: tuple[str, ...] = ()
+) -> dict[str, int]:
+    """Remplit la base de référence depuis la FFBB.
+
+    Lit chaque organisme (complet), ne garde que ceux dont le code commence
+    par une des ``regions`` (toutes si vide), puis les compétitions de leurs
+    engagements et les saisons. Renvoie le nombre d'entités écrites par type.
+    """
+    store = await open_reference_store_async()
+    if store is None:
+        raise McpError(
+            error=ErrorData(
+                code=INTERNAL_ERROR,
+                message="FFBB_REFERENCE_DB non défini : aucune base où écrire.",
+            )
+        )
+    counts = dict.fromkeys(REFERENCE_KINDS, 0)
+    competition_ids: set[int] = set()
+    for organisme_id in organisme_ids:
+        org, _ = await _fetch_organisme_upstream(organisme_id, True)
+        code = str(org.get("code") or "").upper()
+        if not org or (regions and not code.startswith(regions)):
+            continue
+        await asyncio.to_thread(
+            store.put, reference_key("organisme", organisme_id), org
+        )
+        counts["organisme"] += 1
+        for eng in org.get("engagements") or []:
+            comp = eng.get("idCompetition") if isinstance(eng, dict) else None
+            if isinstance(comp, dict) and comp.get("id"):
+                competition_ids.add(int(comp["id"]))
+    for competition_id in sorted(competition_ids):
+        comp_data = await _fetch_competition_upstream(competition_id)
+        if comp_data:
+            key = reference_key("competition", competition_id)
+            await asyncio.to_thread(store.put, key, comp_data)
+            counts["competition"] += 1
+    for active_only in (False, True):
+        saisons = await _fetch_saisons_upstream(active_only)
+        if saisons:
+            key = reference_key("saisons", active_only)
+            await asyncio.to_thread(store.put, key, saisons)
+            counts["saisons"] += 1
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Phases terminées (poules et classements figés)
+# ---------------------------------------------------------------------------
+
+# Une poule dont toutes les rencontres sont jouées ne change plus : son entrée
+# (et celles de ses classements) quitte les TTL dynamiques de get_poule_ttl pour
+# ce palier, persisté dans la base de référence quand elle existe. Seuls
+# force_refresh demandé explicitement (``thaw`` : relecture, puis nouveau gel)
+# et une invalidation (invalidate_cache, admin) la font relire chez la FFBB ;
+# le rafraîchissement des jours de match la sert figée.
+_FROZEN_TTL = 30 * 86400
+_MAX_FROZEN = 4096
+
+
+async def _frozen_get(key: str) -> Any | None:
+    """Entrée figée : mémoire d'abord, puis base de référence lue dans un thread."""
+    data = state.frozen.get(key)
+    if data is not None:
+        state.frozen.move_to_end(key)
+    else:
+        store = await open_reference_store_async()
+        try:
+            data = await asyncio.to_thread(store.get, key) if store else None
+        except sqlite3.Error as e:
+            logger.warning("Lecture de %s dans la base de référence : %s", key, e)
+            return None
+        if data is not None:
+            _remember_frozen(key, data)
+    if data is None:
+        _notify_cache_miss("frozen")
+    else:
+        _notify_cache_hit("frozen")
+    return data
+
+
+def _remember_frozen(key: str, data: Any) -> None:
+    state.frozen[key] = data
+    if len(state.frozen) > _MAX_FROZEN:
+        state.frozen.popitem(last=False)
+
+
+async def _frozen_put(key: str, data: Any) -> None:
+    previous = state.frozen.get(key)
+    _remember_frozen(key, data)
+    # Relecture au contenu inchangé : rien à réécrire dans la base.
+    if previous is not None and data_version(previous) == data_version(data):
+        return
+    await _reference_put(key, data)
+
+
+async def _frozen_drop(key: str) -> None:
+    state.frozen.pop(key, None)
+    store = await open_reference_store_async()
+    if store is None:
+        return
+    try:
+        await asyncio.to_thread(store.delete, [key])
+    except sqlite3.Error as e:
+        logger.warning("Suppression de %s dans la base de référence : %s", key, e)
+
+
+# ---------------------------------------------------------------------------
+# Pack de données projeté en mémoire (cf. data_pack.py)
+# ---------------------------------------------------------------------------
+
+
+def _data_pack() -> DataPack | None:
+    """Pack ``FFBB_DATA_PACK``, projeté au premier accès (None si absent)."""
+    if not state.data_pack_loaded:
+        state.data_pack_loaded = True
+        path = os.environ.get("FFBB_DATA_PACK")
+        if path:
+            try:
+                state.data_pack = DataPack(
+                    path,
+                    max_age=_read_positive_int_env("FFBB_DATA_PACK_MAX_AGE", 7 * 86400),
+                )
+            except (OSError, ValueError) as e:
+                logger.warning("Pack de données %s inutilisable : %s", path, e)
+    return state.data_pack
+
+
+def open_data_pack() -> dict[str, Any] | None:
+    """Projette le pack au démarrage d'un worker ; renvoie ses statistiques."""
+    pack = _data_pack()
+    return pack.stats() if pack is not None else None
+
+
+def close_data_pack() -> None:
+    pack, state.data_pack = state.data_pack, None
+    if pack is not None:
+        pack.close()
+
+
+def _pack_masked(kind: str, item_id: int) -> bool:
+    """Vrai si l'entrée a été invalidée depuis l'ouverture du pack."""
+    keys = [f"{kind}:{item_id}"]
+    if kind == "poule":
+        # Le classement est calculé depuis la poule du pack.
+        keys.append(f"classement:{item_id}")
+    return any(
+        key.partition(":")[0] in kinds and _cache_key_matches(key, pattern)
+        for pattern, kinds in state.data_pack_masks.items()
+        for key in keys
+    )
+
+
+def _pack_get(kind: str, item_id: int) -> Any | None:
+    pack = _data_pack()
+    if pack is None or not pack.fresh(kind) or _pack_masked(kind, item_id):
+        return None
+    data = pack.get(kind, item_id)
+    if data is None:
+        _notify_cache_miss("pack")
+    else:
+        _notify_cache_hit("pack")
+    return data
+
+
+def poule_is_finished(data: dict) -> bool:
+    """Vrai si la poule a des rencontres et qu'aucune n'est à jouer (joue=0)."""
+    rencontres = data.get("rencontres") or []
+    return bool(rencontres) and all(r.get("joue") not in (0, "0") for r in rencontres)
+
+
+async def build_data_pack(path: str, organisme_ids: list[int]) -> dict[str, int]:
+    """Construit le pack des organismes donnés, de leurs compétitions et de
+    leurs poules de phases terminées.
+
+    Les organismes et compétitions sont lus dans la base de référence quand
+    elle existe, sinon chez la FFBB ; les poules toujours chez la FFBB (une
+    poule encore en cours n'entre pas dans le pack).
+    """
+    entries: list[tuple[str, int, Any]] = []
+    competition_ids: set[int] = set()
+    poule_ids: set[int] = set()
+    for organisme_id in organisme_ids:
+        org = await _reference_get(reference_key("organisme", organisme_id))
+        if org is None:
+            org, _ = await _fetch_organisme_upstream(organisme_id, True)
+        if not org:
+            continue
+        entries.append(("organisme", organisme_id, org))
+        for eng in org.get("engagements") or []:
+            if not isinstance(eng, dict):
+                continue
+            for field_name, ids in (
+                ("idCompetition", competition_ids),
+                ("idPoule", poule_ids),
+            ):
+                ref = eng.get(field_name)
+                if isinstance(ref, dict) and ref.get("id"):
+                    ids.add(int(ref["id"]))
+    for competition_id in sorted(competition_ids):
+        comp = await _reference_get(reference_key("competition", competition_id))
+        if comp is None:
+            comp = await _fetch_competition_upstream(competition_id)
+        if comp:
+            entries.append(("competition", competition_id, comp))
+    counts = {"organisme": 0, "competition": 0, "poule": 0}
+    for poule_id in sorted(poule_ids):
+        poule = await _fetch_poule_upstream(poule_id, True)
+        if poule and poule_is_finished(poule):
+            entries.append(("poule", poule_id, poule))
+    for kind, _, _ in entries:
+        counts[kind] += 1
+    counts["bytes"] = await asyncio.to_thread(write_pack, path, entries)
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Autocomplétion locale (ffbb_typeahead)
+# ---------------------------------------------------------------------------
+
+TYPEAHEAD_TYPES = ("organismes", "competitions", "salles")
+
+
+def _typeahead_entry(operation: str, item: dict) -> tuple[str, dict[str, Any], str]:
+    name = str(item.get("nom") or item.get("libelle") or "")
+    record: dict[str, Any] = {"id": item.get("id"), "nom": name, "_type": operation}
+    for key in ("code", "ville"):
+        if item.get(key):
+            record[key] = item[key]
+    return f"{operation}:{item.get('id')}", record, f"{name} {record.get('code', '')}"
+
+
+def _typeahead_learn(operation: str, items: list[dict]) -> None:
+    """Ajoute à l'index d'autocomplétion les fiches vues (recherches, détails)."""
+    if operation not in TYPEAHEAD_TYPES:
+        return
+    for item in items:
+        if isinstance(item, dict) and item.get("id"):
+            state.typeahead_index.add(*_typeahead_entry(operation, item))
+
+
+async def typeahead_service(
+    query: str, types: list[str] | None = None, limit: int = 10
+) -> dict[str, Any]:
+    """Suggestions par préfixe depuis l'index local ; recherche amont si vide.
+
+    ``source`` vaut ``local`` (aucun appel réseau) ou ``upstream`` (les hits
+    amont alimentent l'index pour les frappes suivantes).
+    """
+    wanted = [t for t in TYPEAHEAD_TYPES if not types or t in types]
+
+    def accept(record: dict[str, Any]) -> bool:
+        return record["_type"] in wanted
+
+    results = state.typeahead_index.search(query, limit, accept)
+    if results:
+        _notify_cache_hit("typeahead")
+        return {"results": results, "source": "local"}
+    _notify_cache_miss("typeahead")
+    if len(fold(query).replace(" ", "")) < 2:
+        return {"results": [], "source": "local"}
+
+    searches = {
+        "organismes": search_organismes_service,
+        "competitions": search_competitions_service,
+        "salles": search_salles_service,
+    }
+    found = await asyncio.gather(
+        *(searches[t](nom=query, limit=limit) for t in wanted),
+        return_exceptions=True,
+    )
+    results = state.typeahead_index.search(query, limit, accept)
+    if not results:
+        # Hits amont hors préfixe (fautes de frappe corrigées par Meilisearch).
+        results = [
+            _typeahead_entry(t, hit)[1]
+            for t, hits in zip(wanted, found, strict=True)
+            if isinstance(hits, list)
+            for hit in hits
+            if isinstance(hit, dict) and hit.get("id")
+        ][:limit]
+    return {"results": results, "source": "upstream"}
+
+
+async def _search_organismes_indexed(nom: str, limit: int) -> list[dict]:
+    """``search_organismes_service`` servi par l'index local quand il sait répondre."""
+    hits = _organisme_index().resolve(normalize_query(nom), limit)
+    if hits is not None:
+        _notify_cache_hit("org_index")
+        return hits
+    _notify_cache_miss("org_index")
+    return await search_organismes_service(nom=nom, limit=limit)
+
+
+_LIMIT_SUPPORT: dict[Any, bool] = {}
+
+
+def _accepts_limit(method: Any) -> bool:
+    """Vrai si la méthode de recherche du client déclare un paramètre ``limit``.
+
+    Un ``**kwargs`` ne suffit pas : rien ne garantit que la bibliothèque le
+    transmette à Meilisearch. Sans ``limit``, les hits sont tronqués ici.
+    """
+    func = getattr(method, "__func__", method)
+    known = _LIMIT_SUPPORT.get(func)
+    if known is None:
+        try:
+            param = inspect.signature(method).parameters.get("limit")
+        except (TypeError, ValueError):
+            param = None
+        known = param is not None and param.kind is not param.VAR_KEYWORD
+        _LIMIT_SUPPORT[func] = known
+    return known
+
+
 async def _search_generic(
     operation: str,
     method_name: str,
@@ -758,9 +1756,13 @@ async def _search_generic(
     normalized_query = normalize_query(query)
     filter_part = filter_by or ""
     sort_part = ",".join(sort) if sort else ""
-    cache_key = (
-        f"search:{operation}:{normalized_query}:{limit}:{filter_part}:{sort_part}"
-    )
+    scope = f"{operation}:{filter_part}:{sort_part}"
+    cache_key = _search_cache_key(scope, normalized_query, limit)
+
+    if cache_key not in (state.cache_search or {}):
+        reused = _search_reuse(scope, normalized_query, limit)
+        if reused is not None:
+            return reused
 
     async def _fetch() -> list[dict]:
         # Lazy import to avoid heavy ffbb_api_client_v3 initialization at
@@ -769,6 +1771,8 @@ async def _search_generic(
         client = await get_client_async()
         method = getattr(client, method_name)
         call_kwargs: dict[str, Any] = {}
+        if _accepts_limit(method):
+            call_kwargs["limit"] = limit
         if filter_by:
             call_kwargs["filter_by"] = filter_by
         if sort:
@@ -777,98 +1781,200 @@ async def _search_generic(
             _safe_call_with_inflight(
                 f"Search {operation}: {query}",
                 lambda: method(normalized_query, **call_kwargs),
+                endpoint=f"search:{operation}",
             )
         )
-        if not results or not results.hits:
-            return []
-        return [serialize_model(hit) for hit in results.hits[:limit]]
+        hits = (
+            serialize_models(results.hits[:limit]) if results and results.hits else []
+        )
+        if operation == "organismes" and not filter_by and not sort:
+            _organisme_index().learn(normalized_query, limit, hits)
+            _schedule_organisme_index_save()
+        _typeahead_learn(operation, hits)
+        return hits
 
-    return await _dedupe_inflight(
+    hits = await _dedupe_inflight(
         cache=state.cache_search,
         cache_key=cache_key,
         inflight_map=state.inflight_search,
         make_coro=_fetch,
         cache_name="search",
     )
+    _record_search_limit(scope, normalized_query, limit)
+    return hits
+
+
+def _search_cache_key(scope: str, normalized_query: str, limit: int) -> str:
+    operation, filter_part, sort_part = scope.split(":", 2)
+    return f"search:{operation}:{normalized_query}:{limit}:{filter_part}:{sort_part}"
+
+
+def _record_search_limit(scope: str, normalized_query: str, limit: int) -> None:
+    queries = state.search_limits.setdefault(scope, {})
+    if normalized_query not in queries and len(queries) >= _MAX_SEARCH_LIMITS:
+        queries.clear()
+    queries.setdefault(normalized_query, set()).add(limit)
+
+
+def _cached_search(scope: str, normalized_query: str) -> list[tuple[int, list[dict]]]:
+    """``[(limite, hits)]`` encore en cache pour une requête, plus grandes d'abord."""
+    limits = state.search_limits.get(scope, {}).get(normalized_query)
+    if not limits or state.cache_search is None:
+        return []
+    found = []
+    for cached_limit in sorted(limits, reverse=True):
+        hits = state.cache_search.get(
+            _search_cache_key(scope, normalized_query, cached_limit)
+        )
+        if hits is None:
+            limits.discard(cached_limit)
+        else:
+            found.append((cached_limit, hits))
+    return found
+
+
+def _cached_index_hits(
+    scope: str, normalized_query: str, limit: int
+) -> list[dict] | None:
+    """Les ``limit`` premiers hits d'une entrée en cache qui les couvre, sinon None."""
+    for cached_limit, hits in _cached_search(scope, normalized_query):
+        if cached_limit >= limit or len(hits) < cached_limit:
+            return hits[:limit]
+    return None
+
+
+def _search_reuse(scope: str, normalized_query: str, limit: int) -> list[dict] | None:
+    """Répond à une recherche depuis d'autres entrées du cache, sans appel amont.
+
+    - même requête avec une limite plus grande, ou résultat complet (moins de
+      hits que sa limite) : les ``limit`` premiers hits ;
+    - avec ``FFBB_SEARCH_PREFIX_REFINE`` : résultat complet d'un préfixe de la
+      requête (``stade clermont`` pour ``stade clermontois``), filtré localement
+      sur les mots de la requête, dans l'ordre de pertinence d'origine.
+    """
+    hits = _cached_index_hits(scope, normalized_query, limit)
+    if hits is not None:
+        _notify_cache_hit("search")
+        return hits
+
+    if not _SEARCH_PREFIX_REFINE:
+        return None
+    words = fold(normalized_query).split()
+    for end in range(len(normalized_query) - 1, 2, -1):
+        prefix = normalized_query[:end]
+        for cached_limit, hits in _cached_search(scope, prefix):
+            if len(hits) < cached_limit:
+                _notify_cache_hit("search")
+                return [h for h in hits if _hit_matches(h, words)][:limit]
+    return None
+
+
+def _hit_matches(hit: dict, words: list[str]) -> bool:
+    """Chaque mot de la requête préfixe un mot d'un champ texte du hit."""
+    text = fold(" ".join(v for v in hit.values() if isinstance(v, str))).split()
+    return all(any(t.startswith(w) for t in text) for w in words)
+
+
+# Index interrogés par multi_search_service, dans l'ordre de fusion :
+# (constante de ffbb_api_client_v3.config, opération de _search_generic,
+# index principal).
+_MULTI_SEARCH_INDEXES = (
+    ("MEILISEARCH_INDEX_ORGANISMES", "organismes", True),
+    ("MEILISEARCH_INDEX_COMPETITIONS", "competitions", True),
+    ("MEILISEARCH_INDEX_RENCONTRES", "rencontres", True),
+    ("MEILISEARCH_INDEX_SALLES", "salles", False),
+    ("MEILISEARCH_INDEX_PRATIQUES", "pratiques", False),
+    ("MEILISEARCH_INDEX_TERRAINS", "terrains", False),
+    ("MEILISEARCH_INDEX_TOURNOIS", "tournois", False),
+)
+
+
+def _store_index_hits(
+    operation: str, normalized_query: str, limit: int, hits: list[dict]
+) -> None:
+    """Range les hits d'un index (issus d'un multi-search) comme une recherche simple."""
+    scope = f"{operation}::"
+    _cache_set(
+        state.cache_search,
+        _search_cache_key(scope, normalized_query, limit),
+        hits,
+        "search",
+    )
+    _record_search_limit(scope, normalized_query, limit)
+    if operation == "organismes":
+        _organisme_index().learn(normalized_query, limit, hits)
+        _schedule_organisme_index_save()
+    _typeahead_learn(operation, hits)
 
 
 async def multi_search_service(nom: str, limit: int = 20) -> list[dict[str, Any]]:
+    """Recherche sur les 7 index Meilisearch, fusionnée et tronquée à ``limit``.
+
+    Chaque index est d'abord cherché dans le cache des recherches simples
+    (``search:{index}:...``) : seuls les index manquants partent en un
+    multi-search, dont les hits alimentent à leur tour ce cache.
+    """
     normalized_query = normalize_query(nom)
     cache_key = f"multi_search:{normalized_query}:{limit}"
 
     async def _fetch() -> list[dict[str, Any]]:
         # Lazy imports to avoid heavy ffbb_api_client_v3 initialization at
         # module import time.
-        from ffbb_api_client_v3.config import (
-            MEILISEARCH_INDEX_COMPETITIONS,
-            MEILISEARCH_INDEX_ORGANISMES,
-            MEILISEARCH_INDEX_PRATIQUES,
-            MEILISEARCH_INDEX_RENCONTRES,
-            MEILISEARCH_INDEX_SALLES,
-            MEILISEARCH_INDEX_TERRAINS,
-            MEILISEARCH_INDEX_TOURNOIS,
-        )
+        from ffbb_api_client_v3 import config
         from ffbb_api_client_v3.models import MultiSearchQuery
 
-        client = await get_client_async()
         primary_limit = min(limit, max(2, (limit + 2) // 3))
         secondary_limit = min(limit, max(1, (limit + 9) // 10))
-        queries = [
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_ORGANISMES,
-                q=normalized_query,
-                limit=primary_limit,
-            ),
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_COMPETITIONS,
-                q=normalized_query,
-                limit=primary_limit,
-            ),
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_RENCONTRES,
-                q=normalized_query,
-                limit=primary_limit,
-            ),
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_SALLES,
-                q=normalized_query,
-                limit=secondary_limit,
-            ),
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_PRATIQUES,
-                q=normalized_query,
-                limit=secondary_limit,
-            ),
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_TERRAINS,
-                q=normalized_query,
-                limit=secondary_limit,
-            ),
-            MultiSearchQuery(
-                index_uid=MEILISEARCH_INDEX_TOURNOIS,
-                q=normalized_query,
-                limit=secondary_limit,
-            ),
+        plan = [
+            (
+                getattr(config, const),
+                operation,
+                primary_limit if primary else secondary_limit,
+            )
+            for const, operation, primary in _MULTI_SEARCH_INDEXES
         ]
 
-        raw = await _with_ffbb_semaphore(
-            _safe_call_with_inflight(
-                f"Multi-search: {nom}", lambda: client.multi_search_async(queries)
+        sections: dict[str, list[dict]] = {}
+        for uid, operation, index_limit in plan:
+            cached = _cached_index_hits(f"{operation}::", normalized_query, index_limit)
+            if cached is not None:
+                sections[uid] = cached
+        missing = [entry for entry in plan if entry[0] not in sections]
+        if not missing:
+            _notify_cache_hit("search")
+
+        extra: dict[str, list[dict]] = {}
+        if missing:
+            client = await get_client_async()
+            queries = [
+                MultiSearchQuery(index_uid=uid, q=normalized_query, limit=index_limit)
+                for uid, _, index_limit in missing
+            ]
+            raw = await _with_ffbb_semaphore(
+                _safe_call_with_inflight(
+                    f"Multi-search: {nom}",
+                    lambda: client.multi_search_async(queries),
+                    endpoint="multi_search",
+                )
             )
-        )
-
-        if not raw or not hasattr(raw, "results") or not raw.results:
-            return []
+            planned = {uid: (operation, lim) for uid, operation, lim in missing}
+            for res in getattr(raw, "results", None) or []:
+                uid = res.index_uid
+                if uid in planned:
+                    operation, index_limit = planned[uid]
+                    hits = serialize_models(res.hits[:index_limit])
+                    _store_index_hits(operation, normalized_query, index_limit, hits)
+                    sections[uid] = hits
+                else:
+                    extra[uid] = serialize_models(res.hits[:limit])
 
         output: list[dict[str, Any]] = []
-        for res in raw.results:
-            category = res.index_uid
-            for hit in res.hits:
-                item = serialize_model(hit)
-                item["_type"] = category
-                output.append(item)
-                if len(output) >= limit:
-                    return output
+        ordered = [(uid, sections.get(uid, [])) for uid, _, _ in plan]
+        for category, hits in [*ordered, *extra.items()]:
+            for item in hits[: limit - len(output)]:
+                output.append({**item, "_type": category})
+            if len(output) >= limit:
+                break
         return output
 
     return await _dedupe_inflight(
@@ -1042,11 +2148,7 @@ async def ffbb_next_match_service(
     )
 
     if not resolved_clubs:
-        return {
-            "status": "not_found",
-            "message": f"Club '{club_name or organisme_id}' introuvable.",
-            "club_resolu": None,
-        }
+        return _club_not_found(club_name, organisme_id)
 
     # Si ambiguïté sur le club, on s'arrête là (sauf si un seul club matchait)
     if len(resolved_clubs) > 1 and not organisme_id:
@@ -1139,6 +2241,7 @@ async def ffbb_next_match_service(
     numero_equipe_match = int(numero_equipe) if numero_equipe is not None else None
 
     tz = _PARIS_TZ
+    organisme_nom_norm = _team_key(str(organisme_nom)).norm
 
     async def _fetch_and_filter_next(eq: dict):
         poule_id = eq.get("poule_id")
@@ -1159,7 +2262,6 @@ async def ffbb_next_match_service(
             if str_my_eng and (str_my_eng in (id_eng1, id_eng2)):
                 is_my_team = True
             else:
-                organisme_nom_norm = _normalize_name(str(organisme_nom))
                 is_my_team = _match_team_name(
                     str(m.get("nomEquipe1", "")),
                     organisme_nom_norm,
@@ -1295,6 +2397,7 @@ async def ffbb_saison_bilan_service(
     categorie: str,
     numero_equipe: int,
     force_refresh: bool = False,
+    thaw: bool | None = None,
 ) -> dict[str, Any]:
     """Service interne pour ffbb_bilan_saison.
 
@@ -1306,6 +2409,7 @@ async def ffbb_saison_bilan_service(
 
     Args:
         force_refresh: Si True, bypass le cache pour obtenir des données fraîches.
+        thaw: Relit aussi les poules figées (par défaut ``force_refresh``).
     """
     org_id_int = _coerce_numeric_id(organisme_id, "organisme_id")
     equipes = await ffbb_equipes_club_service(
@@ -1357,7 +2461,7 @@ async def ffbb_saison_bilan_service(
 
     async def _fetch_poule(pid: str) -> dict[str, Any] | Exception:
         try:
-            return await get_poule_service(pid, force_refresh=force_refresh)
+            return await get_poule_service(pid, force_refresh=force_refresh, thaw=thaw)
         except Exception as e:  # déjà normalisé par get_poule_service
             return e
 
@@ -1605,6 +2709,38 @@ async def ffbb_bilan_service(
     )
 
 
+def _calendrier_match(match: dict[str, Any], equipe: dict[str, Any]) -> dict[str, Any]:
+    """Ligne de calendrier club pour une rencontre de poule."""
+    eng1 = match.get("idEngagementEquipe1")
+    eng2 = match.get("idEngagementEquipe2")
+    num1 = eng1.get("numeroEquipe") if isinstance(eng1, dict) else None
+    num2 = eng2.get("numeroEquipe") if isinstance(eng2, dict) else None
+    return {
+        "id": match.get("id"),
+        "date": match.get("date_rencontre", match.get("date", "")),
+        "joue": match.get("joue"),
+        "equipe1": format_team_name(
+            match.get("nomEquipe1", match.get("nom_equipe1", "")), num1
+        ),
+        "equipe2": format_team_name(
+            match.get("nomEquipe2", match.get("nom_equipe2", "")), num2
+        ),
+        "score_equipe1": match.get("resultatEquipe1", match.get("resultat_equipe1")),
+        "score_equipe2": match.get("resultatEquipe2", match.get("resultat_equipe2")),
+        "competition_nom": equipe.get("competition", ""),
+        "num_journee": match.get("numeroJournee", match.get("numero_journee", "")),
+    }
+
+
+async def _emit_chunk(
+    on_chunk: Callable[[dict[str, Any]], Awaitable[None]], chunk: dict[str, Any]
+) -> None:
+    try:
+        await on_chunk(chunk)
+    except Exception as e:
+        logger.debug("Émission partielle du calendrier ignorée : %s", e)
+
+
 async def get_calendrier_club_service(
     club_name: str | None = None,
     organisme_id: int | str | None = None,
@@ -1612,6 +2748,8 @@ async def get_calendrier_club_service(
     numero_equipe: int | None = None,
     *,
     force_refresh: bool = False,
+    on_chunk: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    truncate: bool = True,
 ) -> list[dict]:
     """Récupère le calendrier et les résultats d'un club.
 
@@ -1620,7 +2758,15 @@ async def get_calendrier_club_service(
     - Récupération des équipes via ffbb_equipes_club_service
     - Récupération de toutes les poules concernées
     - Agrégation des rencontres
-    - Troncature éventuelle si trop de matchs (FFBB_MAX_CALENDAR_MATCHES)
+    - Troncature éventuelle si trop de matchs (FFBB_MAX_CALENDAR_MATCHES),
+      sauf avec ``truncate=False`` (pagination)
+
+    ``on_chunk`` reçoit, dès qu'une poule arrive, ses rencontres non triées
+    (``{"poule_id", "rencontres", "done", "total"}``) : le premier résultat
+    partiel suit la poule la plus rapide et non la plus lente. Un dernier
+    appel porte l'ordre final (``{"final": True, "ordre": [ids]}``). Le
+    résultat renvoyé est inchangé ; rien n'est émis quand il est servi depuis
+    le cache ou par un appel concurrent.
     """
     cache_key = f"calendrier:{organisme_id or ''}:{(club_name or '').lower().strip()}:{categorie or ''}:{numero_equipe or ''}"
 
@@ -1693,19 +2839,50 @@ async def get_calendrier_club_service(
             dict.fromkeys(str(e.get("poule_id")) for e in equipes if e.get("poule_id"))
         )
 
-        poule_tasks = [get_poule_service(poule_id) for poule_id in unique_poule_ids]
-        poules_data = await asyncio.gather(*poule_tasks, return_exceptions=True)
-        poules_by_id = {
-            poule_id: poule_data
-            for poule_id, poule_data in zip(unique_poule_ids, poules_data, strict=False)
-        }
+        async def _load_poule(poule_id: str) -> tuple[str, Any]:
+            try:
+                return poule_id, await get_poule_service(poule_id)
+            except Exception as e:
+                return poule_id, e
+
+        # as_completed : chaque poule est traitée (et émise via on_chunk) dès
+        # son arrivée ; l'agrégation finale reste dans l'ordre des équipes.
+        poules_by_id: dict[str, Any] = {}
+        for done, next_poule in enumerate(
+            asyncio.as_completed([_load_poule(pid) for pid in unique_poule_ids]),
+            start=1,
+        ):
+            poule_id, poule_data = await next_poule
+            poules_by_id[poule_id] = poule_data
+            if on_chunk is None or not isinstance(poule_data, dict):
+                continue
+            chunk: list[dict[str, Any]] = []
+            chunk_ids: set[Any] = set()
+            for equipe in equipes:
+                if str(equipe.get("poule_id")) != poule_id:
+                    continue
+                for match in poule_data.get("rencontres", []) or []:
+                    if not isinstance(match, dict) or not match.get("id"):
+                        continue
+                    if match["id"] not in chunk_ids:
+                        chunk_ids.add(match["id"])
+                        chunk.append(_calendrier_match(match, equipe))
+            await _emit_chunk(
+                on_chunk,
+                {
+                    "poule_id": poule_id,
+                    "rencontres": chunk,
+                    "done": done,
+                    "total": len(unique_poule_ids) + 1,
+                },
+            )
 
         for equipe in equipes:
-            poule_id = equipe.get("poule_id")
-            if not poule_id:
+            equipe_poule_id = equipe.get("poule_id")
+            if not equipe_poule_id:
                 continue
 
-            poule_data = poules_by_id.get(str(poule_id))
+            poule_data = poules_by_id.get(str(equipe_poule_id))
             if (
                 not isinstance(poule_data, dict)
                 or not poule_data
@@ -1729,36 +2906,7 @@ async def get_calendrier_club_service(
                 # Seule la déduplication par match_id est nécessaire.
                 seen_match_ids.add(match_id)
 
-                eng1 = match.get("idEngagementEquipe1")
-                eng2 = match.get("idEngagementEquipe2")
-                num1 = eng1.get("numeroEquipe") if isinstance(eng1, dict) else None
-                num2 = eng2.get("numeroEquipe") if isinstance(eng2, dict) else None
-
-                eq1 = format_team_name(
-                    match.get("nomEquipe1", match.get("nom_equipe1", "")), num1
-                )
-                eq2 = format_team_name(
-                    match.get("nomEquipe2", match.get("nom_equipe2", "")), num2
-                )
-                score1 = match.get("resultatEquipe1", match.get("resultat_equipe1"))
-                score2 = match.get("resultatEquipe2", match.get("resultat_equipe2"))
-                date_match = match.get("date_rencontre", match.get("date", ""))
-                journee = match.get("numeroJournee", match.get("numero_journee", ""))
-                joue = match.get("joue")
-
-                all_matches.append(
-                    {
-                        "id": match_id,
-                        "date": date_match,
-                        "joue": joue,
-                        "equipe1": eq1,
-                        "equipe2": eq2,
-                        "score_equipe1": score1,
-                        "score_equipe2": score2,
-                        "competition_nom": equipe.get("competition", ""),
-                        "num_journee": journee,
-                    }
-                )
+                all_matches.append(_calendrier_match(match, equipe))
 
         # --- Tri robuste par date + flags temporels ---
         tz = _PARIS_TZ
@@ -1813,41 +2961,60 @@ async def get_calendrier_club_service(
             m["is_next_match"] = next_future_idx is not None and idx == next_future_idx
             m.pop("_dt", None)
 
-        try:
-            max_matches = int(os.getenv("FFBB_MAX_CALENDAR_MATCHES", "300"))
-        except ValueError:
-            max_matches = 300
-
-        effective = all_matches
-
-        if len(effective) > max_matches:
-            truncated = effective[:max_matches]
-            warning = {
-                "warning": (
-                    "Résultat tronqué côté MCP: trop de matchs pour ce club/catégorie. "
-                    "Affichage limité pour protéger les performances. "
-                    "Affinez votre requête (catégorie précise, équipe 1/2, phase, etc.)."
-                ),
-                "total_initial": len(all_matches),
-                "limite_appliquee": max_matches,
-            }
-            truncated.append(warning)
-            return truncated
-
-        return effective
+        if on_chunk is not None:
+            # Métadonnées d'ordre final : un client qui a assemblé les poules
+            # partielles peut les réordonner sans relire la réponse complète.
+            await _emit_chunk(
+                on_chunk,
+                {
+                    "final": True,
+                    "ordre": [m["id"] for m in all_matches],
+                    "done": len(unique_poule_ids) + 1,
+                    "total": len(unique_poule_ids) + 1,
+                },
+            )
+        return all_matches
 
     # force_refresh contourne le cache de calendrier, mais continue de bénéficier
     # de la déduplication inflight.
     if force_refresh and state.cache_calendrier is not None:
         state.cache_calendrier.pop(cache_key, None)
 
-    return await _dedupe_inflight(
+    # Le cache garde le calendrier complet et trié (pagination par curseur) ;
+    # la troncature n'est appliquée qu'à la lecture.
+    calendrier = await _dedupe_inflight(
         cache=state.cache_calendrier,
         cache_key=cache_key,
         inflight_map=state.inflight_calendrier,
         make_coro=_fetch,
         cache_name="calendrier",
     )
+    return _truncate_calendrier(calendrier) if truncate else calendrier
+
+
+def _truncate_calendrier(calendrier: list[dict]) -> list[dict]:
+    """Limite à FFBB_MAX_CALENDAR_MATCHES avec un avertissement final."""
+    try:
+        max_matches = int(os.getenv("FFBB_MAX_CALENDAR_MATCHES", "300"))
+    except ValueError:
+        max_matches = 300
+
+    if len(calendrier) <= max_matches:
+        return calendrier
+    truncated = calendrier[:max_matches]
+    truncated.append(
+        {
+            "warning": (
+                "Résultat tronqué côté MCP: trop de matchs pour ce club/catégorie. "
+                "Affichage limité pour protéger les performances. "
+                "Affinez votre requête (catégorie précise, équipe 1/2, phase, etc.) "
+                "ou paginez avec page_size/cursor."
+            ),
+            "total_initial": len(calendrier),
+            "limite_appliquee": max_matches,
+        }
+    )
+    return truncated
 
 
 async def search_competitions_service(
@@ -2194,6 +3361,20 @@ def _normalize_name(value: str) -> str:
     return "".join(c for c in s if unicodedata.category(c) not in ("Mn", "So"))
 
 
+def _club_not_found(
+    club_name: str | None, organisme_id: int | str | None
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "status": "not_found",
+        "message": f"Club '{club_name or organisme_id}' introuvable.",
+        "club_resolu": None,
+    }
+    suggestions = suggest_clubs(club_name) if club_name else []
+    if suggestions:
+        result["suggestions"] = suggestions
+    return result
+
+
 async def _resolve_club_and_org(
     club_name: str | None,
     organisme_id: int | str | None,
@@ -2227,13 +3408,9 @@ async def _resolve_club_and_org(
         # Une entente est un organisme distinct dont le nom commence par "ENT." et
         # contient le mot distinctif du club (ex: "Gerzat Basket" → "GERZAT").
         key_word = _extract_club_key_word(club_name)
-        search_tasks: list[Any] = [
-            search_organismes_service(nom=club_name, limit=limit)
-        ]
+        search_tasks: list[Any] = [_search_organismes_indexed(club_name, limit)]
         if key_word:
-            search_tasks.append(
-                search_organismes_service(nom=key_word, limit=limit + 5)
-            )
+            search_tasks.append(_search_organismes_indexed(key_word, limit + 5))
         search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
 
         orgs: list[dict] = (
@@ -2328,7 +3505,47 @@ async def _resolve_club_and_org(
     return resolved, org_data
 
 
-@lru_cache(maxsize=256)
+class _TeamKey(NamedTuple):
+    """Nom d'équipe normalisé et son suffixe ``- N`` (calculés une fois)."""
+
+    norm: str
+    numero: str | None
+    has_digit: bool
+
+
+_TEAM_SUFFIX_PATTERN = re.compile(r"- (\d+)$")
+# Au-delà, les noms les moins récemment utilisés sont oubliés (LRU).
+_MAX_TEAM_KEYS = 50_000
+
+
+def _team_key(name: str) -> _TeamKey:
+    """Clé de comparaison d'un nom d'équipe, mémorisée dans ``state.team_keys``."""
+    key = state.team_keys.get(name)
+    if key is not None:
+        state.team_keys.move_to_end(name)
+    else:
+        norm = sys.intern(_normalize_name(name))
+        suffix = _TEAM_SUFFIX_PATTERN.search(norm)
+        key = _TeamKey(
+            norm,
+            suffix.group(1) if suffix else None,
+            any(ch.isdigit() for ch in norm),
+        )
+        state.team_keys[name] = key
+        if len(state.team_keys) > _MAX_TEAM_KEYS:
+            state.team_keys.popitem(last=False)
+    return key
+
+
+def _index_team_names(rencontres: list[dict]) -> None:
+    """Précalcule les clés des équipes d'une poule au moment de sa mise en cache."""
+    for r in rencontres:
+        for side in ("nomEquipe1", "nomEquipe2"):
+            nom = r.get(side)
+            if nom:
+                _team_key(str(nom))
+
+
 def _match_team_name(
     nom_equipe_rencontre: str,
     organisme_nom: str,
@@ -2342,29 +3559,25 @@ def _match_team_name(
       - on verifie que le nom du club est contenu,
       - si numero_equipe est None ou 1, on accepte un suffixe absent ou "- 1",
       - sinon on exige le suffixe exact "- {numero_equipe}".
-    """
 
-    nom_norm = _normalize_name(nom_equipe_rencontre)
+    Les noms normalisés viennent de ``_team_key`` (précalculés à la mise en
+    cache des poules et organismes) : plus de normalisation par appel.
+    """
+    team = _team_key(nom_equipe_rencontre)
     club_norm = (
-        organisme_nom if is_organisme_nom_normalized else _normalize_name(organisme_nom)
+        organisme_nom if is_organisme_nom_normalized else _team_key(organisme_nom).norm
     )
-    if not nom_norm or not club_norm:
+    if not team.norm or not club_norm:
         return False
-    if club_norm not in nom_norm:
+    if club_norm not in team.norm:
         return False
 
     # On traite None comme 1 pour la recherche de suffixe (équipe unique ou principale)
     search_num = numero_equipe if numero_equipe is not None else 1
-    suffix = f"- {search_num}"
-    suffix_norm = _normalize_name(suffix)
-
-    if search_num == 1:
-        # Equipe unique : suffixe optionnel.
-        # On accepte soit le suffixe "- 1", soit l'absence de chiffre dans le nom.
-        has_digit = any(ch.isdigit() for ch in nom_norm)
-        return nom_norm.endswith(suffix_norm) or not has_digit
-
-    return nom_norm.endswith(suffix_norm)
+    if team.numero == str(search_num):
+        return True
+    # Equipe unique : suffixe optionnel (absence de chiffre dans le nom).
+    return search_num == 1 and not team.has_digit
 
 
 async def resolve_poule_id_service(
@@ -2429,6 +3642,7 @@ async def ffbb_last_result_service(
     categorie: str,
     numero_equipe: int = 1,
     force_refresh: bool = False,
+    thaw: bool | None = None,
 ) -> dict:
     # 1. Résolution des organismes avec métadonnées (CENTRALISÉ)
     resolved_clubs, org_data = await _resolve_club_and_org(
@@ -2436,11 +3650,7 @@ async def ffbb_last_result_service(
     )
 
     if not resolved_clubs:
-        return {
-            "status": "not_found",
-            "message": f"Club '{club_name or organisme_id}' introuvable.",
-            "club_resolu": None,
-        }
+        return _club_not_found(club_name, organisme_id)
 
     # Si ambiguïté sur le club, on s'arrête là
     if len(resolved_clubs) > 1 and not organisme_id:
@@ -2508,6 +3718,7 @@ async def ffbb_last_result_service(
 
     organisme_nom = club_resolu["nom"]
     numero_equipe_match = int(numero_equipe) if numero_equipe is not None else None
+    organisme_nom_norm = _team_key(str(organisme_nom)).norm
 
     async def _get_latest_match(refresh: bool) -> dict[str, Any] | None:
         all_joues_tuples: list[tuple[dict, dict]] = []
@@ -2516,7 +3727,7 @@ async def ffbb_last_result_service(
             pid = eq.get("poule_id")
             if not pid:
                 return []
-            poule = await get_poule_service(pid, force_refresh=refresh)
+            poule = await get_poule_service(pid, force_refresh=refresh, thaw=thaw)
             return [
                 (r, eq)
                 for r in poule.get("rencontres", [])
@@ -2525,13 +3736,15 @@ async def ffbb_last_result_service(
                 and (
                     _match_team_name(
                         str(r.get("nomEquipe1", "")),
-                        str(organisme_nom),
+                        organisme_nom_norm,
                         numero_equipe_match,
+                        is_organisme_nom_normalized=True,
                     )
                     or _match_team_name(
                         str(r.get("nomEquipe2", "")),
-                        str(organisme_nom),
+                        organisme_nom_norm,
                         numero_equipe_match,
+                        is_organisme_nom_normalized=True,
                     )
                 )
             ]
@@ -0,0 +1,202 @@
+"""Abonnements MCP aux scores en direct (``resources/subscribe``).
+
+Plutôt que de relire ``ffbb_lives`` ou de forcer le rafraîchissement d'une
+poule, un client s'abonne à ``ffbb://lives`` ou ``ffbb://poule/{id}``. Une
+seule tâche serveur interroge les lives toutes les ``FFBB_LIVES_POLL_INTERVAL``
+secondes (15 s, le TTL du cache lives) tant qu'il reste au moins un abonné, et
+envoie ``notifications/resources/updated`` aux sessions abonnées quand les
+scores changent : N clients qui suivaient un match coûtent un appel amont par
+intervalle au lieu de N.
+
+Quand les lives d'une poule suivie changent (ou qu'un match se termine et en
+disparaît), les entrées ``poule:{id}`` des caches sont invalidées avant la
+notification : la relecture de la ressource renvoie le score à jour.
+
+Limite : en Streamable HTTP *stateless* (déploiement par défaut), la session
+MCP ne survit pas à la requête et aucune notification ne peut être poussée ;
+le serveur n'annonce alors pas la capacité ``subscribe`` et refuse les
+abonnements. Les clients HTTP gardent les requêtes conditionnelles
+(``/api/poule/{id}`` + ``If-None-Match``) ou les réponses delta.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import weakref
+from typing import Any
+
+from mcp.shared.exceptions import ErrorData, McpError
+from mcp.types import INVALID_REQUEST
+from pydantic import AnyUrl
+
+from ffbb_mcp.utils import content_version
+
+logger = logging.getLogger("ffbb-mcp")
+
+LIVES_URI = "ffbb://lives"
+_POULE_PREFIX = "ffbb://poule/"
+# Champs portant l'identifiant de poule d'un live selon la version de l'API.
+_LIVE_POULE_KEYS = ("poule_id", "idPoule", "id_poule")
+
+
+def _read_poll_interval() -> float:
+    try:
+        interval = float(os.environ.get("FFBB_LIVES_POLL_INTERVAL", "15"))
+    except ValueError:
+        return 15.0
+    return interval if interval > 0 else 15.0
+
+
+def _live_poule_id(live: Any) -> str | None:
+    if not isinstance(live, dict):
+        return None
+    for key in _LIVE_POULE_KEYS:
+        value = live.get(key)
+        if isinstance(value, dict):
+            value = value.get("id")
+        if value is not None:
+            return str(value)
+    return None
+
+
+class LiveSubscriptions:
+    """Sessions abonnées par URI et tâche unique d'interrogation des lives."""
+
+    def __init__(self, interval: float | None = None) -> None:
+        self.interval = interval or _read_poll_interval()
+        # False en Streamable HTTP stateless : aucune session ne persiste.
+        self.enabled = True
+        self._subscribers: dict[str, weakref.WeakSet[Any]] = {}
+        self._versions: dict[str, str | None] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    # -- Abonnés -------------------------------------------------------------
+
+    def subscribers(self, uri: str) -> list[Any]:
+        return list(self._subscribers.get(uri, ()))
+
+    def has_subscribers(self) -> bool:
+        return any(len(sessions) for sessions in self._subscribers.values())
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        """Abonne ``session`` à ``uri`` et démarre la tâche d'interrogation."""
+        if not self.enabled:
+            raise McpError(
+                error=ErrorData(
+                    code=INVALID_REQUEST,
+                    message=(
+                        "Abonnements indisponibles en HTTP stateless : utiliser "
+                        "/api/poule/{id} avec If-None-Match ou ffbb_get(delta=True)."
+                    ),
+                )
+            )
+        if uri != LIVES_URI and not uri.startswith(_POULE_PREFIX):
+            raise McpError(
+                error=ErrorData(
+                    code=INVALID_REQUEST,
+                    message=f"Abonnement non supporté : {uri} (ffbb://lives, ffbb://poule/{{id}}).",
+                )
+            )
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+        self.start()
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        sessions = self._subscribers.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._subscribers[uri]
+                self._versions.pop(uri, None)
+
+    def clear(self) -> None:
+        self._subscribers.clear()
+        self._versions.clear()
+
+    # -- Interrogation -------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while self.has_subscribers():
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.warning("Interrogation des lives en échec : %s", e)
+            await asyncio.sleep(self.interval)
+
+    async def poll_once(self) -> list[str]:
+        """Un appel lives ; notifie les URI dont le contenu a changé."""
+        from ffbb_mcp.services import get_lives_service, invalidate_cache
+
+        lives = await get_lives_service()
+        by_poule: dict[str, list[Any]] = {}
+        for live in lives:
+            pid = _live_poule_id(live)
+            if pid is not None:
+                by_poule.setdefault(pid, []).append(live)
+
+        updated = []
+        for uri in list(self._subscribers):
+            if uri == LIVES_URI:
+                version = content_version(lives) if lives else None
+            else:
+                pid = uri.removeprefix(_POULE_PREFIX)
+                entries = by_poule.get(pid)
+                version = content_version(entries) if entries else None
+            if uri not in self._versions:
+                # Premier passage : état de référence, rien à notifier.
+                self._versions[uri] = version
+                continue
+            if self._versions[uri] == version:
+                continue
+            self._versions[uri] = version
+            if uri != LIVES_URI:
+                invalidate_cache(f"poule:{uri.removeprefix(_POULE_PREFIX)}", "poule")
+            await self._notify(uri)
+            updated.append(uri)
+        return updated
+
+    async def _notify(self, uri: str) -> None:
+        for session in self.subscribers(uri):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception as e:
+                logger.debug("Session abonnée injoignable (%s) : %s", uri, e)
+                self.unsubscribe(uri, session)
+
+
+subscriptions = LiveSubscriptions()
+
+
+def register_subscriptions(mcp: Any) -> None:
+    """Branche subscribe/unsubscribe et annonce la capacité ``subscribe``."""
+    server = mcp._mcp_server
+    get_capabilities = server.get_capabilities
+
+    def _get_capabilities(*args: Any, **kwargs: Any) -> Any:
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = subscriptions.enabled
+        return capabilities
+
+    server.get_capabilities = _get_capabilities
+
+    @server.subscribe_resource()  # type: ignore[untyped-decorator]
+    async def _subscribe(uri: AnyUrl) -> None:
+        subscriptions.subscribe(str(uri), server.request_context.session)
+
+    @server.unsubscribe_resource()  # type: ignore[untyped-decorator]
+    async def _unsubscribe(uri: AnyUrl) -> None:
+        subscriptions.unsubscribe(str(uri), server.request_context.session)
@@ -1,11 +1,44 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
 from datetime import datetime
 from functools import lru_cache
 from typing import Any, NamedTuple
 
+try:  # décodeur JSON rapide optionnel (extra "fast")
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    _orjson = None  # type: ignore[assignment]
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Décode du JSON brut, via orjson s'il est installé (sinon json stdlib)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def content_version(data: Any) -> str:
+    """Empreinte courte et stable d'un payload (clés triées, JSON compact).
+
+    Sert de version/ETag : deux payloads égaux ont la même version, quel que
+    soit l'ordre d'insertion de leurs clés. La clé ``_version`` est ignorée.
+    """
+    if isinstance(data, dict) and "_version" in data:
+        data = {k: v for k, v in data.items() if k != "_version"}
+    if _orjson is not None:
+        encoded = _orjson.dumps(
+            data, option=_orjson.OPT_SORT_KEYS | _orjson.OPT_NON_STR_KEYS, default=str
+        )
+    else:
+        encoded = json.dumps(
+            data, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
 
 def serialize_model(obj: Any) -> Any:
     """Convertit un objet FFBB en dict JSON-serializable."""
@@ -50,6 +83,34 @@ def serialize_model(obj: Any) -> Any:
     return str(obj)
 
 
+@lru_cache(maxsize=64)
+def _list_adapter(model_cls: type) -> Any:
+    """TypeAdapter(list[model_cls]) mis en cache (construction coûteuse)."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(list[model_cls])  # type: ignore[valid-type]
+
+
+def serialize_models(items: Any) -> list[Any]:
+    """Sérialise une liste d'objets FFBB en un seul appel quand c'est possible.
+
+    Si tous les éléments sont des modèles Pydantic v2 du même type, la liste
+    entière est sérialisée par le cœur Rust de Pydantic (``TypeAdapter``) sans
+    aller-retour Python par élément. Sinon, repli sur ``serialize_model``.
+    """
+    if not items:
+        return []
+    first_type: Any = type(items[0])
+    if hasattr(first_type, "__pydantic_serializer__") and all(
+        type(item) is first_type for item in items
+    ):
+        try:
+            return _list_adapter(first_type).dump_python(items, mode="json")
+        except Exception:
+            pass  # modèle non supporté par TypeAdapter : chemin générique
+    return [serialize_model(item) for item in items]
+
+
 class ParsedCategorie(NamedTuple):
     """Représentation structurée d'une catégorie FFBB.
 
@@ -180,52 +241,94 @@ _ESSENTIAL_KEYS = frozenset(
 )
 
 
+def _read_prune_limit() -> int:
+    try:
+        return int(os.environ.get("FFBB_MCP_PRUNE_LIMIT", "50"))
+    except ValueError:
+        return 50
+
+
+# Configuration de l'élagage, lue une seule fois au chargement du module.
+_PRUNE_LIST_LIMIT = _read_prune_limit()
+_PRUNE_MAX_DEPTH = 10
+_PRUNE_MAX_KEYS = 50
+_PRUNE_KEPT_OTHER_KEYS = 25
+
+
+def _is_empty(value: Any) -> bool:
+    """None, [] ou {} (les seules valeurs retirées par l'élagage)."""
+    if value is None:
+        return True
+    value_type = type(value)
+    if value_type is str or value_type is int or value_type is bool:
+        return False
+    return isinstance(value, dict | list) and not value
+
+
+@lru_cache(maxsize=256)
+def _pruned_shape(keys: tuple[str, ...]) -> tuple[frozenset[str], int]:
+    """Clés conservées pour un dict de plus de ``_PRUNE_MAX_KEYS`` clés.
+
+    Mémoïsé par ensemble de clés : les éléments d'une même liste (rencontres,
+    classements) partagent la même forme, calculée une seule fois.
+    """
+    others = sorted(k for k in keys if k not in _ESSENTIAL_KEYS)
+    kept = {k for k in keys if k in _ESSENTIAL_KEYS}
+    kept.update(others[:_PRUNE_KEPT_OTHER_KEYS])
+    return frozenset(kept), max(0, len(others) - _PRUNE_KEPT_OTHER_KEYS)
+
+
 def prune_payload(obj: Any, depth: int = 0) -> Any:
     """Réduit agressivement la taille des payloads JSON (ZipAI Surgical Logic).
     - Supprime les valeurs vides (None, [], {}).
-    - Limite les dictionnaires à ~10 clés non-essentielles.
-    - Limite les listes à 25 éléments maximum.
+    - Au-delà de 50 clés, garde les clés essentielles + 25 autres.
+    - Limite les listes à ``FFBB_MCP_PRUNE_LIMIT`` éléments (50 par défaut).
+
+    Parcours en une seule passe, sans copie intermédiaire. Les modèles
+    Pydantic rencontrés sont sérialisés à la volée (``model_dump``) puis
+    élagués dans le même parcours : un service peut renvoyer ses modèles
+    sans passer d'abord par ``serialize_model``.
     """
     # Profondeur max pour éviter toute boucle infinie théorique
-    if depth > 10:
+    if depth > _PRUNE_MAX_DEPTH:
         return "<max depth reached>"
 
+    obj_type = type(obj)
+    if obj_type is str or obj_type is int or obj_type is float or obj_type is bool:
+        return obj
+
     if isinstance(obj, dict):
-        # 1. Nettoyage récursif
-        cleaned = {
-            k: prune_payload(v, depth + 1)
-            for k, v in obj.items()
-            if v is not None and v != [] and v != {}
-        }
+        child_depth = depth + 1
+        if len(obj) <= _PRUNE_MAX_KEYS:
+            out = {}
+            for k, v in obj.items():
+                v_type = type(v)
+                if v_type is str or v_type is int or v_type is float or v_type is bool:
+                    out[k] = v
+                elif not _is_empty(v):
+                    out[k] = prune_payload(v, child_depth)
+            return out
+        # Élagage chirurgical si trop de clés : la forme de sortie est
+        # calculée avant la récursion, les clés écartées ne sont pas visitées.
+        present = tuple(k for k, v in obj.items() if not _is_empty(v))
+        if len(present) <= _PRUNE_MAX_KEYS:
+            return {k: prune_payload(obj[k], child_depth) for k in present}
+        kept, omitted = _pruned_shape(present)
+        pruned = {k: prune_payload(obj[k], child_depth) for k in present if k in kept}
+        if omitted:
+            pruned["_omitted_count"] = omitted
+        return pruned
 
-        # 2. Élagage chirurgical si trop de clés
-        if len(cleaned) > 50:
-            sorted_keys = sorted(cleaned.keys())
-            kept_keys = {k for k in sorted_keys if k in _ESSENTIAL_KEYS}
-            other_keys = [k for k in sorted_keys if k not in _ESSENTIAL_KEYS]
-
-            # On garde les clés essentielles + les 25 premières autres
-            for k in other_keys[:25]:
-                kept_keys.add(k)
-
-            pruned = {k: cleaned[k] for k in kept_keys}
-            if len(other_keys) > 25:
-                pruned["_omitted_count"] = len(other_keys) - 25
-            return pruned
-        return cleaned
-
-    elif isinstance(obj, list):
-        # 1. Limitation de taille (ZipAI Surgical)
-        limit = int(os.environ.get("FFBB_MCP_PRUNE_LIMIT", "50"))
-        truncated = obj[:limit]
-
-        # 2. Nettoyage récursif
-        cleaned_list = [prune_payload(item, depth + 1) for item in truncated]
-        final_list = [
-            item
-            for item in cleaned_list
-            if item is not None and item != {} and item != []
-        ]
+    if isinstance(obj, list):
+        limit = _PRUNE_LIST_LIMIT
+        child_depth = depth + 1
+        final_list = []
+        for i, item in enumerate(obj):
+            if i >= limit:
+                break
+            pruned_item = prune_payload(item, child_depth)
+            if not _is_empty(pruned_item):
+                final_list.append(pruned_item)
 
         if len(obj) > limit:
             # On ajoute un champ _omitted_count à la fin de la liste pour prévenir l'agent
@@ -233,4 +336,8 @@ def prune_payload(obj: Any, depth: int = 0) -> Any:
 
         return final_list
 
+    if obj is not None and hasattr(obj, "model_dump"):
+        # Modèle Pydantic v2 : sérialisation fusionnée avec l'élagage.
+        return prune_payload(obj.model_dump(mode="json"), depth)
+
     return obj
@@ -1,9 +1,19 @@
 """Fixtures partagées pour les tests du serveur MCP FFBB."""
 
+import sys
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from ffbb_mcp import cache_strategy, response_cache, server
+from ffbb_mcp._state import reset_service_state
+
+# Backend simulé (tools/fake_ffbb.py), importable depuis tous les tests.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from fake_ffbb import FakeFFBBClient
+
 
 @pytest.fixture
 def mock_client():
@@ -43,3 +53,22 @@ def mock_ctx():
     ctx.info = AsyncMock()
     ctx.error = AsyncMock()
     return ctx
+
+
+@pytest.fixture
+def off_match_day(monkeypatch):
+    """Hors jour et fenêtre de match : TTL et chemins de cache déterministes."""
+    monkeypatch.setattr(server, "is_match_day", lambda: False)
+    monkeypatch.setattr(response_cache, "is_match_day", lambda: False)
+    monkeypatch.setattr(cache_strategy, "is_in_match_window", lambda now=None: False)
+    monkeypatch.setattr(cache_strategy, "is_post_match_cooling", lambda now=None: False)
+
+
+@pytest.fixture
+def fake_client(patch_get_client, off_match_day):
+    """Backend simulé derrière get_client_async, état des services remis à zéro."""
+    client = FakeFFBBClient(latency_ms=0)
+    patch_get_client.return_value = client
+    reset_service_state()
+    yield client
+    reset_service_state()
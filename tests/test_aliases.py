@@ -0,0 +1,150 @@
+"""Résolution indexée des alias et acronymes (aliases.py)."""
+
+import itertools
+import json
+import re
+
+import pytest
+
+from ffbb_mcp import aliases
+from ffbb_mcp.aliases import (
+    enrich_acronym_cache,
+    normalize_query,
+    resolve_acronym,
+    suggest_clubs,
+)
+
+
+@pytest.fixture
+def acronyms(monkeypatch, tmp_path):
+    monkeypatch.setattr(aliases, "_CACHE_FILE", tmp_path / "acronyms.json")
+    aliases._pending.clear()
+    previous = aliases._acronyms_cache
+    cache = aliases._set_acronyms_cache(dict(aliases._DEFAULT_ACRONYMS))
+    yield cache
+    aliases._pending.clear()
+    if previous is not None:
+        aliases._set_acronyms_cache(previous)
+    else:
+        aliases._set_acronyms_cache({})
+        aliases._acronyms_cache = None
+
+
+def _sequential_aliases(query: str) -> str:
+    """Boucle d'origine : un ``re.sub`` par alias, dans l'ordre du dictionnaire."""
+    normalized = query.lower().strip()
+    if normalized in aliases.CLUB_ALIASES:
+        return aliases.CLUB_ALIASES[normalized]
+    for alias, official in aliases.CLUB_ALIASES.items():
+        pattern = r"\b" + re.escape(alias) + r"\b"
+        if not re.search(pattern, official):
+            normalized = re.sub(pattern, official, normalized)
+    return re.sub(r"\s+", " ", normalized)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "ja vichy",
+        "u15 jav",
+        "sluc  u17",
+        "Club LDLC ASVEL",
+        "xx ldlc asvel yy",
+        "nancy",
+        "basket nancy",
+        "cb jlb bcm pau",
+        "Stade Clermontois",
+    ],
+)
+def test_alias_prefilter_keeps_loop_semantics(query):
+    assert normalize_query(query) == _sequential_aliases(query)
+
+
+def test_alias_examples():
+    assert normalize_query("u15 jav") == "u15 jeanne d'arc de vichy"
+    # "asvel" passe avant "ldlc asvel" dans le dictionnaire.
+    assert normalize_query("xx ldlc asvel yy") == "xx ldlc lyon villeurbanne yy"
+    # Alias contenu dans son nom officiel : pas de double remplacement.
+    assert normalize_query("nancy") == "sluc nancy"
+    assert normalize_query("basket nancy") == "basket nancy"
+
+
+def test_acronym_lookup_is_indexed(acronyms):
+    for i, letters in enumerate(itertools.product("klmnopq", repeat=4)):
+        acronyms["".join(letters)] = f"Club {i}"
+    aliases._set_acronyms_cache(acronyms)
+    assert len(acronyms) > 2000
+    assert resolve_acronym("JDA") == "Dijon"
+    assert resolve_acronym("QQQQ") == f"Club {7**4 - 1}"
+    assert resolve_acronym("ZZZ") == "ZZZ"
+    assert resolve_acronym("jda") == "jda"
+
+
+def test_enrichment_updates_indexes(acronyms):
+    enrich_acronym_cache("Union Sportive Oyonnax Basket")
+    assert resolve_acronym("USOB") == "Union Sportive Oyonnax Basket"
+    # Écriture différée : rien sur disque avant le flush.
+    assert not aliases._CACHE_FILE.exists()
+    assert aliases.flush_acronym_cache() == 1
+    assert json.loads(aliases._CACHE_FILE.read_text())["USOB"].startswith("Union")
+    # Acronyme déjà connu (casse ignorée) : aucun écrasement.
+    enrich_acronym_cache("Jeunesse Dynamique Amiens")
+    assert resolve_acronym("JDA") == "Dijon"
+
+
+def test_suggestions_tolerate_typos(acronyms):
+    enrich_acronym_cache("Union Sportive Oyonnax Basket")
+    assert suggest_clubs("Jeanne d\u2019Arc de Vichi")[0] == "Jeanne d'Arc de Vichy"
+    assert suggest_clubs("union sportive oyonax")[0] == "Union Sportive Oyonnax Basket"
+    assert suggest_clubs("zz") == []
+    assert suggest_clubs("qwxyz") == []
+
+
+def test_flush_merges_entries_from_other_processes(acronyms):
+    aliases._CACHE_FILE.write_text(
+        json.dumps({"JDA": "Dijon", "CCRB": "Champagne Châlons Reims Basket"})
+    )
+    enrich_acronym_cache("Union Sportive Oyonnax Basket")
+    enrich_acronym_cache("Jeunesse Dynamique Amiens Basket")
+    assert aliases.flush_acronym_cache() == 2
+
+    on_disk = json.loads(aliases._CACHE_FILE.read_text())
+    assert set(on_disk) == {"JDA", "CCRB", "USOB", "JDAB"}
+    # Les entrées de l'autre processus sont reprises en mémoire.
+    assert resolve_acronym("CCRB") == "Champagne Châlons Reims Basket"
+    assert aliases.flush_acronym_cache() == 0
+
+
+def test_enrichment_does_no_inline_disk_io(acronyms, monkeypatch):
+    def no_io(*args, **kwargs):
+        raise AssertionError("E/S disque sur le chemin de recherche")
+
+    monkeypatch.setattr(aliases, "write_atomic", no_io)
+    for i in range(50):
+        enrich_acronym_cache(f"Basket Club Numero {chr(65 + i % 26)}{i} Ville")
+    assert len(aliases._pending) > 0
+    aliases._pending.clear()
+
+
+def test_flush_keeps_a_corrupt_file_aside(acronyms):
+    aliases._CACHE_FILE.write_text('{"JDA": "Dijon", "CCRB": ')
+    enrich_acronym_cache("Union Sportive Oyonnax Basket")
+    assert aliases.flush_acronym_cache() == 1
+    backup = aliases._CACHE_FILE.with_suffix(".json.corrupt")
+    assert backup.read_text() == '{"JDA": "Dijon", "CCRB": '
+    assert set(json.loads(aliases._CACHE_FILE.read_text())) == {"USOB"}
+
+
+def test_flush_never_overwrites_an_unreadable_file(acronyms, monkeypatch):
+    aliases._CACHE_FILE.write_text('{"JDA": "Dijon"}')
+
+    def unreadable(*args, **kwargs):
+        raise PermissionError("lecture refusée")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(type(aliases._CACHE_FILE), "read_text", unreadable)
+        enrich_acronym_cache("Union Sportive Oyonnax Basket")
+        assert aliases.flush_acronym_cache() == 0
+    assert json.loads(aliases._CACHE_FILE.read_text()) == {"JDA": "Dijon"}
+    # Entrée remise en attente pour le prochain flush.
+    assert "USOB" in aliases._pending
@@ -0,0 +1,96 @@
+"""Calendrier club émis poule par poule (get_calendrier_club_service(on_chunk=...))."""
+
+import asyncio
+import json
+import types
+
+import pytest
+from fake_ffbb import CLUB_ID
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from ffbb_mcp import server
+from ffbb_mcp._state import reset_service_state
+from ffbb_mcp.services import get_calendrier_club_service
+
+
+@pytest.mark.asyncio
+async def test_chunks_follow_fastest_poule_and_end_with_order(fake_client):
+    expected = await get_calendrier_club_service(organisme_id=CLUB_ID)
+    reset_service_state()
+
+    # La première poule demandée est la plus lente.
+    slow_id = None
+    get_poule = fake_client.get_poule_async
+
+    async def get_poule_async(poule_id, **kwargs):
+        nonlocal slow_id
+        if slow_id is None:
+            slow_id = int(poule_id)
+        if int(poule_id) == slow_id:
+            await asyncio.sleep(0.05)
+        return await get_poule(poule_id, **kwargs)
+
+    fake_client.get_poule_async = get_poule_async
+    chunks = []
+
+    async def on_chunk(chunk):
+        chunks.append(chunk)
+
+    result = await get_calendrier_club_service(organisme_id=CLUB_ID, on_chunk=on_chunk)
+
+    assert result == expected
+    assert len(chunks) >= 3
+    assert chunks[0]["poule_id"] != str(slow_id)
+    assert chunks[-2]["poule_id"] == str(slow_id)
+    assert [c["done"] for c in chunks] == list(range(1, len(chunks) + 1))
+    assert {c["total"] for c in chunks} == {len(chunks)}
+
+    final = chunks[-1]
+    assert final["final"] is True
+    full = await get_calendrier_club_service(organisme_id=CLUB_ID, truncate=False)
+    assert final["ordre"] == [m["id"] for m in full]
+    streamed = {m["id"] for c in chunks[:-1] for m in c["rencontres"]}
+    assert set(final["ordre"]) <= streamed
+
+    # Servi depuis le cache : aucune émission partielle.
+    chunks.clear()
+    await get_calendrier_club_service(organisme_id=CLUB_ID, on_chunk=on_chunk)
+    assert chunks == []
+
+
+@pytest.mark.asyncio
+async def test_server_relays_chunks_as_progress_over_stdio(fake_client, monkeypatch):
+    monkeypatch.setenv("FFBB_RESPONSE_CACHE", "0")
+    messages = []
+
+    async def on_progress(progress, total, message):
+        messages.append(json.loads(message))
+
+    # Flux mémoire client/serveur : même chemin que le transport stdio.
+    async with create_connected_server_and_client_session(
+        server.mcp._mcp_server
+    ) as client:
+        result = await client.call_tool(
+            "ffbb_club",
+            {"action": "calendrier", "organisme_id": CLUB_ID},
+            progress_callback=on_progress,
+        )
+
+    assert not result.isError
+    assert len(messages) >= 2
+    assert all("poule_id" in m for m in messages[:-1])
+    assert messages[-1]["final"] is True
+
+
+def test_no_relay_without_token_or_in_json_http_mode():
+    def ctx(token, request):
+        meta = types.SimpleNamespace(progressToken=token)
+        return types.SimpleNamespace(
+            request_context=types.SimpleNamespace(meta=meta, request=request)
+        )
+
+    assert server._calendrier_progress(ctx(1, None)) is not None
+    assert server._calendrier_progress(ctx(None, None)) is None
+    # Streamable HTTP json_response : notifications jetées par le transport.
+    assert server.mcp.settings.json_response
+    assert server._calendrier_progress(ctx(1, object())) is None
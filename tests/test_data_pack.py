@@ -0,0 +1,140 @@
+"""Pack de données projeté en mémoire (data_pack.py, services)."""
+
+import time
+
+import pytest
+from fake_ffbb import CLUB_ID
+
+from ffbb_mcp import services
+from ffbb_mcp._state import reset_service_state
+from ffbb_mcp.data_pack import DataPack, write_pack
+
+
+@pytest.fixture
+def fake_client(fake_client, monkeypatch):
+    monkeypatch.delenv("FFBB_DATA_PACK", raising=False)
+    return fake_client
+
+
+def test_roundtrip_and_freshness(tmp_path):
+    path = tmp_path / "pack.bin"
+    write_pack(
+        path,
+        [
+            ("poule", 7, {"id": 7, "rencontres": []}),
+            ("organisme", 9326, {"id": 9326, "nom": "Stade Clermontois"}),
+            ("competition", 5, {"id": 5}),
+        ],
+        built_at=time.time() - 3600,
+    )
+    pack = DataPack(path, max_age=60)
+    assert len(pack) == 3
+    assert pack.get("organisme", 9326) == {"id": 9326, "nom": "Stade Clermontois"}
+    assert pack.get("organisme", 7) is None
+    assert pack.get("poule", 8) is None
+    assert pack.stats()["entities"] == {"organisme": 1, "competition": 1, "poule": 1}
+    # Pack ancien : organismes périmés, poules terminées toujours valables.
+    assert not pack.fresh("organisme")
+    assert pack.fresh("poule")
+    pack.close()
+
+    (tmp_path / "bad.bin").write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        DataPack(tmp_path / "bad.bin")
+
+
+@pytest.mark.asyncio
+async def test_cold_start_from_pack(fake_client, tmp_path, monkeypatch):
+    path = tmp_path / "pack.bin"
+    built = await services.build_data_pack(str(path), [CLUB_ID])
+    backend = fake_client.backend
+    finished = [
+        pid
+        for pid, p in backend.poules.items()
+        if all(r["joue"] not in (0, "0") for r in p["rencontres"])
+    ]
+    assert 0 < built["poule"] == len(finished) < len(backend.poules)
+    assert built["organisme"] == 1
+
+    # Nouveau worker : caches vides, pack projeté.
+    reset_service_state()
+    monkeypatch.setenv("FFBB_DATA_PACK", str(path))
+    fake_client.reset_calls()
+    assert services.open_data_pack()["entities"]["poule"] == len(finished)
+
+    org = await services.get_organisme_service(CLUB_ID, full=True)
+    assert len(org["engagements"]) == len(backend.organismes[CLUB_ID]["engagements"])
+    poule = await services.get_poule_service(finished[0])
+    assert poule["phase_terminee"] is True
+    assert await services.ffbb_get_classement_service(finished[0])
+    assert fake_client.calls["organisme"] == 0
+    assert fake_client.calls["poule"] == 0
+
+    # Poule en cours : absente du pack, lue chez la FFBB.
+    ongoing = next(pid for pid in backend.poules if pid not in finished)
+    await services.get_poule_service(ongoing)
+    assert fake_client.calls["poule"] == 1
+
+
+def test_truncated_pack_is_ignored(fake_client, tmp_path, monkeypatch):
+    path = tmp_path / "pack.bin"
+    write_pack(path, [("poule", 7, {"id": 7, "rencontres": []})])
+    data = path.read_bytes()
+    for size in (0, 10, len(data) - 1):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            DataPack(path)
+
+    reset_service_state()
+    monkeypatch.setenv("FFBB_DATA_PACK", str(path))
+    assert services.open_data_pack() is None
+
+
+async def _pack_worker(fake_client, tmp_path, monkeypatch) -> list[int]:
+    """Pack construit puis projeté par un worker neuf ; renvoie les poules figées."""
+    path = tmp_path / "pack.bin"
+    await services.build_data_pack(str(path), [CLUB_ID])
+    reset_service_state()
+    monkeypatch.setenv("FFBB_DATA_PACK", str(path))
+    services.open_data_pack()
+    fake_client.reset_calls()
+    return [
+        pid
+        for pid, p in fake_client.backend.poules.items()
+        if all(r["joue"] not in (0, "0") for r in p["rencontres"])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_bypasses_pack(fake_client, tmp_path, monkeypatch):
+    poule_id = (await _pack_worker(fake_client, tmp_path, monkeypatch))[0]
+
+    await services.get_poule_service(poule_id, force_refresh=True)
+    assert fake_client.calls["poule"] == 1
+    await services.ffbb_get_classement_service(poule_id, force_refresh=True)
+    assert fake_client.calls["poule"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_masks_pack_entries(fake_client, tmp_path, monkeypatch):
+    finished = await _pack_worker(fake_client, tmp_path, monkeypatch)
+
+    services.invalidate_cache(f"organisme:{CLUB_ID}")
+    await services.get_organisme_service(CLUB_ID)
+    assert fake_client.calls["organisme"] == 1
+
+    services.invalidate_cache(f"poule:{finished[0]}")
+    await services.get_poule_service(finished[0])
+    assert fake_client.calls["poule"] == 1
+    # Les autres entrées restent servies par le pack.
+    await services.get_poule_service(finished[1])
+    assert fake_client.calls["poule"] == 1
+
+    services.invalidate_cache(f"classement:{finished[2]}")
+    await services.ffbb_get_classement_service(finished[2])
+    assert fake_client.calls["poule"] == 2
+
+    # Un cache sans données persistées ne masque rien.
+    services.invalidate_cache("*", "lives")
+    assert await services.ffbb_get_classement_service(finished[3])
+    assert fake_client.calls["poule"] == 2
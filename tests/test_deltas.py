@@ -0,0 +1,94 @@
+"""Réponses delta des poules et calendriers (deltas.py)."""
+
+import pytest
+from fake_ffbb import CLUB_ID
+
+from ffbb_mcp import server
+from ffbb_mcp.deltas import SnapshotHistory, diff_rows, index_rows, rencontre_key
+from ffbb_mcp.services import invalidate_cache
+
+
+def _score(client, poule_id):
+    """Modifie le score d'une rencontre jouée dans le backend simulé."""
+    rencontres = client.backend.poules[poule_id]["rencontres"]
+    match = next(r for r in rencontres if r["joue"])
+    match["resultatEquipe1"] = (match["resultatEquipe1"] or 0) + 2
+    return match["id"]
+
+
+def test_diff_rows_changed_and_removed():
+    old = index_rows([{"id": 1, "s": 0}, {"id": 2, "s": 0}, {"x": 1}], rencontre_key)
+    new = index_rows([{"id": 1, "s": 2}, {"id": 3, "s": 0}], rencontre_key)
+    changed, removed = diff_rows(old, new)
+    assert changed == [{"id": 1, "s": 2}, {"id": 3, "s": 0}]
+    assert removed == [2]
+
+
+def test_history_is_bounded_and_builds_once():
+    history = SnapshotHistory(depth=2, max_resources=2)
+    builds = []
+
+    def build(n):
+        builds.append(n)
+        return {"rencontres": {1: {"id": 1, "n": n}}}
+
+    for n in range(3):
+        history.record("poule:1", f"v{n}", lambda n=n: build(n))
+    history.record("poule:1", "v2", lambda: build(99))
+    assert builds == [0, 1, 2]
+    assert history.get("poule:1", "v0") is None
+    assert history.delta("poule:1", "v1", "v2") == {"rencontres": [{"id": 1, "n": 2}]}
+
+    history.record("poule:2", "a", lambda: {})
+    history.record("poule:3", "a", lambda: {})
+    assert len(history) == 2 and history.get("poule:1", "v2") is None
+
+
+@pytest.mark.asyncio
+async def test_poule_delta_returns_only_changed_rows(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    first = await server.ffbb_get(id=poule_id, type="poule")
+    match_id = _score(fake_client, poule_id)
+
+    res = await server.ffbb_get(
+        id=poule_id,
+        type="poule",
+        force_refresh=True,
+        since_version=first["_version"],
+        delta=True,
+    )
+    assert res["delta"] is True and res["_version"] != first["_version"]
+    assert [r["id"] for r in res["rencontres"]] == [match_id]
+    assert len(res.get("classements", [])) < len(first["classements"])
+
+    # Version inconnue : poule complète.
+    full = await server.ffbb_get(
+        id=poule_id, type="poule", since_version="inconnue", delta=True
+    )
+    assert "delta" not in full and len(full["classements"]) == len(first["classements"])
+
+
+@pytest.mark.asyncio
+async def test_calendrier_delta_envelope(fake_client):
+    args = {"action": "calendrier", "organisme_id": CLUB_ID, "filtre": "U11M"}
+    first = (await server.ffbb_club(**args, delta=True))[0]
+    assert first["_version"] and first["rencontres"]
+
+    same = await server.ffbb_club(**args, delta=True, since_version=first["_version"])
+    assert same == [{"unchanged": True, "_version": first["_version"]}]
+
+    poule_id = next(
+        pid
+        for pid, p in fake_client.backend.poules.items()
+        if any(r["id"] == first["rencontres"][0]["id"] for r in p["rencontres"])
+    )
+    match_id = _score(fake_client, poule_id)
+    invalidate_cache("poule")
+    res = (
+        await server.ffbb_club(
+            **args, delta=True, since_version=first["_version"], force_refresh=True
+        )
+    )[0]
+    assert res["delta"] is True
+    assert match_id in [r["id"] for r in res["rencontres"]]
+    assert len(res["rencontres"]) < len(first["rencontres"])
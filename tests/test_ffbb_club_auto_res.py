@@ -90,4 +90,6 @@ async def test_ffbb_club_calendrier_with_numero_equipe():
             categorie="U11M",
             numero_equipe=1,
             force_refresh=False,
+            on_chunk=None,
+            truncate=True,
         )
@@ -0,0 +1,117 @@
+"""Poules de phases terminées figées hors TTL (services, palier figé)."""
+
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ffbb_mcp import reference_store, server, services
+from ffbb_mcp._state import reset_service_state, state
+
+
+@pytest.fixture
+def fake_client(fake_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("FFBB_REFERENCE_DB", str(tmp_path / "reference.db"))
+    monkeypatch.delenv("FFBB_DATA_PACK", raising=False)
+    monkeypatch.setattr(reference_store.refresher, "interval", 0)
+    return fake_client
+
+
+def _poules(client, *, finished):
+    return [
+        pid
+        for pid, p in client.backend.poules.items()
+        if all(r["joue"] not in (0, "0") for r in p["rencontres"]) is finished
+    ]
+
+
+@pytest.mark.asyncio
+async def test_finished_poule_survives_restart(fake_client):
+    poule_id = _poules(fake_client, finished=True)[0]
+    poule = await services.get_poule_service(poule_id)
+    classement = await services.ffbb_get_classement_service(poule_id)
+    assert poule["phase_terminee"] is True
+    assert state.reference_store.get(f"poule:{poule_id}") == poule
+    assert services.get_cache_stats()["frozen"] == 2
+
+    # Nouveau processus : caches mémoire vides, même base.
+    reset_service_state()
+    fake_client.reset_calls()
+    assert await services.get_poule_service(poule_id) == poule
+    assert await services.ffbb_get_classement_service(poule_id) == classement
+    assert fake_client.calls["poule"] == 0
+
+
+@pytest.mark.asyncio
+async def test_classement_reuses_frozen_poule(fake_client):
+    poule_id = _poules(fake_client, finished=True)[0]
+    await services.get_poule_service(poule_id)
+    fake_client.reset_calls()
+    assert await services.ffbb_get_classement_service(poule_id)
+    assert fake_client.calls["poule"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ongoing_poule_is_not_frozen(fake_client):
+    poule_id = _poules(fake_client, finished=False)[0]
+    await services.get_poule_service(poule_id)
+    await services.ffbb_get_classement_service(poule_id)
+    assert not state.frozen
+    assert state.reference_store.get(f"poule:{poule_id}") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_and_force_refresh_unfreeze(fake_client):
+    poule_id = _poules(fake_client, finished=True)[0]
+    await services.get_poule_service(poule_id)
+
+    removed = services.invalidate_cache(f"poule:{poule_id}")
+    assert removed["frozen"] == 1 and removed["reference"] == 1
+    fake_client.reset_calls()
+    await services.get_poule_service(poule_id)
+    assert fake_client.calls["poule"] == 1
+
+    # Phase rouverte : force_refresh relit et retire l'entrée figée.
+    fake_client.backend.poules[poule_id]["rencontres"][0]["joue"] = 0
+    poule = await services.get_poule_service(poule_id, force_refresh=True)
+    assert poule["phase_terminee"] is False
+    assert f"poule:{poule_id}" not in state.frozen
+    assert state.reference_store.get(f"poule:{poule_id}") is None
+
+
+@pytest.mark.asyncio
+async def test_match_day_serves_frozen_poule_without_rewrite(fake_client, monkeypatch):
+    poule_id = _poules(fake_client, finished=True)[0]
+    await server.ffbb_get(id=poule_id, type="poule")
+    monkeypatch.setattr(server, "is_match_day", lambda: True)
+    writes = AsyncMock(wraps=services._reference_put)
+    monkeypatch.setattr(services, "_reference_put", writes)
+    fake_client.reset_calls()
+
+    for _ in range(3):
+        await server.ffbb_get(id=poule_id, type="poule")
+    assert fake_client.calls["poule"] == 0
+    writes.assert_not_awaited()
+
+    # Relecture explicite au contenu inchangé : pas de réécriture non plus.
+    await server.ffbb_get(id=poule_id, type="poule", force_refresh=True)
+    assert fake_client.calls["poule"] == 1
+    writes.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_frozen_store_reads_run_off_the_event_loop(fake_client, monkeypatch):
+    poule_id = _poules(fake_client, finished=True)[0]
+    await services.get_poule_service(poule_id)
+    reset_service_state()
+    store = services._reference_store()
+    threads = []
+    read = store.get
+
+    def tracking_get(key):
+        threads.append(threading.get_ident())
+        return read(key)
+
+    monkeypatch.setattr(store, "get", tracking_get)
+    await services.get_poule_service(poule_id)
+    assert threads and threading.get_ident() not in threads
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from ffbb_mcp.loop_monitor import LoopMonitor
+from ffbb_mcp.metrics import generate_prometheus_metrics, get_snapshot
+
+
+def _blocking_helper_for_test() -> None:
+    time.sleep(0.25)
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_records_lag_and_reports_blocking_stack(caplog):
+    before = get_snapshot()["event_loop_blocks_total"]
+    monitor = LoopMonitor(interval=0.02, block_threshold=0.05, debug=True)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="ffbb-mcp"):
+            _blocking_helper_for_test()
+            await asyncio.sleep(0.1)
+    finally:
+        await monitor.stop()
+
+    snap = get_snapshot()
+    assert snap["event_loop_blocks_total"] > before
+    assert snap["event_loop_lag_max_seconds"] >= 0.1
+    assert "_blocking_helper_for_test" in caplog.text
+    assert "ffbb_event_loop_lag_seconds" in generate_prometheus_metrics()
+
+
+def test_loop_monitor_from_env(monkeypatch):
+    monkeypatch.setenv("FFBB_LOOP_BLOCK_THRESHOLD_MS", "250")
+    monkeypatch.setenv("FFBB_LOOP_BLOCK_DEBUG", "1")
+    monitor = LoopMonitor.from_env()
+    assert monitor is not None
+    assert monitor.block_threshold == 0.25
+    assert monitor.debug is True
+
+    monkeypatch.setenv("FFBB_LOOP_MONITOR", "0")
+    assert LoopMonitor.from_env() is None
@@ -0,0 +1,147 @@
+"""Pagination par curseur (pagination.py) des calendriers, poules et recherches."""
+
+from unittest.mock import create_autospec
+
+import pytest
+from fake_ffbb import CLUB_ID
+from mcp.shared.exceptions import McpError
+
+from ffbb_mcp import server, services
+from ffbb_mcp.pagination import decode_cursor, encode_cursor, paginate
+from ffbb_mcp.services import get_calendrier_club_service
+
+
+def test_cursor_roundtrip_and_invalid():
+    assert decode_cursor(encode_cursor(120, "abc")) == (120, "abc")
+    for bad in ("%%%", "e30", encode_cursor(-1, None)):
+        with pytest.raises(McpError):
+            decode_cursor(bad)
+
+
+def test_paginate_pages_and_stale_flag():
+    items = list(range(7))
+    first = paginate(items, None, 3, "v1")
+    assert first["items"] == [0, 1, 2] and first["_total"] == 7
+    second = paginate(items, first["next_cursor"], 3, "v1")
+    assert second["items"] == [3, 4, 5] and "cursor_stale" not in second
+    last = paginate(items, second["next_cursor"], 3, "v2")
+    assert last["items"] == [6] and "next_cursor" not in last
+    assert last["cursor_stale"] is True
+
+
+@pytest.mark.asyncio
+async def test_calendrier_pages_cover_untruncated_calendar(fake_client):
+    full = await get_calendrier_club_service(organisme_id=CLUB_ID, truncate=False)
+    assert len(full) > 300
+    fake_client.reset_calls()
+
+    seen, cursor = [], None
+    while True:
+        page = (
+            await server.ffbb_club(
+                action="calendrier",
+                organisme_id=CLUB_ID,
+                page_size=100,
+                cursor=cursor,
+            )
+        )[0]
+        seen.extend(page["rencontres"])
+        cursor = page.get("next_cursor")
+        if cursor is None:
+            break
+
+    assert [m["id"] for m in seen] == [m["id"] for m in full]
+    assert page["_total"] == len(full)
+    # Toutes les pages viennent du calendrier en cache.
+    assert fake_client.total_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_poule_page_formats_only_requested_rows(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    full = await server.ffbb_get(id=poule_id, type="poule")
+    page = await server.ffbb_get(id=poule_id, type="poule", page_size=10)
+    assert page["rencontres"] == full["rencontres"][:10]
+    assert page["_version"] == full["_version"]
+
+    nxt = await server.ffbb_get(
+        id=poule_id, type="poule", page_size=10, cursor=page["next_cursor"]
+    )
+    assert nxt["_offset"] == 10
+    assert nxt["rencontres"] == full["rencontres"][10:20]
+
+
+@pytest.mark.asyncio
+async def test_search_pages(fake_client):
+    page = (
+        await server.ffbb_search(
+            query="Départemental", type="competitions", page_size=5
+        )
+    )[0]
+    assert len(page["results"]) == 5 and page["next_cursor"]
+    nxt = (
+        await server.ffbb_search(
+            query="Départemental",
+            type="competitions",
+            page_size=5,
+            cursor=page["next_cursor"],
+        )
+    )[0]
+    assert nxt["_offset"] == 5
+    assert {r["id"] for r in nxt["results"]}.isdisjoint(
+        r["id"] for r in page["results"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_pages_request_the_page_pool_upstream(fake_client, monkeypatch):
+    search = fake_client.search_competitions_async
+    spy = create_autospec(search, side_effect=search)
+    monkeypatch.setattr(fake_client, "search_competitions_async", spy)
+    await server.ffbb_search(query="Départemental", type="competitions", page_size=5)
+    assert spy.await_args.kwargs["limit"] == 100
+
+
+@pytest.mark.asyncio
+async def test_search_without_upstream_limit_truncates_locally(
+    fake_client, monkeypatch
+):
+    search = fake_client.search_competitions_async
+
+    async def search_competitions_async(query, filter_by=None, sort=None):
+        return await search(query)
+
+    monkeypatch.setattr(
+        fake_client, "search_competitions_async", search_competitions_async
+    )
+    hits = await services.search_competitions_service("Départemental", limit=2)
+    assert len(hits) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_kwargs_match_the_real_client(fake_client, patch_get_client):
+    """Les kwargs passés à la vraie bibliothèque sont acceptés par sa signature."""
+    lib = pytest.importorskip("ffbb_api_client_v3")
+    for method in ("search_competitions_async", "search_organismes_async"):
+        if not hasattr(lib.FFBBAPIClientV3, method):
+            pytest.skip(f"ffbb_api_client_v3 sans {method}")
+    client = create_autospec(lib.FFBBAPIClientV3, instance=True)
+    client.search_competitions_async.return_value = None
+    client.search_organismes_async.return_value = None
+    patch_get_client.return_value = client
+    await services.search_competitions_service("Départemental", limit=5)
+    await services.search_organismes_service("Stade Clermontois", limit=5)
+    client.search_competitions_async.assert_awaited_once()
+    client.search_organismes_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delta_rejects_pagination(fake_client):
+    res = await server.ffbb_club(
+        action="calendrier", organisme_id=CLUB_ID, delta=True, page_size=10
+    )
+    assert "delta" in res[0]["error"]
+    poule_id = next(iter(fake_client.backend.poules))
+    res = await server.ffbb_get(id=poule_id, type="poule", delta=True, cursor="x")
+    assert "delta" in res["error"]
+    assert fake_client.total_calls == 0
@@ -0,0 +1,107 @@
+"""Projections déclaratives appliquées avant mise en cache."""
+
+import pytest
+from fake_ffbb import CLUB_ID
+
+from ffbb_mcp import projections, server, services
+from ffbb_mcp._state import reset_service_state, state
+from ffbb_mcp.projections import (
+    POULE_PROJECTION,
+    directus_fields,
+    project,
+    project_payload,
+)
+
+
+def test_project_keeps_only_declared_fields():
+    data = {
+        "id": 1,
+        "commentaire": "x",
+        "rencontres": [
+            {
+                "id": 10,
+                "joue": 0,
+                "forfaitEquipe1": False,
+                "idEngagementEquipe1": {"id": 5, "numeroEquipe": "2", "club": {}},
+                "idEngagementEquipe2": 6,
+            }
+        ],
+    }
+    assert project(data, POULE_PROJECTION) == {
+        "id": 1,
+        "rencontres": [
+            {
+                "id": 10,
+                "joue": 0,
+                "idEngagementEquipe1": {"id": 5, "numeroEquipe": "2"},
+                "idEngagementEquipe2": 6,
+            }
+        ],
+    }
+
+
+def test_project_payload_disabled(monkeypatch):
+    monkeypatch.setattr(projections, "_PROJECTION_ENABLED", False)
+    data = {"id": 1, "commentaire": "x"}
+    assert project_payload("poule", data) is data
+
+
+def test_directus_fields_are_dotted_paths():
+    fields = directus_fields(POULE_PROJECTION)
+    assert "rencontres.idEngagementEquipe1.numeroEquipe" in fields
+    assert "classements.id_engagement.logo.id" in fields
+    assert "rencontres" not in fields
+
+
+@pytest.mark.asyncio
+async def test_poule_cache_holds_projection_and_full_variant(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    projected = await services.get_poule_service(poule_id)
+    full = await services.get_poule_service(poule_id, full=True)
+
+    assert "commentaire" not in projected["rencontres"][0]
+    assert "commentaire" in full["rencontres"][0]
+    restantes = projected["rencontres_restantes_par_equipe"]
+    assert restantes == full["rencontres_restantes_par_equipe"]
+    assert {f"poule:{poule_id}", f"poule:{poule_id}:full"} <= set(state.cache_poule)
+
+
+@pytest.mark.asyncio
+async def test_organisme_projection_and_ffbb_get_opt_out(fake_client):
+    org = await services.get_organisme_service(CLUB_ID)
+    assert set(org) == {"id", "nom", "code", "engagements"}
+
+    raw = await server.ffbb_get(id=CLUB_ID, type="organisme")
+    assert "adresse" in raw and "commune" in raw
+
+
+@pytest.mark.parametrize(
+    ("tool", "args"),
+    [
+        ("ffbb_bilan", {"organisme_id": CLUB_ID, "categorie": "U11M1"}),
+        ("ffbb_club", {"action": "calendrier", "organisme_id": CLUB_ID}),
+        ("ffbb_club", {"action": "equipes", "organisme_id": CLUB_ID}),
+        (
+            "ffbb_next_match",
+            {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+        ),
+        (
+            "ffbb_last_result",
+            {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_tool_outputs_unchanged_by_projection(
+    fake_client, monkeypatch, tool, args
+):
+    async def _call():
+        return await server.mcp._tool_manager.call_tool(
+            tool, args, context=None, convert_result=True
+        )
+
+    projected = await _call()
+    reset_service_state()
+    monkeypatch.setattr(projections, "_PROJECTION_ENABLED", False)
+    unprojected = await _call()
+    assert projected == unprojected
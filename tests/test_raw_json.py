@@ -0,0 +1,183 @@
+"""Parité entre le mode JSON brut (FFBB_RAW_JSON=1) et le chemin modèles.
+
+Le chemin modèles est celui de la vraie bibliothèque ``ffbb_api_client_v3`` :
+le payload Directus est validé par la classe que renvoie
+``FFBBAPIClientV3.get_poule_async`` / ``get_organisme_async``, puis sérialisé
+par les services. Sans la bibliothèque, ces tests de parité sont ignorés.
+"""
+
+import json
+import types
+import typing
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fake_ffbb import CLUB_ID, FakeFFBBBackend
+from pydantic import BaseModel, ConfigDict
+
+from ffbb_mcp import services
+from ffbb_mcp._state import reset_service_state
+from ffbb_mcp.client import FFBBClientFactory
+from ffbb_mcp.utils import loads_json
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+def _real_model(method: str) -> typing.Any:
+    """Classe de modèle renvoyée par ``FFBBAPIClientV3.<method>``."""
+    lib = pytest.importorskip("ffbb_api_client_v3")
+    func = getattr(lib.FFBBAPIClientV3, method, None)
+    if func is None:
+        pytest.skip(f"ffbb_api_client_v3 sans {method}")
+    try:
+        returned = typing.get_type_hints(func)["return"]
+    except Exception:
+        pytest.skip(f"type de retour de {method} introuvable")
+    candidates = (
+        typing.get_args(returned)
+        if isinstance(returned, types.UnionType)
+        or typing.get_origin(returned) is typing.Union
+        else (returned,)
+    )
+    for cls in candidates:
+        if isinstance(cls, type) and cls is not type(None):
+            return cls
+    pytest.skip(f"type de retour de {method} non exploitable : {returned}")
+
+
+def _validate(cls, payload):
+    if hasattr(cls, "model_validate"):
+        return cls.model_validate(payload)
+    return cls.from_dict(payload)
+
+
+@pytest.fixture
+def backend():
+    reset_service_state()
+    yield FakeFFBBBackend()
+    reset_service_state()
+
+
+@pytest.fixture
+def raw_mode(monkeypatch, backend):
+    """Active le mode brut : l'API Directus renvoie {"data": ...} en JSON."""
+
+    async def fake_raw(path, params=None):
+        kind, item_id = path.split("/")[1], int(path.rsplit("/", 1)[1])
+        source = backend.poules if kind == "ffbbserver_poules" else backend.organismes
+        return loads_json(json.dumps({"data": source[item_id]}).encode())
+
+    raw = AsyncMock(side_effect=fake_raw)
+    monkeypatch.setattr(services, "_RAW_JSON_ENABLED", True)
+    monkeypatch.setattr(services, "get_raw_json_async", raw)
+    return raw
+
+
+def _library_client(mock_client, backend):
+    """Chemin modèles : payloads validés par les modèles de la bibliothèque."""
+    poule_cls = _real_model("get_poule_async")
+    organisme_cls = _real_model("get_organisme_async")
+    mock_client.get_poule_async = AsyncMock(
+        side_effect=lambda poule_id: _validate(poule_cls, backend.poules[poule_id])
+    )
+    mock_client.get_organisme_async = AsyncMock(
+        side_effect=lambda organisme_id: _validate(
+            organisme_cls, backend.organismes[organisme_id]
+        )
+    )
+
+
+def _model_client(mock_client, backend):
+    mock_client.get_poule_async = AsyncMock(
+        side_effect=lambda poule_id: _Model(**backend.poules[poule_id])
+    )
+    mock_client.get_organisme_async = AsyncMock(
+        side_effect=lambda organisme_id: _Model(**backend.organismes[organisme_id])
+    )
+
+
+@pytest.mark.asyncio
+async def test_poule_raw_matches_model_path(mock_client, backend, monkeypatch):
+    _library_client(mock_client, backend)
+    poule_id = backend.live_poule_ids()[0]  # phase en cours : matchs restants
+
+    via_models = await services.get_poule_service(poule_id)
+    reset_service_state()
+
+    raw = AsyncMock(return_value={"data": backend.poules[poule_id]})
+    monkeypatch.setattr(services, "_RAW_JSON_ENABLED", True)
+    monkeypatch.setattr(services, "get_raw_json_async", raw)
+    via_raw = await services.get_poule_service(poule_id)
+
+    assert via_raw == via_models
+    assert via_raw["rencontres_restantes_par_equipe"]
+    raw.assert_awaited_once()
+    mock_client.get_poule_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_organisme_and_classement_raw_match_model_path(
+    mock_client, backend, raw_mode, monkeypatch
+):
+    _library_client(mock_client, backend)
+    poule_id = next(iter(backend.poules))
+
+    via_raw_org = await services.get_organisme_service(CLUB_ID)
+    via_raw_cls = await services.ffbb_get_classement_service(poule_id)
+    assert mock_client.get_organisme_async.await_count == 0
+    assert mock_client.get_poule_async.await_count == 0
+
+    reset_service_state()
+    monkeypatch.setattr(services, "_RAW_JSON_ENABLED", False)
+    via_models_org = await services.get_organisme_service(CLUB_ID)
+    via_models_cls = await services.ffbb_get_classement_service(poule_id)
+
+    assert via_raw_org == via_models_org
+    assert via_raw_cls == via_models_cls
+
+
+@pytest.mark.asyncio
+async def test_raw_failure_falls_back_to_model_path(mock_client, backend, monkeypatch):
+    _model_client(mock_client, backend)
+    monkeypatch.setattr(services, "_RAW_JSON_ENABLED", True)
+    monkeypatch.setattr(
+        services, "get_raw_json_async", AsyncMock(side_effect=ValueError("boom"))
+    )
+    org = await services.get_organisme_service(CLUB_ID)
+    assert org["id"] == CLUB_ID
+    mock_client.get_organisme_async.assert_awaited_once()
+
+
+def test_loads_json_accepts_bytes_and_str():
+    assert loads_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert loads_json('{"b": null}') == {"b": None}
+
+
+@pytest.mark.asyncio
+async def test_raw_fields_follow_projection(mock_client, backend, raw_mode):
+    await services.get_organisme_service(CLUB_ID)
+    await services.get_organisme_service(CLUB_ID, full=True)
+    (_, projected), (_, full) = (c.args for c in raw_mode.await_args_list)
+    assert "engagements.idPoule.id" in projected["fields"].split(",")
+    assert full["fields"] == "*.*.*"
+
+
+@pytest.mark.asyncio
+async def test_reset_closes_raw_session(monkeypatch):
+    session = httpx.AsyncClient()
+    monkeypatch.setattr(FFBBClientFactory, "_raw_session", session)
+    FFBBClientFactory.reset()
+    assert FFBBClientFactory._raw_session is None
+    while FFBBClientFactory._closing:
+        await next(iter(FFBBClientFactory._closing))
+    assert session.is_closed
+
+
+def test_reset_closes_raw_session_without_loop(monkeypatch):
+    session = httpx.AsyncClient()
+    monkeypatch.setattr(FFBBClientFactory, "_raw_session", session)
+    FFBBClientFactory.reset()
+    assert session.is_closed
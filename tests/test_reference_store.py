@@ -0,0 +1,154 @@
+"""Base de référence hors ligne (reference_store.py, services)."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from fake_ffbb import CLUB_ID, ENTENTE_ID
+
+from ffbb_mcp import reference_store, services
+from ffbb_mcp._state import reset_service_state, state
+from ffbb_mcp.reference_store import ReferenceStore
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "reference.db"
+    monkeypatch.setenv("FFBB_REFERENCE_DB", str(path))
+    monkeypatch.setattr(reference_store.refresher, "interval", 0)
+    reset_service_state()
+    yield path
+    reset_service_state()
+
+
+@pytest.fixture
+def fake_client(db_path, fake_client):
+    return fake_client
+
+
+def test_store_roundtrip_and_staleness(tmp_path):
+    store = ReferenceStore(tmp_path / "ref.db")
+    assert store.put("organisme:1", {"id": 1, "nom": "Gerzat"}, fetched_at=0)
+    assert not store.put("organisme:1", {"nom": "Gerzat", "id": 1}, fetched_at=0)
+    assert store.get("organisme:1") == {"id": 1, "nom": "Gerzat"}
+    assert store.get("organisme:2") is None
+
+    store.put("competition:5", {"id": 5})
+    assert store.stale("organisme", max_age=60, limit=10) == ["organisme:1"]
+    assert store.stale("competition", max_age=60, limit=10) == []
+    assert store.stats()["entities"] == {"competition": 1, "organisme": 1}
+    assert store.delete(["organisme:1", "organisme:9"]) == 1
+    store.close()
+
+
+def test_import_file(tmp_path):
+    export = tmp_path / "export.json"
+    export.write_text(
+        json.dumps(
+            {
+                "organismes": [{"id": 9326, "nom": "SCBA"}],
+                "competitions": [{"id": 100001, "nom": "DM U11"}],
+                "saisons": [{"id": 2024, "actif": False}, {"id": 2025, "actif": True}],
+            }
+        )
+    )
+    store = ReferenceStore(tmp_path / "ref.db")
+    assert store.import_file(export) == 4
+    assert store.get("saisons:True") == [{"id": 2025, "actif": True}]
+    assert store.get("competition:100001")["nom"] == "DM U11"
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_details_survive_restart_without_upstream_calls(fake_client):
+    org = await services.get_organisme_service(CLUB_ID)
+    comp_id = next(iter(fake_client.backend.competitions))
+    comp = await services.get_competition_service(comp_id)
+    saisons = await services.get_saisons_service()
+    assert fake_client.total_calls == 3
+
+    # Nouveau processus : caches mémoire vides, même base.
+    reset_service_state()
+    fake_client.reset_calls()
+    assert await services.get_organisme_service(CLUB_ID) == org
+    assert (await services.get_organisme_service(CLUB_ID, full=True))["engagements"]
+    assert await services.get_competition_service(comp_id) == comp
+    assert await services.get_saisons_service() == saisons
+    assert fake_client.total_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_rewrites_only_changed_entries(fake_client):
+    await services.get_organisme_service(CLUB_ID)
+    await services.get_organisme_service(ENTENTE_ID)
+    store = state.reference_store
+    for oid in (CLUB_ID, ENTENTE_ID):
+        key = f"organisme:{oid}"
+        store.put(key, store.get(key), fetched_at=time.time() - 3600)
+    fake_client.backend.organismes[CLUB_ID]["nom"] = "SCBA RENOMMÉ"
+
+    result = await services.refresh_reference_store(max_age=60)
+    assert result == {"checked": 2, "changed": 1}
+    assert store.stale("organisme", max_age=60, limit=10) == []
+    fake_client.reset_calls()
+    org = await services.get_organisme_service(CLUB_ID)
+    assert org["nom"] == "SCBA RENOMMÉ"
+    assert fake_client.total_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_the_store(fake_client):
+    await services.get_organisme_service(CLUB_ID)
+    removed = services.invalidate_cache(f"organisme:{CLUB_ID}")
+    assert removed["reference"] == 1
+    fake_client.reset_calls()
+    await services.get_organisme_service(CLUB_ID)
+    assert fake_client.calls["organisme"] == 1
+
+
+@pytest.mark.asyncio
+async def test_crawl_filters_regions(fake_client):
+    counts = await services.crawl_reference_store([CLUB_ID, ENTENTE_ID], ("IDF",))
+    assert counts == {"organisme": 0, "competition": 0, "saisons": 2}
+
+    counts = await services.crawl_reference_store([CLUB_ID, ENTENTE_ID], ("ARA",))
+    assert counts["organisme"] == 2
+    assert counts["competition"] == len(fake_client.backend.competitions)
+
+
+@pytest.mark.asyncio
+async def test_reads_run_off_the_event_loop(fake_client, monkeypatch):
+    await services.get_organisme_service(CLUB_ID)
+    reset_service_state()
+    store = services._reference_store()
+    threads = []
+    read = store.get
+
+    def tracking_get(key):
+        threads.append(threading.get_ident())
+        return read(key)
+
+    monkeypatch.setattr(store, "get", tracking_get)
+    await services.get_organisme_service(CLUB_ID)
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_store_opens_off_the_event_loop(fake_client, monkeypatch):
+    threads = []
+
+    class TrackingStore(ReferenceStore):
+        def __init__(self, path):
+            threads.append(threading.get_ident())
+            super().__init__(path)
+
+    monkeypatch.setattr(services, "ReferenceStore", TrackingStore)
+    await asyncio.gather(
+        services.get_organisme_service(CLUB_ID),
+        services.get_competition_service(1),
+    )
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
+    assert isinstance(state.reference_store, TrackingStore)
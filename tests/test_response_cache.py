@@ -0,0 +1,121 @@
+"""Cache des réponses d'outils pré-sérialisées (response_cache.py)."""
+
+import pytest
+from fake_ffbb import CLUB_ID
+from mcp.types import CallToolRequest, CallToolRequestParams, CallToolResult
+
+from ffbb_mcp import response_cache, server
+from ffbb_mcp._state import state
+from ffbb_mcp.response_cache import call_tool_cached, response_cache_key
+from ffbb_mcp.services import (
+    _cache_set,
+    get_cache_stats,
+    get_poule_service,
+    invalidate_cache,
+)
+
+BILAN = {"organisme_id": CLUB_ID, "categorie": "U11M1"}
+
+
+async def _call(name, args):
+    """Comme ``mcp.call_tool``, avec context=None (hors requête MCP)."""
+    return await call_tool_cached(
+        name,
+        args,
+        lambda: server.mcp._tool_manager.call_tool(
+            name, args, context=None, convert_result=True
+        ),
+    )
+
+
+def test_key_normalizes_arguments():
+    a = response_cache_key("ffbb_bilan", {"categorie": "U11M1", "organisme_id": 1})
+    b = response_cache_key(
+        "ffbb_bilan", {"organisme_id": 1, "club_name": None, "categorie": "U11M1"}
+    )
+    assert a == b
+    assert response_cache_key("ffbb_lives", {}) is None
+    assert response_cache_key("ffbb_bilan", {"force_refresh": True}) is None
+
+
+@pytest.mark.asyncio
+async def test_warm_hit_returns_prebuilt_result(fake_client):
+    computed = await _call("ffbb_bilan", BILAN)
+    fake_client.reset_calls()
+
+    hit = await _call("ffbb_bilan", BILAN)
+    assert isinstance(hit, CallToolResult)
+    assert hit.structuredContent == computed[1]
+    assert hit.content[0].text == computed[0][0].text
+    assert await _call("ffbb_bilan", dict(BILAN)) is hit
+    assert fake_client.total_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_only_read_data_invalidates(fake_client):
+    await _call("ffbb_bilan", BILAN)
+
+    # Écriture sans rapport, ou réécriture d'une poule lue à contenu égal.
+    _cache_set(state.cache_detail, "organisme:1", {"id": 1}, "organisme")
+    for key in [k for k in state.cache_poule if k.startswith("poule:")]:
+        await get_poule_service(key.split(":")[1], force_refresh=True)
+    assert isinstance(await _call("ffbb_bilan", BILAN), CallToolResult)
+
+    invalidate_cache("poule")
+    assert not isinstance(await _call("ffbb_bilan", BILAN), CallToolResult)
+
+
+@pytest.mark.asyncio
+async def test_bypass_on_force_refresh(fake_client):
+    await _call("ffbb_bilan", BILAN)
+    forced = await _call("ffbb_bilan", {**BILAN, "force_refresh": True})
+    assert not isinstance(forced, CallToolResult)
+
+
+@pytest.mark.asyncio
+async def test_match_day_bounds_response_age(fake_client, monkeypatch):
+    monkeypatch.setattr(response_cache, "is_match_day", lambda: True)
+    await _call("ffbb_bilan", BILAN)
+    assert isinstance(await _call("ffbb_bilan", BILAN), CallToolResult)
+
+    monkeypatch.setattr(response_cache, "_match_day_max_age", lambda: -1)
+    assert not isinstance(await _call("ffbb_bilan", BILAN), CallToolResult)
+
+
+@pytest.mark.asyncio
+async def test_error_payloads_are_not_cached(fake_client):
+    args = {"action": "equipes"}
+    await _call("ffbb_club", args)
+    res = await _call("ffbb_club", args)
+    assert not isinstance(res, CallToolResult)
+    assert "error" in res[1]["result"][0]
+
+
+@pytest.mark.asyncio
+async def test_lowlevel_handler_serves_cached_result(fake_client):
+    handler = server.mcp._mcp_server.request_handlers[CallToolRequest]
+    req = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="ffbb_get", arguments={"id": CLUB_ID, "type": "organisme"}
+        ),
+    )
+    first = await handler(req)
+    cached = await handler(req)
+    assert cached.root.model_dump() == first.root.model_dump()
+    assert not cached.root.isError
+    assert isinstance(
+        await server.mcp.call_tool("ffbb_get", req.params.arguments), CallToolResult
+    )
+
+
+@pytest.mark.asyncio
+async def test_entries_keep_versions_not_caches(fake_client):
+    computed = await _call("ffbb_get", {"id": CLUB_ID, "type": "organisme"})
+    ((response, deps, _),) = state.cache_response.values()
+    assert deps and all(
+        isinstance(name, str) and isinstance(version, str) for name, _, version in deps
+    )
+    # Taille estimée = texte JSON encodé, pas les caches services lus.
+    stats = get_cache_stats()["caches"]["response"]
+    assert stats["bytes_estimate"] == len(computed[0][0].text)
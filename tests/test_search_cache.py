@@ -0,0 +1,86 @@
+"""Réutilisation du cache de recherche (limites, préfixes, multi-search)."""
+
+import pytest
+from fake_ffbb import ENTENTE_ID
+
+from ffbb_mcp import services
+from ffbb_mcp._state import reset_service_state
+from ffbb_mcp.services import search_competitions_service, search_organismes_service
+
+
+@pytest.mark.asyncio
+async def test_larger_limit_serves_smaller_ones(fake_client):
+    wide = await search_competitions_service("Départemental", limit=10)
+    assert len(wide) == 10
+    narrow = await search_competitions_service("Départemental", limit=5)
+    assert narrow == wide[:5]
+    assert fake_client.calls["search:competitions"] == 1
+
+    # Limite plus grande que le résultat tronqué en cache : appel amont.
+    await search_competitions_service("Départemental", limit=15)
+    assert fake_client.calls["search:competitions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_complete_result_serves_any_limit(fake_client):
+    full = await search_competitions_service("Départemental", limit=50)
+    assert len(full) < 50
+    assert await search_competitions_service("Départemental", limit=100) == full
+    assert fake_client.calls["search:competitions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefix_refinement_is_opt_in(fake_client, monkeypatch):
+    await search_organismes_service("stade", limit=20)
+    await search_organismes_service("stade clermontois aub", limit=20)
+    assert fake_client.calls["search:organismes"] == 2
+
+    reset_service_state()
+    fake_client.reset_calls()
+    monkeypatch.setattr(services, "_SEARCH_PREFIX_REFINE", True)
+    await search_organismes_service("stade", limit=20)
+    refined = await search_organismes_service("stade clermontois aub", limit=20)
+    assert [h["id"] for h in refined] == [ENTENTE_ID]
+    assert fake_client.calls["search:organismes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_multi_search_fills_per_index_caches(fake_client):
+    merged = await services.multi_search_service("stade", limit=20)
+    assert {h["_type"] for h in merged} == {"ffbbserver_organismes"}
+    orgs = await search_organismes_service("stade", limit=20)
+    assert [h["id"] for h in orgs] == [h["id"] for h in merged]
+    assert "_type" not in orgs[0]
+    assert fake_client.calls["search:organismes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_multi_search_assembled_from_per_index_caches(fake_client):
+    sent = []
+    multi = fake_client.multi_search_async
+
+    async def multi_search_async(queries, **kwargs):
+        sent.append([q.index_uid for q in queries])
+        return await multi(queries, **kwargs)
+
+    fake_client.multi_search_async = multi_search_async
+
+    await search_organismes_service("stade", limit=20)
+    partial = await services.multi_search_service("stade", limit=10)
+    # Seuls les 6 index absents du cache partent en multi-search.
+    assert len(sent) == 1 and "ffbbserver_organismes" not in sent[0]
+    assert len(sent[0]) == 6
+
+    for search in (
+        services.search_competitions_service,
+        services.search_rencontres_service,
+        services.search_salles_service,
+        services.search_pratiques_service,
+        services.search_terrains_service,
+        services.search_tournois_service,
+    ):
+        await search("clermontois", limit=20)
+    await search_organismes_service("clermontois", limit=20)
+    assembled = await services.multi_search_service("clermontois", limit=10)
+    assert len(sent) == 1
+    assert [h["id"] for h in assembled] == [h["id"] for h in partial]
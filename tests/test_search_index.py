@@ -0,0 +1,166 @@
+"""Index local des organismes (search_index.py) et résolution sans Meilisearch."""
+
+import json
+import time
+
+import pytest
+from fake_ffbb import CLUB_ID, ENTENTE_ID
+from mcp.server.fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from ffbb_mcp import aliases, search_index
+from ffbb_mcp._state import reset_service_state, state
+from ffbb_mcp.app_factory import create_app
+from ffbb_mcp.search_index import OrganismeIndex, TrigramIndex, fold
+from ffbb_mcp.services import _resolve_club_and_org
+
+ORGS = [
+    {"id": 1, "nom": "Stade Clermontois Basket Auvergne", "code": "A1"},
+    {"id": 2, "nom": "ENT. STADE CLERMONTOIS / AUBIERE", "code": "A2"},
+    {"id": 3, "nom": "Gerzat Basket", "code": "A3"},
+    {"id": 4, "nom": "Élan Béarnais Pau-Lacq-Orthez", "code": "A4"},
+]
+
+
+@pytest.fixture
+def index():
+    idx = OrganismeIndex()
+    for org in ORGS:
+        idx.add(org)
+    return idx
+
+
+@pytest.fixture
+def fake_client(fake_client, monkeypatch, tmp_path):
+    # Les clubs résolus enrichissent le cache d'acronymes : pas sur le dépôt.
+    monkeypatch.setattr(aliases, "_CACHE_FILE", tmp_path / "acronyms.json")
+    return fake_client
+
+
+def test_fold_strips_accents_and_punctuation():
+    assert fold("Élan Béarnais Pau-Lacq") == "ELAN BEARNAIS PAU LACQ"
+
+
+def test_exact_name_and_acronym_resolve_locally(index):
+    hits = index.resolve("stade clermontois basket auvergne", 1)
+    assert [h["id"] for h in hits] == [1]
+    assert [h["id"] for h in index.resolve("SCBA", 1)] == [1]
+    assert index.resolve("Clermont", 1) is None
+    # Moins de clubs connus que la limite : Meilisearch doit compléter.
+    assert index.resolve("SCBA", 5) is None
+
+
+def test_prefix_search_includes_ententes(index):
+    assert index.prefix_search("clermontois") == ["2", "1"]
+    assert index.prefix_search("stade clerm aub") == ["2"]
+    assert index.prefix_search("xyz") == []
+
+
+def test_learned_query_covers_smaller_limits_only(index):
+    index.learn("clermont", 2, [ORGS[0], ORGS[1]])
+    assert [h["id"] for h in index.resolve("Clermont", 1)] == [1]
+    assert index.resolve("clermont", 5) is None
+    # Résultat plus court que sa limite : complet pour toute limite.
+    index.learn("gerzat", 5, [ORGS[2]])
+    assert [h["id"] for h in index.resolve("GERZAT", 50)] == [3]
+
+
+def test_learned_query_expires(index, monkeypatch):
+    index.query_ttl = 60
+    index.learn("gerzat", 5, [ORGS[2]])
+    assert index.resolve("gerzat", 5) is not None
+    later = time.time() + 61
+    monkeypatch.setattr(search_index.time, "time", lambda: later)
+    assert index.resolve("gerzat", 5) is None
+
+
+def test_expired_queries_are_not_persisted(index, tmp_path, monkeypatch):
+    index.learn("gerzat", 5, [ORGS[2]])
+    path = tmp_path / "orgs.json"
+    index.save(path)
+    loaded = OrganismeIndex(query_ttl=60)
+    later = time.time() + 61
+    monkeypatch.setattr(search_index.time, "time", lambda: later)
+    loaded.load(path)
+    assert loaded.resolve("gerzat", 5) is None
+    assert len(loaded) == len(index)
+
+
+def test_fuzzy_suggestions():
+    trigrams = TrigramIndex()
+    trigrams.add("a", "Gerzat Basket")
+    trigrams.add("b", "Clermont Basket")
+    assert trigrams.search("gerzta basket")[0][0] == "a"
+    trigrams.discard("a")
+    assert "a" not in trigrams
+
+
+def test_save_and_load_roundtrip(index, tmp_path):
+    index.learn("gerzat", 5, [ORGS[2]])
+    path = tmp_path / "orgs.json"
+    index.save(path)
+    assert index.dirty == 0
+    loaded = OrganismeIndex()
+    loaded.load(path)
+    assert len(loaded) == len(index)
+    assert [h["id"] for h in loaded.resolve("gerzat", 10)] == [3]
+    loaded.load(tmp_path / "absent.json")
+    assert len(loaded) == len(index)
+
+
+@pytest.mark.asyncio
+async def test_repeat_resolution_skips_meilisearch(fake_client):
+    first, _ = await _resolve_club_and_org("Stade Clermontois", None)
+    ids = {str(c["organisme_id"]) for c in first}
+    assert {str(CLUB_ID), str(ENTENTE_ID)} <= ids
+    assert fake_client.calls["search:organismes"] >= 1
+
+    # Cache de recherche expiré : l'index local répond seul.
+    state.cache_search.clear()
+    fake_client.reset_calls()
+    again, _ = await _resolve_club_and_org("Stade Clermontois", None)
+    assert again == first
+    assert fake_client.calls["search:organismes"] == 0
+
+
+def _rebuilt_words(idx):
+    return sorted(
+        (w, oid) for oid, folded in idx._folded.items() for w in set(folded.split())
+    )
+
+
+def test_prefix_words_stay_sorted_incrementally(index, tmp_path):
+    assert index._words == _rebuilt_words(index)
+    index.add({"id": 3, "nom": "Gerzat Basket Club"})
+    index.add({"id": 5, "nom": "Aubière Basket"})
+    assert index._words == _rebuilt_words(index)
+    assert index.prefix_search("gerz") == ["3"]
+
+    path = tmp_path / "orgs.json"
+    index.save(path)
+    loaded = OrganismeIndex()
+    loaded.load(path)
+    assert loaded._words == index._words
+
+
+def test_snapshot_is_encoded_like_dumps(index):
+    index.learn("gerzat", 5, [ORGS[2]])
+    snapshot = index.snapshot()
+    assert index.dirty == 0
+    index.add({"id": 6, "nom": "Riom Basket"})  # après la copie : non persistée
+    encoded = json.loads(OrganismeIndex.encode(snapshot))
+    assert [o["id"] for o in encoded["organismes"]] == [o["id"] for o in ORGS]
+    assert encoded["queries"]["GERZAT"][0] == ["3"]
+
+
+def test_index_is_loaded_by_the_http_lifespan(index, tmp_path, monkeypatch):
+    path = tmp_path / "orgs.json"
+    index.save(path)
+    monkeypatch.setenv("FFBB_ORG_INDEX_PATH", str(path))
+    reset_service_state()
+    try:
+        with TestClient(create_app(FastMCP("lifespan-test"), ["*"])):
+            assert state.organisme_index_loaded
+            assert len(state.organisme_index) == len(ORGS)
+    finally:
+        reset_service_state()
@@ -5,6 +5,7 @@ import numbers
 import pytest
 from mcp.server.fastmcp import FastMCP
 
+from ffbb_mcp._state import state
 from ffbb_mcp.server import (
     _build_index_html,
     _build_robots_txt,
@@ -13,6 +14,7 @@ from ffbb_mcp.server import (
     ffbb_version,
     mcp,
 )
+from ffbb_mcp.services import _cache_set
 
 
 def test_server_initialization():
@@ -116,3 +118,52 @@ def test_sitemap_xml_uses_canonical_root(monkeypatch):
 
     assert "<loc>https://ffbb.desimone.fr/</loc>" in sitemap
     assert "<changefreq>weekly</changefreq>" in sitemap
+
+
+def test_admin_cache_route_requires_token(monkeypatch):
+    from starlette.testclient import TestClient
+
+    from ffbb_mcp.admin import register_admin
+
+    monkeypatch.delenv("FFBB_ADMIN_TOKEN", raising=False)
+    app = FastMCP("admin-test")
+    register_admin(app)
+    client = TestClient(app.streamable_http_app())
+    assert client.get("/admin/cache").status_code == 404
+
+    monkeypatch.setenv("FFBB_ADMIN_TOKEN", "s3cret")
+    assert client.get("/admin/cache").status_code == 401
+    headers = {"Authorization": "Bearer s3cret"}
+    resp = client.get("/admin/cache", headers=headers)
+    assert resp.status_code == 200
+    assert "detail" in resp.json()["caches"]
+    resp = client.delete("/admin/cache?pattern=poule:*", headers=headers)
+    assert resp.status_code == 200
+    assert "poule" in resp.json()["removed"]
+
+
+@pytest.mark.asyncio
+async def test_cache_admin_tool_registered_only_with_token(monkeypatch):
+    from ffbb_mcp.admin import register_admin
+
+    monkeypatch.delenv("FFBB_ADMIN_TOKEN", raising=False)
+    app = FastMCP("admin-test")
+    register_admin(app)
+    assert "ffbb_cache_admin" not in {t.name for t in await app.list_tools()}
+
+    monkeypatch.setenv("FFBB_ADMIN_TOKEN", "s3cret")
+    app = FastMCP("admin-test")
+    register_admin(app)
+    tool = next(t for t in await app.list_tools() if t.name == "ffbb_cache_admin")
+    assert tool.annotations.readOnlyHint is False
+    _, denied = await app.call_tool(
+        "ffbb_cache_admin", {"admin_token": "nope", "action": "stats"}
+    )
+    assert denied == {"error": "unauthorized"}
+    for key in ("organisme:1", "organisme:2"):
+        _cache_set(state.cache_detail, key, {"id": key}, "organisme")
+    _, stats = await app.call_tool(
+        "ffbb_cache_admin", {"admin_token": "s3cret", "action": "stats", "top": 1}
+    )
+    assert stats["caches"]["detail"]["size"] >= 2
+    assert len(stats["caches"]["detail"]["top_keys"]) == 1
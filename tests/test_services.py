@@ -15,11 +15,14 @@ from ffbb_mcp.services import (
     ffbb_equipes_club_service,
     ffbb_get_classement_service,
     ffbb_resolve_team_service,
+    get_cache_stats,
+    get_cache_stats_async,
     get_calendrier_club_service,
     get_competition_service,
     get_organisme_service,
     get_poule_service,
     get_saisons_service,
+    invalidate_cache,
     multi_search_service,
     search_organismes_service,
 )
@@ -118,6 +121,73 @@ class TestGetOrganismeService:
         assert result == {}
 
 
+# ---------------------------------------------------------------------------
+# Tests — introspection / invalidation des caches
+# ---------------------------------------------------------------------------
+
+
+class TestCacheAdmin:
+    @staticmethod
+    def _org(organisme_id):
+        org = MagicMock()
+        org.model_dump.return_value = {"id": organisme_id, "nom": "Club"}
+        return org
+
+    @pytest.mark.asyncio
+    async def test_stats_report_size_age_and_top_keys(
+        self, patch_get_client, mock_client
+    ):
+        mock_client.get_organisme_async = AsyncMock(
+            side_effect=lambda organisme_id: self._org(organisme_id)
+        )
+        await get_organisme_service(12)
+        await get_organisme_service(123)
+        await get_organisme_service(123)
+
+        stats = get_cache_stats()
+        detail = stats["caches"]["detail"]
+        assert detail["size"] == 2
+        assert detail["bytes_estimate"] > 0
+        assert detail["oldest_age_seconds"] >= 0
+        assert detail["top_keys"][0] == {
+            "key": "organisme:123",
+            "hits": 1,
+            "age_seconds": detail["top_keys"][0]["age_seconds"],
+        }
+        assert stats["inflight"]["detail"] == 0
+
+        # Variante async : mêmes mesures, calculées hors de la boucle.
+        measured = await get_cache_stats_async(top=1)
+        assert (
+            measured["caches"]["detail"]["bytes_estimate"] == detail["bytes_estimate"]
+        )
+        assert [k["key"] for k in measured["caches"]["detail"]["top_keys"]] == [
+            "organisme:123"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_prefix_and_glob(self, patch_get_client, mock_client):
+        mock_client.get_organisme_async = AsyncMock(
+            side_effect=lambda organisme_id: self._org(organisme_id)
+        )
+        for organisme_id in (12, 123, 456):
+            await get_organisme_service(organisme_id)
+
+        # Préfixe aligné sur les segments : organisme:12 ne touche pas 123.
+        assert invalidate_cache("organisme:12")["detail"] == 1
+        assert get_cache_stats()["caches"]["detail"]["size"] == 2
+
+        assert invalidate_cache("organisme:*", "detail") == {"detail": 2}
+        await get_organisme_service(123)
+        assert mock_client.get_organisme_async.await_count == 4
+
+    def test_invalidate_rejects_empty_pattern_and_unknown_cache(self):
+        with pytest.raises(McpError):
+            invalidate_cache("  ")
+        with pytest.raises(McpError):
+            invalidate_cache("*", "inconnu")
+
+
 # ---------------------------------------------------------------------------
 # Tests — ffbb_equipes_club_service
 # ---------------------------------------------------------------------------
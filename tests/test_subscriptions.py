@@ -0,0 +1,91 @@
+"""Abonnements aux scores en direct (subscriptions.py)."""
+
+import pytest
+from fake_ffbb import _Payload
+from mcp.shared.exceptions import McpError
+
+from ffbb_mcp import server
+from ffbb_mcp._state import state
+from ffbb_mcp.services import get_poule_service
+from ffbb_mcp.subscriptions import LIVES_URI, LiveSubscriptions
+
+
+class _Session:
+    def __init__(self, fail=False):
+        self.updated = []
+        self.fail = fail
+
+    async def send_resource_updated(self, uri):
+        if self.fail:
+            raise ConnectionError("fermée")
+        self.updated.append(str(uri))
+
+
+@pytest.fixture
+def hub():
+    hub = LiveSubscriptions(interval=3600)
+    hub.start = lambda: None
+    return hub
+
+
+def _set_lives(client, lives):
+    async def get_lives_async(**_):
+        await client._hit("lives")
+        return [_Payload(**live) for live in lives]
+
+    client.get_lives_async = get_lives_async
+    state.cache_lives.clear()
+
+
+@pytest.mark.asyncio
+async def test_one_upstream_poll_fans_out_to_subscribers(fake_client, hub):
+    pid = fake_client.backend.live_poule_ids()[0]
+    uri = f"ffbb://poule/{pid}"
+    a, b, other = _Session(), _Session(), _Session()
+    hub.subscribe(uri, a)
+    hub.subscribe(uri, b)
+    hub.subscribe(LIVES_URI, other)
+
+    _set_lives(fake_client, [{"poule_id": pid, "score_equipe1": 10}])
+    assert await hub.poll_once() == []
+    await get_poule_service(pid)
+    fake_client.reset_calls()
+
+    _set_lives(fake_client, [{"poule_id": pid, "score_equipe1": 12}])
+    assert sorted(await hub.poll_once()) == sorted([uri, LIVES_URI])
+    assert a.updated == b.updated == [uri]
+    assert other.updated == [LIVES_URI]
+    assert fake_client.calls["lives"] == 1
+    assert f"poule:{pid}" not in state.cache_poule
+
+    # Scores inchangés : aucune notification.
+    state.cache_lives.clear()
+    assert await hub.poll_once() == []
+
+    # Match terminé (disparu des lives) : notification finale.
+    _set_lives(fake_client, [])
+    assert await hub.poll_once() == [uri, LIVES_URI]
+
+
+@pytest.mark.asyncio
+async def test_dead_sessions_are_dropped(fake_client, hub):
+    dead = _Session(fail=True)
+    hub.subscribe(LIVES_URI, dead)
+    _set_lives(fake_client, [])
+    await hub.poll_once()
+    _set_lives(fake_client, [{"poule_id": 1, "score_equipe1": 2}])
+    await hub.poll_once()
+    assert not hub.has_subscribers()
+
+
+def test_subscribe_rejected_when_stateless_or_unknown_uri(hub):
+    with pytest.raises(McpError):
+        hub.subscribe("ffbb://organisme/1", _Session())
+    hub.enabled = False
+    with pytest.raises(McpError):
+        hub.subscribe(LIVES_URI, _Session())
+
+
+def test_capability_advertised():
+    options = server.mcp._mcp_server.create_initialization_options()
+    assert options.capabilities.resources.subscribe is True
@@ -0,0 +1,74 @@
+"""Noms d'équipes normalisés précalculés (services._team_key / _match_team_name)."""
+
+import sys
+
+import pytest
+
+from ffbb_mcp import services
+from ffbb_mcp._state import reset_service_state, state
+from ffbb_mcp.services import (
+    _match_team_name,
+    _normalize_name,
+    _team_key,
+    get_poule_service,
+)
+
+
+def _legacy_match(nom: str, club: str, numero: int | None) -> bool:
+    nom_norm, club_norm = _normalize_name(nom), _normalize_name(club)
+    if not nom_norm or not club_norm or club_norm not in nom_norm:
+        return False
+    search_num = numero if numero is not None else 1
+    suffix = f"- {search_num}"
+    if search_num == 1:
+        return nom_norm.endswith(suffix) or not any(c.isdigit() for c in nom_norm)
+    return nom_norm.endswith(suffix)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset_service_state()
+    yield
+    reset_service_state()
+
+
+@pytest.mark.parametrize(
+    "nom",
+    [
+        "Stade Clermontois Basket",
+        "STADE CLERMONTOIS BASKET - 1",
+        "stade clermontois basket - 2",
+        "Stade Clermontois Basket - 12",
+        "Stade Clermontois Basket -2",
+        "Stade Clermontois U15 - 21",
+        "Élan Chalon - 1",
+        "",
+    ],
+)
+@pytest.mark.parametrize("numero", [None, 1, 2, 12])
+def test_match_is_unchanged(nom, numero):
+    for club in ("stade clermontois", "Élan Chalon", ""):
+        assert _match_team_name(nom, club, numero) == _legacy_match(nom, club, numero)
+
+
+@pytest.mark.asyncio
+async def test_poule_caching_precomputes_team_keys(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+
+    poule = await get_poule_service(poule_id)
+    names = {r["nomEquipe1"] for r in poule["rencontres"]}
+    assert names <= set(state.team_keys)
+
+    key = _team_key(next(iter(names)))
+    assert key is state.team_keys[next(iter(names))]
+    # Chaînes internées : comparaison par identité possible.
+    assert key.norm is sys.intern(key.norm)
+
+
+def test_team_keys_evict_least_recently_used(monkeypatch):
+    monkeypatch.setattr(services, "_MAX_TEAM_KEYS", 3)
+    for name in ("A - 1", "B - 1", "C - 1"):
+        _team_key(name)
+    _team_key("A - 1")  # relu : reste en table
+    _team_key("D - 1")
+    assert list(state.team_keys) == ["C - 1", "A - 1", "D - 1"]
@@ -0,0 +1,105 @@
+"""Autocomplétion locale (search_index.PrefixIndex, ffbb_typeahead)."""
+
+import random
+
+import pytest
+from fake_ffbb import CLUB_ID, ENTENTE_ID
+
+from ffbb_mcp import server
+from ffbb_mcp.search_index import PrefixIndex, fold
+
+
+def _rec(key, nom, kind="organismes"):
+    return key, {"id": key, "nom": nom, "_type": kind}, nom
+
+
+@pytest.fixture
+def index():
+    idx = PrefixIndex()
+    for entry in (
+        _rec("1", "Stade Clermontois Basket Auvergne"),
+        _rec("2", "ENT. Stade Clermontois / Aubière"),
+        _rec("3", "Gerzat Basket"),
+        _rec("4", "Stade", "salles"),
+        _rec("5", "Championnat Départemental U13", "competitions"),
+    ):
+        idx.add(*entry)
+    return idx
+
+
+def test_prefix_lookup_and_ranking(index):
+    assert [r["id"] for r in index.search("stade")] == ["4", "2", "1"]
+    assert [r["id"] for r in index.search("cler st")] == ["2", "1"]
+    assert [r["id"] for r in index.search("aubi")] == ["2"]
+    assert [r["id"] for r in index.search("depart u1")] == ["5"]
+    assert index.search("zzz") == []
+    only_orgs = index.search("stade", accept=lambda r: r["_type"] == "organismes")
+    assert [r["id"] for r in only_orgs] == ["2", "1"]
+
+
+def test_rename_replaces_words(index):
+    index.add(*_rec("3", "Gerzat Volley"))
+    assert index.search("bask gerz") == []
+    assert [r["id"] for r in index.search("gerzat vol")] == ["3"]
+    assert len(index) == 5
+
+
+def test_add_many_matches_incremental(index):
+    bulk = PrefixIndex()
+    bulk.add_many(
+        [
+            _rec("1", "Stade Clermontois Basket Auvergne"),
+            _rec("2", "ENT. Stade Clermontois / Aubière"),
+            _rec("3", "Gerzat Basket"),
+            _rec("4", "Stade", "salles"),
+            _rec("5", "Championnat Départemental U13", "competitions"),
+        ]
+    )
+    for q in ("stade", "bask", "u13", "cl"):
+        assert bulk.search(q) == index.search(q)
+
+
+def test_both_plans_match_brute_force():
+    rng = random.Random(7)
+    vocab = ["stade", "stadium", "clermont", "cler", "basket", "union", "ent", "u13"]
+    entries = [
+        _rec(str(i), " ".join(rng.sample(vocab, rng.randint(1, 4))))
+        for i in range(3000)
+    ]
+    idx = PrefixIndex()
+    idx.add_many(entries)
+
+    def brute(query, limit):
+        words = fold(query).split()
+        ranked = sorted(
+            (fold(text) != " ".join(words), len(fold(text)), key)
+            for key, _, text in entries
+            if all(any(n.startswith(w) for n in fold(text).split()) for w in words)
+        )
+        return [key for _, _, key in ranked[:limit]]
+
+    # "s" et "stade" : préfixes fréquents (parcours par longueur) ;
+    # "u13 clermont union" : plage étroite.
+    for query in ("s", "stade", "sta cle", "u13 clermont union", "basket stade"):
+        for limit in (1, 10, 50):
+            assert [r["id"] for r in idx.search(query, limit)] == brute(query, limit)
+
+
+@pytest.mark.asyncio
+async def test_typeahead_goes_upstream_once_then_answers_locally(fake_client):
+    first = await server.ffbb_typeahead(query="stade clerm")
+    assert first["source"] == "upstream"
+    assert {r["id"] for r in first["results"]} == {CLUB_ID, ENTENTE_ID}
+    fake_client.reset_calls()
+
+    second = await server.ffbb_typeahead(
+        query="Stade Clermontois Au", types=["organismes"]
+    )
+    assert second["source"] == "local"
+    assert [r["id"] for r in second["results"]] == [ENTENTE_ID, CLUB_ID]
+    assert fake_client.total_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_typeahead_registered():
+    assert "ffbb_typeahead" in {t.name for t in await server.mcp.list_tools()}
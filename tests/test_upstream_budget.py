@@ -0,0 +1,84 @@
+"""Budgets d'appels FFBB amont par outil MCP.
+
+Chaque outil est invoqué via FastMCP contre le backend simulé de
+``tools/fake_ffbb.py`` : une invocation à froid doit rester sous son budget
+d'appels amont, et la même invocation à chaud ne doit plus en faire aucun.
+"""
+
+import json
+
+import pytest
+from fake_ffbb import CLUB_ID
+
+from ffbb_mcp import server
+from ffbb_mcp.metrics import generate_prometheus_metrics, track_upstream_calls
+
+# (outil, arguments, budget d'appels amont à froid)
+BUDGETS = [
+    ("ffbb_search", {"query": "Stade Clermontois", "type": "organismes"}, 1),
+    ("ffbb_get", {"id": CLUB_ID, "type": "organisme"}, 1),
+    ("ffbb_bilan", {"organisme_id": CLUB_ID, "categorie": "U11M1"}, 3),
+    ("ffbb_team_summary", {"organisme_id": CLUB_ID, "categorie": "U11M1"}, 3),
+    (
+        "ffbb_last_result",
+        {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+        3,
+    ),
+    (
+        "ffbb_next_match",
+        {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+        3,
+    ),
+    (
+        "ffbb_club",
+        {"action": "calendrier", "organisme_id": CLUB_ID, "filtre": "U11M"},
+        5,
+    ),
+]
+
+
+async def _call(name, args):
+    return await server.mcp._tool_manager.call_tool(
+        name, args, context=None, convert_result=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("name", "args", "cold_budget"), BUDGETS)
+async def test_upstream_budget(fake_client, name, args, cold_budget):
+    with track_upstream_calls() as cold:
+        await _call(name, args)
+    assert 0 < sum(cold.values()) <= cold_budget, cold
+    assert sum(cold.values()) == fake_client.total_calls
+
+    with track_upstream_calls() as warm:
+        await _call(name, args)
+    assert warm == {}
+
+
+@pytest.mark.asyncio
+async def test_upstream_calls_labelled_by_endpoint(fake_client):
+    with track_upstream_calls() as calls:
+        await _call(
+            "ffbb_team_summary", {"organisme_id": CLUB_ID, "categorie": "U11M1"}
+        )
+    assert calls.get("organisme") == 1
+    assert calls.get("poule", 0) >= 1
+
+    metrics = generate_prometheus_metrics()
+    assert 'ffbb_upstream_calls_total{endpoint="organisme"}' in metrics
+    assert 'ffbb_tool_upstream_calls_total{tool="ffbb_team_summary"}' in metrics
+
+
+@pytest.mark.asyncio
+async def test_debug_meta_upstream_calls(fake_client, monkeypatch):
+    monkeypatch.setenv("FFBB_MCP_DEBUG_UPSTREAM", "1")
+    _, structured = await _call("ffbb_get", {"id": CLUB_ID, "type": "organisme"})
+    payload = structured.get("result", structured)
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    assert payload["_meta"]["upstream_calls"] == {"organisme": 1}
+
+    monkeypatch.delenv("FFBB_MCP_DEBUG_UPSTREAM")
+    _, structured = await _call("ffbb_get", {"id": CLUB_ID, "type": "organisme"})
+    assert "_meta" not in structured.get("result", structured)
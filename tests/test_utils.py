@@ -1,5 +1,10 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+from ffbb_mcp import utils
 from ffbb_mcp.aliases import _normalize_apostrophes, normalize_query
-from ffbb_mcp.utils import prune_payload, serialize_model
+from ffbb_mcp.utils import prune_payload, serialize_model, serialize_models
 
 
 def test_serialize_simple_types():
@@ -35,6 +40,29 @@ def test_serialize_object():
     assert "_private" not in serialized
 
 
+class DemoHit(BaseModel):
+    id: int
+    nom: str
+    jour: date | None = None
+
+
+def test_serialize_models_bulk_matches_per_item():
+    hits = [DemoHit(id=i, nom=f"Club {i}", jour=date(2025, 1, i + 1)) for i in range(3)]
+    assert serialize_models(hits) == [serialize_model(h) for h in hits]
+    assert serialize_models(hits)[0]["jour"] == "2025-01-01"
+
+
+def test_serialize_models_mixed_and_empty():
+    assert serialize_models([]) == []
+    assert serialize_models(None) == []
+    mixed = [DemoHit(id=1, nom="A"), {"id": 2}, DemoObject()]
+    assert serialize_models(mixed) == [
+        {"id": 1, "nom": "A", "jour": None},
+        {"id": 2},
+        {"a": 1},
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Tests — Bug 1 : normalisation des apostrophes
 # ---------------------------------------------------------------------------
@@ -134,3 +162,28 @@ class TestPrunePayload:
         assert prune_payload(123) == 123
         assert prune_payload("hello") == "hello"
         assert prune_payload(None) is None
+
+    def test_prune_drops_empty_values_and_items(self):
+        data = {"a": None, "b": [], "c": {}, "d": 0, "e": "", "f": [None, {}, [], 1]}
+        assert prune_payload(data) == {"d": 0, "e": "", "f": [1]}
+
+    def test_prune_wide_dict_keeps_essentials_and_counts_omitted(self):
+        data = {f"k{i:02d}": i for i in range(60)}
+        data.update({"id": 1, "position": 2, "vide": None})
+        pruned = prune_payload(data)
+        assert pruned["id"] == 1 and pruned["position"] == 2
+        assert [k for k in pruned if k.startswith("k")] == [
+            f"k{i:02d}" for i in range(25)
+        ]
+        assert pruned["_omitted_count"] == 35
+
+    def test_prune_list_limit_read_once(self, monkeypatch):
+        monkeypatch.setenv("FFBB_MCP_PRUNE_LIMIT", "1")  # ignoré après import
+        monkeypatch.setattr(utils, "_PRUNE_LIST_LIMIT", 2)
+        assert prune_payload([1, 2, 3]) == [1, 2, {"_omitted_count": 1}]
+
+    def test_prune_fuses_model_serialization(self):
+        hits = [DemoHit(id=1, nom="A", jour=date(2025, 1, 1)), DemoHit(id=2, nom="B")]
+        assert prune_payload({"hits": hits}) == {
+            "hits": [{"id": 1, "nom": "A", "jour": "2025-01-01"}, {"id": 2, "nom": "B"}]
+        }
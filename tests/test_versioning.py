@@ -0,0 +1,98 @@
+"""Versions de contenu : ETag HTTP, ffbb_get(since_version), ressources."""
+
+import pytest
+from fake_ffbb import CLUB_ID
+from mcp.server.fastmcp import FastMCP
+from starlette.testclient import TestClient
+
+from ffbb_mcp import server, services
+from ffbb_mcp.resources import register_http_resources, render_versioned
+from ffbb_mcp.services import data_version
+from ffbb_mcp.utils import content_version
+
+
+def test_content_version_ignores_key_order_and_version_key():
+    a = {"id": 1, "nom": "A", "rencontres": [{"id": 2}]}
+    b = {"rencontres": [{"id": 2}], "nom": "A", "id": 1, "_version": "x"}
+    assert content_version(a) == content_version(b)
+    assert content_version(a) != content_version({**a, "nom": "B"})
+
+
+def test_data_version_is_memoized_per_object(monkeypatch):
+    data = {"id": 1}
+    first = data_version(data)
+    monkeypatch.setattr(services, "content_version", lambda d: "recalculé")
+    assert data_version(data) == first
+    assert data_version({"id": 1}) == "recalculé"
+    assert data_version({}) is None
+
+
+@pytest.mark.asyncio
+async def test_ffbb_get_since_version_short_response(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    full = await server.ffbb_get(id=poule_id, type="poule")
+    version = full["_version"]
+    assert full["rencontres"]
+
+    again = await server.ffbb_get(id=poule_id, type="poule", since_version=version)
+    assert again == {
+        "id": poule_id,
+        "type": "poule",
+        "unchanged": True,
+        "_version": version,
+    }
+    stale = await server.ffbb_get(id=poule_id, type="poule", since_version="old")
+    assert stale["_version"] == version and stale["rencontres"]
+
+    org = await server.ffbb_get(id=CLUB_ID, type="organisme")
+    assert (
+        await server.ffbb_get(
+            id=CLUB_ID, type="organisme", since_version=org["_version"]
+        )
+    )["unchanged"] is True
+
+
+@pytest.mark.asyncio
+async def test_ffbb_get_poule_does_not_mutate_cache(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    cached = await services.get_poule_service(poule_id, full=True)
+    before = content_version(cached)
+    await server.ffbb_get(id=poule_id, type="poule")
+    await server.ffbb_get(id=poule_id, type="poule")
+    assert content_version(cached) == before
+    assert "equipe" not in cached["classements"][0]
+
+
+@pytest.mark.asyncio
+async def test_resource_json_is_encoded_once_per_version(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    data = await services.get_poule_service(poule_id, full=True)
+    body, version = render_versioned(data)
+    assert version == data_version(data)
+    assert render_versioned(data)[0] is body
+
+
+def test_http_etag_and_if_none_match(fake_client):
+    poule_id = next(iter(fake_client.backend.poules))
+    app = FastMCP("etag-test")
+    register_http_resources(app)
+    client = TestClient(app.streamable_http_app())
+
+    resp = client.get(f"/api/poule/{poule_id}")
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert resp.json()["id"] == poule_id
+
+    not_modified = client.get(f"/api/poule/{poule_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    assert (
+        client.get(
+            f"/api/poule/{poule_id}", headers={"If-None-Match": '"autre"'}
+        ).status_code
+        == 200
+    )
+    assert client.get(f"/api/organisme/{CLUB_ID}").headers["etag"]
+    assert client.get("/api/salle/1").status_code == 404
@@ -0,0 +1,105 @@
+"""Micro-benchmark de la résolution d'alias et d'acronymes (``ffbb_mcp.aliases``).
+
+Compare, pour des caches d'acronymes de taille croissante :
+
+- ``resolve_acronym`` indexé (dict en majuscules) face au parcours linéaire
+  historique (``key.upper() == query`` sur tout le cache) ;
+- ``normalize_query`` avec la regex combinée face à la boucle historique
+  d'un ``re.sub`` par alias ;
+- ``suggest_clubs`` (trigrammes + distance d'édition) sur une faute de frappe.
+
+Le cache est remplacé en mémoire uniquement (aucune écriture disque).
+
+Usage :
+    uv run python tools/bench_aliases.py
+    uv run python tools/bench_aliases.py --number 20000 --sizes 10 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import re
+import timeit
+
+from ffbb_mcp import aliases
+
+_LEGACY_ALIASES = [
+    (re.compile(r"\b" + re.escape(alias) + r"\b"), official)
+    for alias, official in aliases._ALIAS_REPLACEMENTS
+]
+_QUERIES = ["U13 JAV", "ldlc asvel espoirs", "stade clermontois u15", "SCBA"]
+
+
+def _legacy_resolve_acronym(cache: dict[str, str], query: str) -> str:
+    for key, value in cache.items():
+        if key.upper() == query.upper():
+            return value
+    return query
+
+
+def _legacy_replace(query: str) -> str:
+    normalized = query.lower().strip()
+    for pattern, official in _LEGACY_ALIASES:
+        normalized = pattern.sub(official, normalized)
+    return normalized
+
+
+def _filtered_replace(query: str) -> str:
+    """Étape alias de ``normalize_query`` : boucle seulement si un alias figure."""
+    normalized = query.lower().strip()
+    if aliases._ALIAS_PATTERN.search(normalized):
+        for pattern, official in aliases._COMPILED_ALIASES:
+            normalized = pattern.sub(official, normalized)
+    return normalized
+
+
+def _build_cache(size: int) -> dict[str, str]:
+    cache = dict(aliases._DEFAULT_ACRONYMS)
+    letters = itertools.product("ABCDEFGHKLMNPRSTUV", repeat=4)
+    while len(cache) < size:
+        key = "".join(next(letters))
+        cache.setdefault(key, f"Club Basket {key.title()} Association")
+    return cache
+
+
+def _us(seconds: float, number: int) -> float:
+    return seconds / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    args = parser.parse_args()
+    n = args.number
+
+    print(f"{'cache':>7} {'acronyme linéaire':>18} {'indexé':>9} (µs/appel)")
+    for size in args.sizes:
+        cache = _build_cache(size)
+        aliases._set_acronyms_cache(cache)
+        linear = timeit.timeit(
+            lambda c=cache: _legacy_resolve_acronym(c, "ZZZZ"), number=n
+        )
+        indexed = timeit.timeit(lambda: aliases.resolve_acronym("ZZZZ"), number=n)
+        print(f"{size:>7} {_us(linear, n):>18.2f} {_us(indexed, n):>9.2f}")
+
+    loop = timeit.timeit(lambda: [_legacy_replace(q) for q in _QUERIES], number=n)
+    filtered = timeit.timeit(lambda: [_filtered_replace(q) for q in _QUERIES], number=n)
+    per = n * len(_QUERIES)
+    print(
+        f"\nalias : boucle {_us(loop, per):.2f} µs, "
+        f"regex combinée puis boucle {_us(filtered, per):.2f} µs"
+    )
+
+    fuzzy_n = max(1, n // 50)
+    fuzzy = timeit.timeit(
+        lambda: aliases.suggest_clubs("club basket abcd asociation"), number=fuzzy_n
+    )
+    print(
+        f"suggest_clubs (cache {args.sizes[-1]}) : {_us(fuzzy, fuzzy_n):.1f} µs/appel"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Micro-benchmark de la sérialisation des payloads FFBB (poule, organisme, hits).
+
+Les données viennent du backend simulé (``tools/fake_ffbb.py``) et sont
+rechargées dans des modèles Pydantic typés qui reproduisent la structure des
+modèles de ``ffbb_api_client_v3`` (objets imbriqués, listes de rencontres et
+de classements). On compare :
+
+- ``serialize_model`` élément par élément (chemin historique) ;
+- ``serialize_models`` (une seule passe Rust via ``TypeAdapter``) ;
+- la validation directe depuis les octets JSON bruts
+  (``model_validate_json``) face à ``json.loads`` + ``model_validate`` ;
+- la taille et le coût de ``prune_payload`` avant/après projection des champs
+  (``ffbb_mcp.projections``) ;
+- ``prune_payload`` en une passe face à l'implémentation historique (deux
+  dicts, limite relue dans l'environnement à chaque liste) sur un calendrier
+  de 300 matchs, et la variante fusionnée sérialisation + élagage.
+
+Usage :
+    uv run python tools/bench_payloads.py
+    uv run python tools/bench_payloads.py --number 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_ffbb import CLUB_ID, FakeFFBBBackend
+
+from ffbb_mcp import utils
+from ffbb_mcp.projections import project_payload
+from ffbb_mcp.utils import prune_payload, serialize_model, serialize_models
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class Engagement(_Model):
+    id: int
+    numeroEquipe: int | None = None
+
+
+class Rencontre(_Model):
+    id: int
+    numeroJournee: int
+    date_rencontre: str
+    joue: int
+    nomEquipe1: str
+    nomEquipe2: str
+    resultatEquipe1: int | None = None
+    resultatEquipe2: int | None = None
+    idEngagementEquipe1: Engagement
+    idEngagementEquipe2: Engagement
+    nomSalle: str | None = None
+    villeSalle: str | None = None
+
+
+class Classement(_Model):
+    position: int
+    organisme_id: int | None = None
+
+
+class Poule(_Model):
+    id: int
+    nom: str
+    rencontres: list[Rencontre]
+    classements: list[Classement]
+
+
+class Organisme(_Model):
+    id: int
+    nom: str
+    engagements: list[dict[str, Any]]
+
+
+class Hit(_Model):
+    id: int
+    nom: str
+
+
+def _legacy_prune_payload(obj: Any, depth: int = 0) -> Any:
+    """Implémentation historique de ``prune_payload`` (référence du bench)."""
+    if depth > 10:
+        return "<max depth reached>"
+    if isinstance(obj, dict):
+        cleaned = {
+            k: _legacy_prune_payload(v, depth + 1)
+            for k, v in obj.items()
+            if v is not None and v != [] and v != {}
+        }
+        if len(cleaned) > 50:
+            sorted_keys = sorted(cleaned.keys())
+            kept_keys = {k for k in sorted_keys if k in utils._ESSENTIAL_KEYS}
+            other_keys = [k for k in sorted_keys if k not in utils._ESSENTIAL_KEYS]
+            for k in other_keys[:25]:
+                kept_keys.add(k)
+            pruned = {k: cleaned[k] for k in kept_keys}
+            if len(other_keys) > 25:
+                pruned["_omitted_count"] = len(other_keys) - 25
+            return pruned
+        return cleaned
+    elif isinstance(obj, list):
+        limit = int(os.environ.get("FFBB_MCP_PRUNE_LIMIT", "50"))
+        cleaned_list = [_legacy_prune_payload(item, depth + 1) for item in obj[:limit]]
+        final_list = [
+            item
+            for item in cleaned_list
+            if item is not None and item != {} and item != []
+        ]
+        if len(obj) > limit:
+            final_list.append({"_omitted_count": len(obj) - limit})
+        return final_list
+    return obj
+
+
+def _rencontres(backend: FakeFFBBBackend, size: int) -> list[dict[str, Any]]:
+    rencontres = [r for p in backend.poules.values() for r in p["rencontres"]]
+    return [rencontres[i % len(rencontres)] for i in range(size)]
+
+
+def _calendrier(backend: FakeFFBBBackend, size: int) -> list[dict[str, Any]]:
+    """Calendrier club de ``size`` matchs (forme de ``get_calendrier_club_service``)."""
+    out = []
+    for i, r in enumerate(_rencontres(backend, size)):
+        out.append(
+            {
+                "id": 900000 + i,
+                "date": r["date_rencontre"],
+                "joue": r["joue"],
+                "equipe1": r["nomEquipe1"],
+                "equipe2": r["nomEquipe2"],
+                "score_equipe1": r["resultatEquipe1"],
+                "score_equipe2": r["resultatEquipe2"],
+                "competition_nom": "Départemental U11M - Phase 1",
+                "num_journee": r["numeroJournee"],
+                "is_last_match": False,
+                "is_next_match": None,
+                "salle": r.get("nomSalle"),
+                "commentaire": r.get("commentaire"),
+            }
+        )
+    return out
+
+
+def _bench_prune(backend: FakeFFBBBackend, number: int) -> None:
+    calendrier = _calendrier(backend, 300)
+    rencontres = [Rencontre.model_validate(r) for r in _rencontres(backend, 300)]
+    for limit in (50, 300):
+        os.environ["FFBB_MCP_PRUNE_LIMIT"] = str(limit)
+        utils._PRUNE_LIST_LIMIT = limit
+        assert prune_payload(calendrier) == _legacy_prune_payload(calendrier)
+        print(f"Calendrier 300 matchs, FFBB_MCP_PRUNE_LIMIT={limit}")
+        legacy = _bench(
+            "prune_payload historique",
+            lambda: _legacy_prune_payload(calendrier),
+            number,
+        )
+        single = _bench(
+            "prune_payload une passe", lambda: prune_payload(calendrier), number
+        )
+        print(f"  => gain : x{legacy / single:.1f}")
+        legacy = _bench(
+            "historique(serialize_models(300 modèles))",
+            lambda: _legacy_prune_payload(serialize_models(rencontres)),
+            number,
+        )
+        fused = _bench(
+            "prune_payload(300 modèles) (fusionné)",
+            lambda: prune_payload(rencontres),
+            number,
+        )
+        print(f"  => gain : x{legacy / fused:.1f}")
+    os.environ.pop("FFBB_MCP_PRUNE_LIMIT", None)
+    utils._PRUNE_LIST_LIMIT = utils._read_prune_limit()
+
+
+def _bench(label: str, fn, number: int) -> float:
+    elapsed = timeit.timeit(fn, number=number)
+    per_call_us = elapsed / number * 1e6
+    print(f"  {label:<48} {per_call_us:>10.1f} µs/appel")
+    return per_call_us
+
+
+def run(number: int) -> None:
+    backend = FakeFFBBBackend()
+    poule_raw = next(iter(backend.poules.values()))
+    org_raw = backend.organismes[CLUB_ID]
+    poule = Poule.model_validate(poule_raw)
+    org = Organisme.model_validate(org_raw)
+    hits = [Hit.model_validate(h) for h in backend.search_organismes("")[:50]]
+    hits += [Hit(id=900000 + i, nom=f"CLUB {i}") for i in range(50 - len(hits))]
+    poule_bytes = json.dumps(poule_raw).encode()
+
+    assert serialize_models(hits) == [serialize_model(h) for h in hits]
+    assert serialize_models([poule]) == [serialize_model(poule)]
+
+    print(
+        f"Poule : {len(poule_raw['rencontres'])} rencontres, "
+        f"{len(poule_bytes) / 1024:.0f} Ko JSON"
+    )
+    _bench("serialize_model(poule)", lambda: serialize_model(poule), number)
+    _bench(
+        "serialize_model(dict poule) (walk Python)",
+        lambda: serialize_model(poule_raw),
+        number,
+    )
+    _bench(
+        "json.loads + Poule.model_validate",
+        lambda: Poule.model_validate(json.loads(poule_bytes)),
+        number,
+    )
+    _bench(
+        "Poule.model_validate_json (octets bruts)",
+        lambda: Poule.model_validate_json(poule_bytes),
+        number,
+    )
+
+    print(f"Organisme : {len(org_raw['engagements'])} engagements")
+    _bench("serialize_model(organisme)", lambda: serialize_model(org), number)
+
+    print("Projection des champs (avant mise en cache)")
+    for kind, raw in (("poule", poule_raw), ("organisme", org_raw)):
+        projected = project_payload(kind, raw)
+        before, after = len(json.dumps(raw)), len(json.dumps(projected))
+        print(f"  {kind:<10} {before / 1024:>6.1f} Ko -> {after / 1024:>6.1f} Ko")
+        _bench(f"prune_payload({kind} complet)", lambda r=raw: prune_payload(r), number)
+        _bench(
+            f"prune_payload({kind} projeté)",
+            lambda p=projected: prune_payload(p),
+            number,
+        )
+
+    print(f"Search : {len(hits)} hits")
+    legacy = _bench(
+        "[serialize_model(h) for h in hits]",
+        lambda: [serialize_model(h) for h in hits],
+        number,
+    )
+    bulk = _bench("serialize_models(hits)", lambda: serialize_models(hits), number)
+    print(f"  => gain bulk : x{legacy / bulk:.1f}")
+
+    _bench_prune(backend, max(1, number // 10))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000)
+    opts = parser.parse_args()
+    run(opts.number)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
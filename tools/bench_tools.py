@@ -0,0 +1,290 @@
+"""Benchmark end-to-end de tous les outils MCP avec garde-fous de régression.
+
+Chaque outil est invoqué via le ToolManager FastMCP (validation des arguments,
+élagage ZipAI et conversion JSON compris), derrière le cache de réponses
+(``response_cache.py``) comme en production, contre le backend FFBB simulé de
+``tools/fake_ffbb.py``. Trois scénarios sont mesurés :
+
+- ``cold``  : caches service vidés avant chaque invocation ;
+- ``warm``  : caches amorcés par une première invocation ;
+- ``burst`` : N invocations concurrentes identiques sur caches vides.
+
+Pour chaque (outil, scénario), le script relève la latence (moyenne, médiane,
+p95) et le nombre d'appels FFBB amont. La suite est rejouée ``--repeats``
+fois : chaque cas garde les latences de sa meilleure répétition (médiane la
+plus basse) et le maximum des appels amont. Avec ``--check``, il compare aux
+valeurs de référence de ``tools/bench_baseline.json`` et sort en erreur si le
+nombre d'appels amont augmente (garde-fou strict) ou si la médiane dépasse
+``baseline * tolérance + marge``. Le p95 reste affiché mais n'est pas un
+garde-fou : sur un runner partagé, celui d'une rafale de 20 appels mesure
+surtout le GC et l'ordonnanceur. ``--update-baseline`` réécrit le fichier de
+référence.
+
+Usage :
+    uv run python tools/bench_tools.py
+    uv run python tools/bench_tools.py --check
+    uv run python tools/bench_tools.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import sys
+import time
+from pathlib import Path
+from statistics import mean, median
+from typing import Any
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_ffbb import CLUB_ID, FakeFFBBClient
+
+from ffbb_mcp import cache_strategy, response_cache, server, services
+from ffbb_mcp._state import reset_service_state
+
+BASELINE_PATH = Path(__file__).resolve().parent / "bench_baseline.json"
+
+_CLIENT = FakeFFBBClient()
+_FIRST_POULE_ID = next(iter(_CLIENT.backend.poules))
+
+# (nom de l'outil, arguments) — un cas représentatif par outil exposé.
+TOOL_CASES: list[tuple[str, dict[str, Any]]] = [
+    ("ffbb_search", {"query": "Stade Clermontois", "type": "organismes"}),
+    ("ffbb_search", {"query": "Stade Clermontois", "type": "all"}),
+    ("ffbb_get", {"id": _FIRST_POULE_ID, "type": "poule"}),
+    ("ffbb_get", {"id": CLUB_ID, "type": "organisme"}),
+    (
+        "ffbb_club",
+        {"action": "calendrier", "organisme_id": CLUB_ID, "filtre": "U11M"},
+    ),
+    ("ffbb_bilan", {"organisme_id": CLUB_ID, "categorie": "U11M1"}),
+    ("ffbb_team_summary", {"organisme_id": CLUB_ID, "categorie": "U11M1"}),
+    (
+        "ffbb_last_result",
+        {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+    ),
+    (
+        "ffbb_next_match",
+        {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+    ),
+    (
+        "ffbb_bilan_saison",
+        {"organisme_id": CLUB_ID, "categorie": "U11M", "numero_equipe": 1},
+    ),
+]
+
+
+def _case_id(name: str, args: dict[str, Any]) -> str:
+    discriminant = args.get("type") or args.get("action")
+    return f"{name}[{discriminant}]" if discriminant else name
+
+
+def _p95(samples: list[float]) -> float:
+    s = sorted(samples)
+    return s[max(0, math.ceil(len(s) * 0.95) - 1)] if s else 0.0
+
+
+def _install_fake_backend() -> None:
+    """Branche le client simulé et fige l'horloge "hors fenêtre de match"."""
+    logging.getLogger("ffbb-mcp").setLevel(logging.WARNING)
+    services.get_client_async = AsyncMock(return_value=_CLIENT)  # type: ignore[method-assign]
+    # Résultats reproductibles : pas de force_refresh "jour de match" ni de
+    # TTL live dépendant de l'heure d'exécution du benchmark.
+    server.is_match_day = lambda: False  # type: ignore[assignment]
+    response_cache.is_match_day = lambda: False  # type: ignore[assignment]
+    cache_strategy.is_in_match_window = lambda now=None: False  # type: ignore[assignment]
+    cache_strategy.is_post_match_cooling = lambda now=None: False  # type: ignore[assignment]
+
+
+async def _invoke(name: str, args: dict[str, Any]) -> Any:
+    # Même chemin que mcp.call_tool, avec context=None (pas de requête MCP).
+    return await response_cache.call_tool_cached(
+        name,
+        args,
+        lambda: server.mcp._tool_manager.call_tool(
+            name, args, context=None, convert_result=True
+        ),
+    )
+
+
+async def _run_cold(name: str, args: dict[str, Any], iterations: int):
+    latencies: list[float] = []
+    calls: list[int] = []
+    for _ in range(iterations):
+        reset_service_state()
+        _CLIENT.reset_calls()
+        t0 = time.perf_counter()
+        await _invoke(name, args)
+        latencies.append(time.perf_counter() - t0)
+        calls.append(_CLIENT.total_calls)
+    return latencies, max(calls)
+
+
+async def _run_warm(name: str, args: dict[str, Any], iterations: int):
+    reset_service_state()
+    await _invoke(name, args)
+    _CLIENT.reset_calls()
+    latencies: list[float] = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        await _invoke(name, args)
+        latencies.append(time.perf_counter() - t0)
+    return latencies, _CLIENT.total_calls
+
+
+async def _run_burst(name: str, args: dict[str, Any], iterations: int, burst: int):
+    latencies: list[float] = []
+    calls: list[int] = []
+
+    async def _timed() -> float:
+        t0 = time.perf_counter()
+        await _invoke(name, args)
+        return time.perf_counter() - t0
+
+    for _ in range(max(1, iterations // 5)):
+        reset_service_state()
+        _CLIENT.reset_calls()
+        latencies.extend(await asyncio.gather(*[_timed() for _ in range(burst)]))
+        calls.append(_CLIENT.total_calls)
+    return latencies, max(calls)
+
+
+async def run_suite(
+    iterations: int, burst: int, only: set[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    _install_fake_backend()
+    results: dict[str, dict[str, Any]] = {}
+    for name, args in TOOL_CASES:
+        case = _case_id(name, args)
+        if only and name not in only and case not in only:
+            continue
+        # Échauffement : exclut les coûts de premier appel (imports paresseux,
+        # construction des validateurs pydantic) des mesures "cold".
+        reset_service_state()
+        await _invoke(name, args)
+        scenarios = {
+            "cold": _run_cold(name, args, iterations),
+            "warm": _run_warm(name, args, iterations),
+            "burst": _run_burst(name, args, iterations, burst),
+        }
+        for scenario, coro in scenarios.items():
+            latencies, upstream = await coro
+            results[f"{case}:{scenario}"] = {
+                "n": len(latencies),
+                "mean_ms": round(mean(latencies) * 1000, 3),
+                "median_ms": round(median(latencies) * 1000, 3),
+                "p95_ms": round(_p95(latencies) * 1000, 3),
+                "upstream_calls": upstream,
+            }
+    return results
+
+
+async def run_best_of(
+    repeats: int, iterations: int, burst: int, only: set[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    """``run_suite`` répété : meilleure médiane par cas, pire nombre d'appels."""
+    best: dict[str, dict[str, Any]] = {}
+    for _ in range(max(1, repeats)):
+        for key, cur in (await run_suite(iterations, burst, only)).items():
+            prev = best.get(key)
+            if prev is None:
+                best[key] = cur
+                continue
+            upstream = max(prev["upstream_calls"], cur["upstream_calls"])
+            if cur["median_ms"] < prev["median_ms"]:
+                best[key] = cur
+            best[key]["upstream_calls"] = upstream
+    return best
+
+
+def _print_table(results: dict[str, dict[str, Any]]) -> None:
+    print(f"{'case':<40} {'n':>5} {'mean':>9} {'median':>9} {'p95':>9} {'calls':>6}")
+    for key, r in results.items():
+        print(
+            f"{key:<40} {r['n']:>5} {r['mean_ms']:>8.3f}m {r['median_ms']:>8.3f}m "
+            f"{r['p95_ms']:>8.3f}m {r['upstream_calls']:>6}"
+        )
+
+
+def check_regressions(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    *,
+    tolerance: float,
+    margin_ms: float,
+) -> list[str]:
+    """Retourne la liste des régressions (médiane ou appels amont) vs la baseline."""
+    errors: list[str] = []
+    for key, ref in baseline.items():
+        cur = results.get(key)
+        if cur is None:
+            continue
+        limit = ref["median_ms"] * tolerance + margin_ms
+        if cur["median_ms"] > limit:
+            errors.append(
+                f"{key}: médiane {cur['median_ms']:.3f}ms > {limit:.3f}ms "
+                f"(baseline {ref['median_ms']:.3f}ms)"
+            )
+        if cur["upstream_calls"] > ref["upstream_calls"]:
+            errors.append(
+                f"{key}: {cur['upstream_calls']} appels FFBB amont "
+                f"> baseline {ref['upstream_calls']}"
+            )
+    return errors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--tools", nargs="*", help="Restreindre à ces outils/cas.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--median-tolerance", type=float, default=2.0)
+    parser.add_argument("--median-margin-ms", type=float, default=5.0)
+    parser.add_argument("--json", type=Path, help="Écrire les résultats en JSON.")
+    opts = parser.parse_args()
+
+    results = asyncio.run(
+        run_best_of(
+            opts.repeats, opts.iterations, opts.burst, set(opts.tools or []) or None
+        )
+    )
+    _print_table(results)
+
+    if opts.json:
+        opts.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if opts.update_baseline:
+        opts.baseline.write_text(
+            json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"Baseline mise à jour : {opts.baseline}")
+        return 0
+
+    if opts.check:
+        if not opts.baseline.exists():
+            print(f"ERROR: baseline introuvable ({opts.baseline})")
+            return 1
+        baseline = json.loads(opts.baseline.read_text(encoding="utf-8"))
+        errors = check_regressions(
+            results,
+            baseline,
+            tolerance=opts.median_tolerance,
+            margin_ms=opts.median_margin_ms,
+        )
+        for err in errors:
+            print(f"ERROR: {err}")
+        return 1 if errors else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
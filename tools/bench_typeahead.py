@@ -0,0 +1,124 @@
+"""Micro-benchmark de l'autocomplétion locale (``search_index.PrefixIndex``).
+
+Construit un index de 50 000 entités synthétiques (clubs, compétitions,
+salles aux noms réalistes) puis mesure :
+
+- la construction en masse (``add_many``) et l'insertion incrémentale ;
+- la latence p50/p99 des recherches pour des préfixes de 1 à 12 caractères
+  et des requêtes multi-mots (``stade cler``, ``u13 depart``).
+
+Usage :
+    uv run python tools/bench_typeahead.py
+    uv run python tools/bench_typeahead.py --entities 100000 --queries 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from ffbb_mcp.search_index import PrefixIndex
+
+_PREFIXES = ["Stade", "Union", "Entente", "Association", "Basket Club", "Elan", "AS"]
+_TOWNS = [
+    "Clermont",
+    "Vichy",
+    "Gerzat",
+    "Aubière",
+    "Cournon",
+    "Riom",
+    "Issoire",
+    "Moulins",
+    "Montluçon",
+    "Thiers",
+    "Lyon",
+    "Villeurbanne",
+    "Chalon",
+    "Bourg",
+    "Roanne",
+    "Saint-Étienne",
+    "Le Puy",
+    "Aurillac",
+]
+_SUFFIXES = ["Basket", "Basket Ball", "BC", "Sports", "Auvergne", "Omnisports"]
+_COMPETITIONS = ["Championnat", "Coupe", "Trophée", "Challenge"]
+_LEVELS = ["Départemental", "Régional", "National", "Pré-Régional"]
+_CATEGORIES = ["U11", "U13", "U15", "U17", "U20", "Seniors"]
+
+
+def _entities(n: int, rng: random.Random) -> list[tuple[str, dict, str]]:
+    out = []
+    for i in range(n):
+        kind = rng.choices(["organismes", "competitions", "salles"], [6, 3, 1])[0]
+        if kind == "organismes":
+            nom = (
+                f"{rng.choice(_PREFIXES)} {rng.choice(_TOWNS)} "
+                f"{rng.choice(_SUFFIXES)} {i}"
+            )
+        elif kind == "competitions":
+            nom = (
+                f"{rng.choice(_COMPETITIONS)} {rng.choice(_LEVELS)} "
+                f"{rng.choice(_CATEGORIES)} {rng.choice('MF')} {i}"
+            )
+        else:
+            nom = f"Gymnase {rng.choice(_TOWNS)} {i}"
+        out.append((f"{kind}:{i}", {"id": i, "nom": nom, "_type": kind}, nom))
+    return out
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return statistics.median(samples), p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    entities = _entities(args.entities, rng)
+
+    index = PrefixIndex()
+    t0 = time.perf_counter()
+    index.add_many(entities)
+    bulk_ms = (time.perf_counter() - t0) * 1000
+
+    extra = _entities(1000, random.Random(args.seed + 1))
+    t0 = time.perf_counter()
+    for key, record, text in extra:
+        index.add(f"x{key}", record, text)
+    insert_us = (time.perf_counter() - t0) / len(extra) * 1e6
+
+    print(f"{len(index)} entités : add_many {bulk_ms:.0f} ms, add {insert_us:.1f} µs")
+    print(f"{'requête':<22} {'p50 µs':>8} {'p99 µs':>8} {'résultats':>10}")
+
+    words = [w for _, _, text in entities[:2000] for w in text.split()]
+    cases: dict[str, list[str]] = {
+        f"préfixe {n} car.": [rng.choice(words)[:n] for _ in range(args.queries)]
+        for n in (1, 2, 3, 5, 8, 12)
+    }
+    cases["multi-mots"] = [
+        f"{rng.choice(_PREFIXES)[:4]} {rng.choice(_TOWNS)[:3]}"
+        for _ in range(args.queries)
+    ]
+    cases["catégorie + niveau"] = [
+        f"{rng.choice(_CATEGORIES)} {rng.choice(_LEVELS)[:5]}"
+        for _ in range(args.queries)
+    ]
+    for label, queries in cases.items():
+        timings, found = [], 0
+        for q in queries:
+            t0 = time.perf_counter()
+            found += len(index.search(q, 10))
+            timings.append((time.perf_counter() - t0) * 1e6)
+        p50, p99 = _percentiles(timings)
+        print(f"{label:<22} {p50:>8.1f} {p99:>8.1f} {found / len(queries):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
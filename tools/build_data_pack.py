@@ -0,0 +1,72 @@
+"""Construit le pack de données en lecture seule (``FFBB_DATA_PACK``).
+
+Le pack réunit les organismes donnés (avec leurs engagements), leurs
+compétitions et leurs poules de phases terminées. Organismes et compétitions
+sont repris de la base de référence (``FFBB_REFERENCE_DB``) quand elle existe,
+le reste est lu chez la FFBB. À lancer au build de l'image ou par cron : le
+fichier est remplacé atomiquement.
+
+Usage :
+    uv run python tools/build_data_pack.py --out pack.bin --organismes 9326 9400
+    uv run python tools/build_data_pack.py --out pack.bin --from-reference
+    uv run python tools/build_data_pack.py --out pack.bin --from-index
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    from ffbb_mcp import services
+    from ffbb_mcp.data_pack import DataPack
+
+    organisme_ids = set(args.organismes)
+    if args.from_index:
+        index = services._organisme_index()
+        organisme_ids.update(int(o["id"]) for o in index.records())
+    store = services._reference_store()
+    if args.from_reference and store is not None:
+        organisme_ids.update(
+            int(k.partition(":")[2])
+            for k in store.list_keys()
+            if k.startswith("organisme:")
+        )
+    report: dict = {
+        "built": await services.build_data_pack(args.out, sorted(organisme_ids))
+    }
+    services.close_reference_store()
+
+    pack = DataPack(args.out)
+    report["stats"] = pack.stats()
+    if organisme_ids:
+        probe = min(organisme_ids)
+        t0 = time.perf_counter()
+        for _ in range(1000):
+            pack.get("organisme", probe)
+        report["lookup_us"] = round((time.perf_counter() - t0) * 1000, 1)
+    pack.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=os.environ.get("FFBB_DATA_PACK"))
+    parser.add_argument("--organismes", type=int, nargs="*", default=[])
+    parser.add_argument("--from-index", action="store_true")
+    parser.add_argument("--from-reference", action="store_true")
+    args = parser.parse_args()
+    if not args.out:
+        parser.error("--out ou FFBB_DATA_PACK requis")
+    # Le pack en cours de construction ne doit pas servir ses propres lectures.
+    os.environ.pop("FFBB_DATA_PACK", None)
+    os.environ["FFBB_REFERENCE_REFRESH_INTERVAL"] = "0"
+    print(json.dumps(asyncio.run(_run(args)), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Construit ou met à jour la base de référence hors ligne (``FFBB_REFERENCE_DB``).
+
+Trois sources, combinables :
+
+- ``--import`` : fichier JSON ``{"organismes": [...], "competitions": [...],
+  "saisons": [...]}`` (export d'une autre base, jeu de test) ;
+- ``--organismes`` / ``--from-index`` : crawl FFBB des organismes donnés ou
+  connus de l'index local (``FFBB_ORG_INDEX_PATH``), puis des compétitions de
+  leurs engagements et des saisons ; ``--regions`` (ou
+  ``FFBB_REFERENCE_REGIONS``) restreint aux codes d'organisme de ces régions ;
+- ``--refresh`` : relecture des entrées plus vieilles que ``--max-age``.
+
+Usage :
+    uv run python tools/build_reference_db.py --db ref.db --import export.json
+    uv run python tools/build_reference_db.py --db ref.db --from-index --regions ARA
+    uv run python tools/build_reference_db.py --db ref.db --refresh --max-age 86400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    from ffbb_mcp import services
+    from ffbb_mcp.reference_store import regions_from_env
+
+    store = services._reference_store()
+    assert store is not None
+    report: dict = {}
+    if args.import_file:
+        report["imported"] = store.import_file(args.import_file)
+
+    organisme_ids = list(args.organismes)
+    if args.from_index:
+        index = services._organisme_index()
+        organisme_ids += [int(o["id"]) for o in index.records()]
+    if organisme_ids:
+        regions = tuple(r.upper() for r in args.regions) or regions_from_env()
+        report["crawled"] = await services.crawl_reference_store(
+            sorted(set(organisme_ids)), regions
+        )
+
+    if args.refresh:
+        report["refreshed"] = await services.refresh_reference_store(
+            max_age=args.max_age, batch=args.batch
+        )
+    report["stats"] = store.stats()
+    services.close_reference_store()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=os.environ.get("FFBB_REFERENCE_DB"))
+    parser.add_argument("--import", dest="import_file")
+    parser.add_argument("--organismes", type=int, nargs="*", default=[])
+    parser.add_argument("--from-index", action="store_true")
+    parser.add_argument("--regions", nargs="*", default=[])
+    parser.add_argument("--refresh", action="store_true")
+    parser.add_argument("--max-age", type=float, default=7 * 86400)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    if not args.db:
+        parser.error("--db ou FFBB_REFERENCE_DB requis")
+    os.environ["FFBB_REFERENCE_DB"] = args.db
+    # Outil ponctuel : pas de tâche de rafraîchissement en fond.
+    os.environ["FFBB_REFERENCE_REFRESH_INTERVAL"] = "0"
+    print(json.dumps(asyncio.run(_run(args)), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+"""Backend FFBB simulé pour les benchmarks et les tests de charge.
+
+Le client simulé expose les mêmes méthodes async que ``FFBBAPIClientV3``
+(``get_poule_async``, ``search_organismes_async``, ``multi_search_async``…)
+et renvoie des modèles Pydantic construits à partir de payloads réalistes :
+un club avec plusieurs catégories et deux phases par équipe, des poules de
+12 équipes en aller-retour (132 rencontres), des classements complets.
+
+Chaque appel est compté par endpoint (``client.calls``) afin de mesurer le
+fan-out réel vers l'API FFBB. Une latence réseau peut être simulée via
+``latency_ms`` (ou la variable d'environnement ``SIMULATE_LATENCY_MS``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+CLUB_ID = 9326
+CLUB_NAME = "STADE CLERMONTOIS BASKET AUVERGNE"
+ENTENTE_ID = 9400
+ENTENTE_NAME = "ENT. STADE CLERMONTOIS / AUBIERE"
+
+# (code catégorie, sexe, nombre d'équipes engagées)
+_CATEGORIES: tuple[tuple[str, str, int], ...] = (
+    ("U11", "M", 2),
+    ("U13", "F", 1),
+    ("U15", "M", 2),
+    ("SE", "F", 1),
+)
+_TEAMS_PER_POULE = 12
+_OPPONENTS = (
+    "JEANNE D'ARC DE VICHY",
+    "CS PONT DU CHATEAU",
+    "GERZAT BASKET",
+    "BC AUBIERE",
+    "US ISSOIRE",
+    "RIOM BASKET",
+    "AL COURNON",
+    "BC CHATEL-GUYON",
+    "CEYRAT BASKET",
+    "ASM MONTFERRAND",
+    "BC BEAUMONT",
+    "LEMPDES SPORTS",
+    "US THIERS",
+    "ROMAGNAT BASKET",
+)
+
+
+class _Payload(BaseModel):
+    """Modèle Pydantic permissif : reproduit le coût de ``model_dump``."""
+
+    model_config = ConfigDict(extra="allow")
+
+
+class _SearchResults:
+    def __init__(self, hits: list[_Payload], total: int) -> None:
+        self.hits = hits
+        self.estimated_total_hits = total
+
+
+class _MultiSearchResult:
+    def __init__(self, index_uid: str, hits: list[_Payload]) -> None:
+        self.index_uid = index_uid
+        self.hits = hits
+
+
+class _MultiSearchResults:
+    def __init__(self, results: list[_MultiSearchResult]) -> None:
+        self.results = results
+
+
+def _team_name(base: str, numero: int) -> str:
+    return base if numero <= 1 else f"{base} - {numero}"
+
+
+class FakeFFBBBackend:
+    """Jeu de données déterministe (graine fixe) pour un club et ses poules."""
+
+    def __init__(self, seed: int = 42, now: datetime | None = None) -> None:
+        self.now = now or datetime.now()
+        self._rng = random.Random(seed)
+        self.organismes: dict[int, dict[str, Any]] = {}
+        self.poules: dict[int, dict[str, Any]] = {}
+        self.competitions: dict[int, dict[str, Any]] = {}
+        self._build()
+
+    # -- Construction ----------------------------------------------------
+
+    def _build(self) -> None:
+        engagements: list[dict[str, Any]] = []
+        poule_id = 200_000
+        competition_id = 100_000
+        engagement_id = 500_000
+
+        for code, sexe, nb_equipes in _CATEGORIES:
+            for numero in range(1, nb_equipes + 1):
+                for phase in (1, 2):
+                    poule_id += 1
+                    competition_id += 1
+                    engagement_id += 1
+                    label = "Senior" if code == "SE" else code
+                    comp_nom = f"Départemental {label}{sexe} - Phase {phase}"
+                    self.competitions[competition_id] = {
+                        "id": competition_id,
+                        "nom": comp_nom,
+                        "sexe": sexe,
+                        "code": f"DM{code}{phase}",
+                        "categorie": {"code": code, "libelle": label},
+                        "competition_origine_niveau": phase,
+                        "saison": {"id": 2025, "code": "2025-2026"},
+                    }
+                    engagements.append(
+                        {
+                            "id": engagement_id,
+                            "numeroEquipe": str(numero),
+                            "phase": f"Phase {phase}",
+                            "idCompetition": {
+                                "id": competition_id,
+                                "nom": comp_nom,
+                                "sexe": sexe,
+                                "categorie": {"code": code},
+                                "competition_origine_niveau": phase,
+                            },
+                            "idPoule": {"id": poule_id},
+                        }
+                    )
+                    self.poules[poule_id] = self._build_poule(
+                        poule_id, comp_nom, engagement_id, numero, finished=phase == 1
+                    )
+
+        self.organismes[CLUB_ID] = {
+            "id": CLUB_ID,
+            "nom": CLUB_NAME,
+            "code": "ARA0063042",
+            "type": "Association",
+            "adresse": "Maison des Sports, Place des Bughes",
+            "commune": {"libelle": "CLERMONT-FERRAND", "codePostal": "63000"},
+            "engagements": engagements,
+        }
+        self.organismes[ENTENTE_ID] = {
+            "id": ENTENTE_ID,
+            "nom": ENTENTE_NAME,
+            "code": "ARA0063999",
+            "type": "Entente",
+            "commune": {"libelle": "AUBIERE", "codePostal": "63170"},
+            "engagements": [],
+        }
+
+    def _build_poule(
+        self,
+        poule_id: int,
+        comp_nom: str,
+        club_engagement_id: int,
+        numero: int,
+        *,
+        finished: bool,
+    ) -> dict[str, Any]:
+        rng = self._rng
+        opponents = rng.sample(_OPPONENTS, _TEAMS_PER_POULE - 1)
+        teams: list[dict[str, Any]] = [
+            {
+                "eng_id": club_engagement_id,
+                "nom": CLUB_NAME,
+                "numero": numero,
+                "org_id": CLUB_ID,
+            }
+        ]
+        for idx, nom in enumerate(opponents):
+            teams.append(
+                {
+                    "eng_id": poule_id * 100 + idx,
+                    "nom": nom,
+                    "numero": 1,
+                    "org_id": 10_000 + idx,
+                }
+            )
+
+        # Aller-retour (méthode du cercle) : chaque équipe joue à chaque
+        # journée, une journée par semaine.
+        start = self.now - timedelta(days=200 if finished else 60)
+        rencontres: list[dict[str, Any]] = []
+        stats = {t["eng_id"]: Counter() for t in teams}
+        match_id = poule_id * 1000
+        nb_journees = len(teams) - 1
+        rotation = list(teams)
+        for leg in (0, 1):
+            for rnd in range(nb_journees):
+                journee = leg * nb_journees + rnd + 1
+                date = start + timedelta(days=7 * (journee - 1))
+                joue = finished or date < self.now
+                half = len(rotation) // 2
+                for home, away in zip(
+                    rotation[:half], reversed(rotation[half:]), strict=True
+                ):
+                    h, a = (home, away) if (leg + rnd) % 2 == 0 else (away, home)
+                    match_id += 1
+                    s1 = rng.randint(30, 90) if joue else None
+                    s2 = rng.randint(30, 90) if joue else None
+                    if s1 is not None and s2 is not None:
+                        for team, pm, pe in ((h, s1, s2), (a, s2, s1)):
+                            st = stats[team["eng_id"]]
+                            st["match_joues"] += 1
+                            st["gagnes" if pm > pe else "perdus"] += 1
+                            st["paniers_marques"] += pm
+                            st["paniers_encaisses"] += pe
+                    rencontres.append(
+                        {
+                            "id": match_id,
+                            "numero": match_id,
+                            "numeroJournee": journee,
+                            "date_rencontre": date.strftime("%Y-%m-%dT%H:%M:%S"),
+                            "joue": 1 if joue else 0,
+                            "nomEquipe1": _team_name(h["nom"], h["numero"]),
+                            "nomEquipe2": _team_name(a["nom"], a["numero"]),
+                            "resultatEquipe1": s1,
+                            "resultatEquipe2": s2,
+                            "idEngagementEquipe1": {
+                                "id": h["eng_id"],
+                                "numeroEquipe": str(h["numero"]),
+                            },
+                            "idEngagementEquipe2": {
+                                "id": a["eng_id"],
+                                "numeroEquipe": str(a["numero"]),
+                            },
+                            "nomSalle": "Gymnase Jean Zay",
+                            "villeSalle": "CLERMONT-FERRAND",
+                            "commentaire": None,
+                            "forfaitEquipe1": False,
+                            "forfaitEquipe2": False,
+                        }
+                    )
+                rotation = [rotation[0], rotation[-1], *rotation[1:-1]]
+
+        classements: list[dict[str, Any]] = []
+        for team in teams:
+            st = stats[team["eng_id"]]
+            classements.append(
+                {
+                    "id_engagement": {
+                        "id": team["eng_id"],
+                        "nom": team["nom"],
+                        "numero_equipe": str(team["numero"]),
+                        "logo": {"id": f"logo-{team['org_id']}"},
+                    },
+                    "organisme_id": team["org_id"],
+                    "organisme_logo_id": f"logo-{team['org_id']}",
+                    "points": st["gagnes"] * 2 + st["perdus"],
+                    "match_joues": st["match_joues"],
+                    "gagnes": st["gagnes"],
+                    "perdus": st["perdus"],
+                    "nuls": 0,
+                    "paniers_marques": st["paniers_marques"],
+                    "paniers_encaisses": st["paniers_encaisses"],
+                    "difference": st["paniers_marques"] - st["paniers_encaisses"],
+                    "quotient": None,
+                    "nombre_forfaits": 0,
+                    "nombre_defauts": 0,
+                    "point_initiaux": 0,
+                    "penalites_arbitrage": 0,
+                    "penalites_entraineur": 0,
+                    "penalites_diverses": 0,
+                    "hors_classement": False,
+                }
+            )
+        classements.sort(key=lambda c: (-c["points"], -c["difference"]))
+        for pos, row in enumerate(classements, start=1):
+            row["position"] = pos
+
+        return {
+            "id": poule_id,
+            "nom": comp_nom,
+            "libelle": f"Poule {chr(ord('A') + poule_id % 4)}",
+            "rencontres": rencontres,
+            "classements": classements,
+        }
+
+    # -- Vues utilitaires --------------------------------------------------
+
+    def live_poule_ids(self) -> list[int]:
+        """Poules de phase 2 (en cours) : ce sont elles qui passent en live."""
+        return [pid for pid, p in self.poules.items() if "Phase 2" in p["nom"]]
+
+    def search_organismes(self, query: str) -> list[dict[str, Any]]:
+        words = [w for w in query.upper().split() if w]
+        out = []
+        for org in self.organismes.values():
+            nom = org["nom"]
+            if all(w in nom for w in words):
+                out.append(
+                    {
+                        "id": org["id"],
+                        "nom": nom,
+                        "code": org["code"],
+                        "type": org["type"],
+                        "ville": org["commune"]["libelle"],
+                    }
+                )
+        # Le club principal d'abord, comme le ferait le ranking Meilisearch.
+        out.sort(key=lambda o: o["id"] != CLUB_ID)
+        return out
+
+    def search_competitions(self, query: str) -> list[dict[str, Any]]:
+        words = [w for w in query.upper().split() if w]
+        return [
+            {"id": c["id"], "nom": c["nom"], "code": c["code"]}
+            for c in self.competitions.values()
+            if all(w in c["nom"].upper() for w in words)
+        ]
+
+
+class FakeFFBBClient:
+    """Client async compatible ``FFBBAPIClientV3`` adossé à ``FakeFFBBBackend``."""
+
+    def __init__(
+        self,
+        backend: FakeFFBBBackend | None = None,
+        *,
+        latency_ms: float | None = None,
+    ) -> None:
+        self.backend = backend or FakeFFBBBackend()
+        if latency_ms is None:
+            latency_ms = float(os.environ.get("SIMULATE_LATENCY_MS", "0"))
+        self.latency_s = latency_ms / 1000.0
+        self.calls: Counter[str] = Counter()
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_calls(self) -> None:
+        self.calls.clear()
+
+    async def _hit(self, endpoint: str) -> None:
+        self.calls[endpoint] += 1
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+
+    # -- Détails -----------------------------------------------------------
+
+    async def get_poule_async(self, poule_id: int, **_: Any) -> _Payload | None:
+        await self._hit("poule")
+        data = self.backend.poules.get(int(poule_id))
+        return _Payload(**data) if data else None
+
+    async def get_organisme_async(self, organisme_id: int, **_: Any) -> _Payload | None:
+        await self._hit("organisme")
+        data = self.backend.organismes.get(int(organisme_id))
+        return _Payload(**data) if data else None
+
+    async def get_competition_async(
+        self, competition_id: int, **_: Any
+    ) -> _Payload | None:
+        await self._hit("competition")
+        data = self.backend.competitions.get(int(competition_id))
+        return _Payload(**data) if data else None
+
+    async def get_lives_async(self, **_: Any) -> list[_Payload]:
+        await self._hit("lives")
+        return [
+            _Payload(poule_id=pid, score_equipe1=42, score_equipe2=40)
+            for pid in self.backend.live_poule_ids()[:2]
+        ]
+
+    async def get_saisons_async(self, active_only: bool = False, **_: Any) -> list:
+        await self._hit("saisons")
+        saisons = [
+            _Payload(id=2024, code="2024-2025", actif=False),
+            _Payload(id=2025, code="2025-2026", actif=True),
+        ]
+        return [s for s in saisons if s.actif] if active_only else saisons
+
+    # -- Recherche ---------------------------------------------------------
+
+    async def _search(self, endpoint: str, hits: list[dict[str, Any]], limit: int):
+        await self._hit(endpoint)
+        return _SearchResults([_Payload(**h) for h in hits[:limit]], len(hits))
+
+    async def search_organismes_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search(
+            "search:organismes", self.backend.search_organismes(query), limit
+        )
+
+    async def search_competitions_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search(
+            "search:competitions", self.backend.search_competitions(query), limit
+        )
+
+    async def search_rencontres_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:rencontres", [], limit)
+
+    async def search_salles_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:salles", [], limit)
+
+    async def search_pratiques_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:pratiques", [], limit)
+
+    async def search_terrains_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:terrains", [], limit)
+
+    async def search_tournois_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:tournois", [], limit)
+
+    async def search_engagements_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:engagements", [], limit)
+
+    async def search_formations_async(
+        self,
+        query: str,
+        limit: int = 20,
+        filter_by: str | None = None,
+        sort: list[str] | None = None,
+    ):
+        return await self._search("search:formations", [], limit)
+
+    async def multi_search_async(self, queries: list[Any]):
+        await self._hit("multi_search")
+        results = []
+        for q in queries:
+            uid = str(q.index_uid)
+            if uid.endswith("organismes"):
+                hits = self.backend.search_organismes(q.q)
+            elif uid.endswith("competitions"):
+                hits = self.backend.search_competitions(q.q)
+            else:
+                hits = []
+            limit = getattr(q, "limit", None) or 20
+            results.append(
+                _MultiSearchResult(uid, [_Payload(**h) for h in hits[:limit]])
+            )
+        return _MultiSearchResults(results)
@@ -0,0 +1,427 @@
+"""Générateur de charge concurrent pour le serveur MCP en Streamable HTTP.
+
+Démarre l'application Starlette de ``app_factory.create_app`` (uvicorn, dans un
+thread dédié avec sa propre boucle asyncio) contre le backend FFBB simulé de
+``tools/fake_ffbb.py``, puis ouvre N sessions MCP sur ``/mcp`` qui rejouent un
+mix de trafic "week-end" : polling des lives, résumés d'équipe, calendriers,
+derniers résultats / prochains matchs.
+
+Toutes les ``--interval`` secondes, le script affiche le débit, les
+percentiles de latence, le lag de la boucle asyncio du serveur, la mémoire
+(RSS) et les appels FFBB amont. Un résumé par opération est affiché à la fin.
+
+Usage :
+    uv run python tools/load_test.py --sessions 50 --duration 30
+    SIMULATE_LATENCY_MS=150 uv run python tools/load_test.py --match-day off
+    uv run python tools/load_test.py --url http://127.0.0.1:9123/mcp
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import resource
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_ffbb import CLUB_ID, FakeFFBBClient
+
+_PROTOCOL_VERSION = "2025-06-18"
+_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+_TEAMS = ("U11M1", "U11M2", "U13F1", "U15M1", "U15M2", "SEF1")
+_CATEGORIES = ("U11M", "U13F", "U15M", "SEF")
+
+# Mix "samedi après-midi" : le polling des lives domine, suivi des résumés
+# d'équipe (parents, coachs) et des calendriers.
+WEEKEND_MIX: dict[str, float] = {
+    "lives": 0.45,
+    "team_summary": 0.25,
+    "calendrier": 0.15,
+    "last_result": 0.10,
+    "next_match": 0.05,
+}
+
+
+def _operation_call(op: str, rng: random.Random) -> tuple[str, dict[str, Any]]:
+    team = rng.choice(_TEAMS)
+    categorie, numero = team[:-1], int(team[-1])
+    if op == "lives":
+        return "ffbb_lives", {}
+    if op == "team_summary":
+        return "ffbb_team_summary", {"organisme_id": CLUB_ID, "categorie": team}
+    if op == "calendrier":
+        return "ffbb_club", {
+            "action": "calendrier",
+            "organisme_id": CLUB_ID,
+            "filtre": rng.choice(_CATEGORIES),
+        }
+    if op in ("last_result", "next_match"):
+        return f"ffbb_{op}", {
+            "organisme_id": CLUB_ID,
+            "categorie": categorie,
+            "numero_equipe": numero,
+        }
+    raise ValueError(f"Opération inconnue : {op}")
+
+
+# ---------------------------------------------------------------------------
+# Statistiques
+# ---------------------------------------------------------------------------
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    s = sorted(samples)
+    return s[max(0, math.ceil(len(s) * q) - 1)]
+
+
+def _rss_mb() -> float:
+    """RSS courant (Linux) ou pic RSS en repli (autres plateformes)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class _Stats:
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    window: list[float] = field(default_factory=list)
+    errors: int = 0
+    window_errors: int = 0
+    loop_lag: list[float] = field(default_factory=list)
+
+    def record(self, op: str, latency: float, ok: bool) -> None:
+        self.latencies.setdefault(op, []).append(latency)
+        self.window.append(latency)
+        if not ok:
+            self.errors += 1
+            self.window_errors += 1
+
+    def drain_window(self) -> tuple[list[float], int, list[float]]:
+        window, errors, lag = self.window, self.window_errors, self.loop_lag
+        self.window, self.window_errors, self.loop_lag = [], 0, []
+        return window, errors, lag
+
+
+# ---------------------------------------------------------------------------
+# Serveur in-process
+# ---------------------------------------------------------------------------
+
+
+class _InProcessServer:
+    """uvicorn dans un thread dédié : la charge cliente ne partage pas sa boucle."""
+
+    def __init__(self, match_day: str) -> None:
+        import uvicorn
+
+        from ffbb_mcp import cache_strategy, response_cache, server, services
+        from ffbb_mcp.app_factory import create_app
+
+        self.client = FakeFFBBClient()
+        services.get_client_async = AsyncMock(return_value=self.client)  # type: ignore[method-assign]
+        if match_day != "auto":
+            on = match_day == "on"
+            server.is_match_day = lambda: on  # type: ignore[assignment]
+            # TTL réponse "jour de match" (cf. response_cache._match_day_max_age).
+            response_cache.is_match_day = lambda: on  # type: ignore[assignment]
+            cache_strategy.is_in_match_window = lambda now=None: on  # type: ignore[assignment]
+            cache_strategy.is_post_match_cooling = lambda now=None: False  # type: ignore[assignment]
+
+        server.mcp.settings.streamable_http_path = "/mcp"
+        app = create_app(server.mcp, ["*"])
+
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        self.port = sock.getsockname()[1]
+        sock.close()
+
+        config = uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, log_level="warning"
+        )
+        self._server = uvicorn.Server(config)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/mcp"
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._server.serve())
+
+    async def start(self) -> None:
+        self._thread.start()
+        # uvicorn n'expose qu'un booléen "started", pas d'événement.
+        while not self._server.started:  # noqa: ASYNC110
+            await asyncio.sleep(0.05)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+    def sample_loop_lag(self, stats: _Stats, period: float = 0.05) -> None:
+        """Mesure le retard de réveil de la boucle du serveur (lag)."""
+
+        async def _sampler() -> None:
+            while not self._server.should_exit:
+                t0 = time.perf_counter()
+                await asyncio.sleep(period)
+                stats.loop_lag.append(max(0.0, time.perf_counter() - t0 - period))
+
+        asyncio.run_coroutine_threadsafe(_sampler(), self.loop)
+
+
+# ---------------------------------------------------------------------------
+# Sessions MCP
+# ---------------------------------------------------------------------------
+
+
+async def _rpc(
+    http: httpx.AsyncClient, url: str, payload: dict[str, Any], headers: dict
+) -> dict[str, Any] | None:
+    resp = await http.post(url, json=payload, headers=headers)
+    resp.raise_for_status()
+    if resp.status_code == 202 or not resp.content:
+        return None
+    return resp.json()
+
+
+async def _session(
+    idx: int,
+    http: httpx.AsyncClient,
+    url: str,
+    mix: dict[str, float],
+    deadline: float,
+    think_s: float,
+    stats: _Stats,
+    seed: int,
+) -> None:
+    rng = random.Random(seed + idx)
+    headers = dict(_HEADERS)
+    init = await _rpc(
+        http,
+        url,
+        {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": _PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "ffbb-load-test", "version": "1.0"},
+            },
+        },
+        headers,
+    )
+    if init is None or "result" not in init:
+        raise RuntimeError(f"initialize a échoué : {init}")
+    headers["MCP-Protocol-Version"] = init["result"].get(
+        "protocolVersion", _PROTOCOL_VERSION
+    )
+    await _rpc(
+        http,
+        url,
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        headers,
+    )
+
+    ops, weights = list(mix), list(mix.values())
+    request_id = 0
+    while time.perf_counter() < deadline:
+        op = rng.choices(ops, weights)[0]
+        name, args = _operation_call(op, rng)
+        request_id += 1
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            body = await _rpc(
+                http,
+                url,
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "tools/call",
+                    "params": {"name": name, "arguments": args},
+                },
+                headers,
+            )
+            ok = (
+                bool(body) and "error" not in body and not body["result"].get("isError")
+            )
+        except httpx.HTTPError:
+            ok = False
+        stats.record(op, time.perf_counter() - t0, ok)
+        if think_s:
+            await asyncio.sleep(rng.expovariate(1 / think_s))
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+
+async def run_load(opts: argparse.Namespace) -> dict[str, Any]:
+    server: _InProcessServer | None = None
+    stats = _Stats()
+    url = opts.url
+    if url is None:
+        server = _InProcessServer(opts.match_day)
+        await server.start()
+        server.sample_loop_lag(stats)
+        url = server.url
+
+    limits = httpx.Limits(
+        max_connections=opts.sessions, max_keepalive_connections=opts.sessions
+    )
+    timeline: list[dict[str, Any]] = []
+    t_start = time.perf_counter()
+    deadline = t_start + opts.duration
+    print(
+        f"{'t':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>5} "
+        f"{'lag_p99':>8} {'lag_max':>8} {'rss_mb':>8} {'upstream':>9}"
+    )
+
+    async def _reporter() -> None:
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(opts.interval)
+            now = time.perf_counter()
+            window, errors, lag = stats.drain_window()
+            point = {
+                "t": round(now - t_start, 1),
+                "rps": round(len(window) / (now - last), 1),
+                "p50_ms": round(_percentile(window, 0.50) * 1000, 1),
+                "p95_ms": round(_percentile(window, 0.95) * 1000, 1),
+                "p99_ms": round(_percentile(window, 0.99) * 1000, 1),
+                "errors": errors,
+                "loop_lag_p99_ms": round(_percentile(lag, 0.99) * 1000, 1),
+                "loop_lag_max_ms": round(max(lag, default=0.0) * 1000, 1),
+                "rss_mb": round(_rss_mb(), 1),
+                "upstream_calls": server.client.total_calls if server else None,
+            }
+            last = now
+            timeline.append(point)
+            print(
+                f"{point['t']:>5} {point['rps']:>8} {point['p50_ms']:>8} "
+                f"{point['p95_ms']:>8} {point['p99_ms']:>8} {errors:>5} "
+                f"{point['loop_lag_p99_ms']:>8} {point['loop_lag_max_ms']:>8} "
+                f"{point['rss_mb']:>8} {point['upstream_calls'] or '-':>9}"
+            )
+
+    reporter = asyncio.create_task(_reporter())
+    try:
+        async with httpx.AsyncClient(limits=limits, timeout=opts.timeout) as http:
+            await asyncio.gather(
+                *[
+                    _session(
+                        i,
+                        http,
+                        url,
+                        WEEKEND_MIX,
+                        deadline,
+                        opts.think_ms / 1000,
+                        stats,
+                        opts.seed,
+                    )
+                    for i in range(opts.sessions)
+                ]
+            )
+    finally:
+        reporter.cancel()
+        if server is not None:
+            server.stop()
+
+    elapsed = time.perf_counter() - t_start
+    total = sum(len(v) for v in stats.latencies.values())
+    summary: dict[str, Any] = {
+        "sessions": opts.sessions,
+        "duration_s": round(elapsed, 1),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 1),
+        "errors": stats.errors,
+        "operations": {
+            op: {
+                "n": len(lat),
+                "p50_ms": round(_percentile(lat, 0.50) * 1000, 1),
+                "p95_ms": round(_percentile(lat, 0.95) * 1000, 1),
+                "p99_ms": round(_percentile(lat, 0.99) * 1000, 1),
+            }
+            for op, lat in sorted(stats.latencies.items())
+        },
+        "upstream_calls": dict(server.client.calls) if server else None,
+        "timeline": timeline,
+    }
+    return summary
+
+
+def _print_summary(summary: dict[str, Any]) -> None:
+    print(
+        f"\n{summary['requests']} requêtes en {summary['duration_s']}s "
+        f"({summary['throughput_rps']} req/s, {summary['sessions']} sessions, "
+        f"{summary['errors']} erreurs)"
+    )
+    print(f"{'operation':<14} {'n':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for op, r in summary["operations"].items():
+        print(
+            f"{op:<14} {r['n']:>7} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8}"
+        )
+    if summary["upstream_calls"] is not None:
+        print(f"Appels FFBB amont : {summary['upstream_calls']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30.0, help="Secondes.")
+    parser.add_argument("--think-ms", type=float, default=200.0)
+    parser.add_argument("--interval", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--match-day",
+        choices=("on", "off", "auto"),
+        default="on",
+        help="Forcer le mode jour de match (TTL courts, force_refresh).",
+    )
+    parser.add_argument(
+        "--url", help="Cibler un serveur existant au lieu du serveur in-process."
+    )
+    parser.add_argument("--json", type=Path, help="Écrire le résumé en JSON.")
+    opts = parser.parse_args()
+
+    for name in ("ffbb-mcp", "mcp", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    summary = asyncio.run(run_load(opts))
+    _print_summary(summary)
+    if opts.json:
+        opts.json.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())